@@ -0,0 +1,78 @@
+"""Benchmark: Verzeichnis-Scan sequentiell gegen parallele Tag-Reader.
+
+Erzeugt ein synthetisches Verzeichnis (kleine WAV-Dateien) und misst
+MetadataService.scan_directory mit MutagenMetadataReader, einmal lokal
+und einmal mit simulierter Latenz pro Datei (Netzlaufwerk).
+
+Ausfuehren: python benchmarks/bench_scan.py [--files 5000] [--latency-ms 2]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+from retro_amp.domain.models import AudioTrack, FileEntry
+from retro_amp.infrastructure.fs_walk import ScandirLister
+from retro_amp.infrastructure.metadata_reader import MutagenMetadataReader
+from retro_amp.services.metadata_service import MetadataService
+
+
+class _LatencyReader:
+    """Simuliert die Zugriffslatenz eines Netzlaufwerks pro Datei."""
+
+    def __init__(self, reader: MutagenMetadataReader, latency: float) -> None:
+        self._reader = reader
+        self._latency = latency
+
+    def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+        time.sleep(self._latency)
+        return self._reader.read(path, entry)
+
+
+def _populate(directory: Path, files: int) -> None:
+    frames = bytes(4 * 4410)
+    for i in range(files):
+        path = directory / f"track_{i:05d}.wav"
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(2)
+            wf.setsampwidth(2)
+            wf.setframerate(44100)
+            wf.writeframes(frames)
+
+
+def _measure(service: MetadataService, directory: Path) -> tuple[float, int]:
+    start = time.perf_counter()
+    tracks = service.scan_directory(directory)
+    return time.perf_counter() - start, len(tracks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        _populate(directory, args.files)
+        reader = MutagenMetadataReader()
+        print(f"{args.files} Dateien")
+        for label, target in (
+            ("lokal", reader),
+            (f"Latenz {args.latency_ms:g} ms", _LatencyReader(reader, args.latency_ms / 1000)),
+        ):
+            base = 0.0
+            for workers in (1, 4, 8, 16):
+                elapsed, count = _measure(MetadataService(target, ScandirLister(), workers=workers), directory)
+                base = base or elapsed
+                print(
+                    f"  {label:<16} workers={workers:<3} {elapsed:7.2f} s"
+                    f"   ({base / elapsed:4.1f}x, {count} Tracks)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Microbenchmark: stdlib-FFT (_fft) gegen den vorberechneten _FFTPlan.
+
+Ausfuehren: python benchmarks/bench_spectrum.py
+"""
+from __future__ import annotations
+
+import array
+import math
+import random
+import timeit
+
+from retro_amp.infrastructure.spectrum import FFT_SIZE, SpectrumAnalyzer, _FFTPlan, _fft
+
+
+def main() -> None:
+    rng = random.Random(42)
+    samples = array.array("h", (rng.randint(-20000, 20000) for _ in range(FFT_SIZE)))
+    hann = [
+        0.5 * (1.0 - math.cos(2.0 * math.pi * i / (FFT_SIZE - 1)))
+        for i in range(FFT_SIZE)
+    ]
+    hann_scaled = [h / 32768.0 for h in hann]
+    plan = _FFTPlan(FFT_SIZE)
+    half = FFT_SIZE // 2
+
+    def old_path() -> list[float]:
+        windowed = [complex(samples[i] * hann[i] / 32768.0, 0.0) for i in range(FFT_SIZE)]
+        spectrum = _fft(windowed)
+        return [abs(spectrum[k]) / half for k in range(half)]
+
+    def new_path() -> list[float]:
+        return plan.magnitudes(samples, hann_scaled)
+
+    analyzer = SpectrumAnalyzer(use_numpy=False)
+    analyzer._pcm = samples * 8
+    analyzer._ready = True
+
+    def bands() -> list[float]:
+        return analyzer.get_bands(0.05)
+
+    runs = 50
+    old = min(timeit.repeat(old_path, number=runs, repeat=5)) / runs
+    new = min(timeit.repeat(new_path, number=runs, repeat=5)) / runs
+    full = min(timeit.repeat(bands, number=runs, repeat=5)) / runs
+    print(f"FFT {FFT_SIZE} (reell)")
+    print(f"  _fft + Magnituden:     {old * 1000:7.2f} ms")
+    print(f"  _FFTPlan.magnitudes:   {new * 1000:7.2f} ms   ({old / new:.1f}x)")
+    print(f"  get_bands (stdlib):    {full * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,16 +40,28 @@ a = Analysis(
         # Infrastructure
         "retro_amp.infrastructure",
         "retro_amp.infrastructure.audio_player",
+        "retro_amp.infrastructure.disk_cache",
+        "retro_amp.infrastructure.fs_walk",
+        "retro_amp.infrastructure.level_meter",
+        "retro_amp.infrastructure.library_index",
         "retro_amp.infrastructure.metadata_reader",
+        "retro_amp.infrastructure.miniaudio_player",
+        "retro_amp.infrastructure.mp3_header",
+        "retro_amp.infrastructure.pcm_map",
         "retro_amp.infrastructure.playlist_store",
+        "retro_amp.infrastructure.render_cache",
         "retro_amp.infrastructure.settings",
+        "retro_amp.infrastructure.sid_header",
+        "retro_amp.infrastructure.songlengths",
         "retro_amp.infrastructure.spectrum",
+        "retro_amp.infrastructure.waveform",
         # Widgets
         "retro_amp.widgets",
         "retro_amp.widgets.file_table",
         "retro_amp.widgets.folder_browser",
         "retro_amp.widgets.transport_bar",
         "retro_amp.widgets.visualizer",
+        "retro_amp.widgets.level_meter",
         "retro_amp.widgets.lyrics_panel",
         "retro_amp.widgets.translation_panel",
         "retro_amp.widgets.info_panel",
@@ -15,15 +15,23 @@ from textual.widgets import (
 )
 
 from textual import work
+from textual.worker import get_current_worker
 
 from . import __version__
 from .domain.models import AudioTrack
 from .themes import RETRO_THEMES, RETRO_THEME_NAMES, THEME_DISPLAY_NAMES
 from .infrastructure.audio_player import PygameAudioPlayer
+from .infrastructure.disk_cache import DiskCache
+from .infrastructure.fs_walk import ScandirLister, walk
+from .infrastructure.library_index import CachingMetadataReader
 from .infrastructure.metadata_reader import MutagenMetadataReader
+from .infrastructure.miniaudio_player import MiniaudioAudioPlayer
 from .infrastructure.playlist_store import MarkdownPlaylistStore
+from .infrastructure.render_cache import RenderCache
 from .infrastructure.settings import JsonSettingsStore
+from .infrastructure.songlengths import SonglengthsIndex, find_songlengths
 from .infrastructure.spectrum import SpectrumAnalyzer
+from .infrastructure.waveform import Waveform, WaveformAnalyzer
 from .services.liner_notes_service import LinerNotesService
 from .services.lyrics_service import LyricsService
 from .services.metadata_service import MetadataService
@@ -39,11 +47,20 @@ from .widgets.search_panel import SearchPanel, _SearchResult
 from .widgets.translation_panel import TranslationPanel
 from .widgets.transport_bar import TransportBar
 from .widgets.visualizer import Visualizer
+from .widgets.level_meter import LevelMeter
 from .i18n import t
 from .screens.library_picker_screen import LibraryPickerScreen
 from .widgets.youtube_panel import YoutubePanel
 
 
+def _number_setting(settings: dict[str, object], key: str, default: float) -> float:
+    """Zahl aus den Settings; fehlende oder nicht-numerische Werte -> default."""
+    value = settings.get(key)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return default
+
+
 class RetroAmpApp(App):
     """retro-amp — Terminal-Musikplayer mit Retro-Charme."""
 
@@ -79,15 +96,48 @@ class RetroAmpApp(App):
             self.register_theme(retro_theme)
 
         # Infrastructure (Composition Root — hier wird verdrahtet)
-        self._audio_player = PygameAudioPlayer()
-        self._metadata_reader = MutagenMetadataReader()
         self._settings_store = JsonSettingsStore()
+        settings = self._settings_store.load()
+        self._render_cache = RenderCache(
+            DiskCache(
+                "render",
+                max_bytes=int(_number_setting(settings, "render_cache_mb", 256)) * 1024 * 1024,
+            ),
+            compress=bool(settings.get("render_cache_compress", True)),
+        )
+        self._songlengths = self._create_songlengths(
+            str(settings.get("hvsc_songlengths", "")),
+            start_path or str(settings.get("music_library", "")),
+        )
+        self._audio_player = self._create_audio_player(
+            str(settings.get("audio_backend", "pygame")), self._render_cache, self._songlengths,
+        )
+        self._metadata_reader = self._create_metadata_reader(
+            bool(settings.get("library_index", True)), self._songlengths,
+        )
         self._playlist_store = MarkdownPlaylistStore()
-        self._spectrum_analyzer = SpectrumAnalyzer()
+        self._spectrum_analyzer = SpectrumAnalyzer(
+            cache=DiskCache(
+                "spectrum",
+                max_bytes=int(_number_setting(settings, "spectrum_cache_mb", 64)) * 1024 * 1024,
+            ),
+            content_hash=bool(settings.get("spectrum_cache_content_hash", False)),
+            latency_budget_ms=_number_setting(settings, "spectrum_latency_budget_ms", 8.0),
+            render_cache=self._render_cache,
+            songlengths=self._songlengths,
+        )
+        self._waveform_analyzer = WaveformAnalyzer(
+            cache=DiskCache("waveform", max_bytes=4 * 1024 * 1024),
+            content_hash=bool(settings.get("spectrum_cache_content_hash", False)),
+        )
 
         # Services
         self._player_service = PlayerService(self._audio_player)
-        self._metadata_service = MetadataService(self._metadata_reader)
+        self._metadata_service = MetadataService(
+            self._metadata_reader,
+            ScandirLister(),
+            workers=int(_number_setting(settings, "scan_workers", 8)),
+        )
         self._playlist_service = PlaylistService(self._playlist_store)
         self._liner_notes_service = LinerNotesService()
         self._lyrics_service = LyricsService()
@@ -95,8 +145,13 @@ class RetroAmpApp(App):
         # Generations-Counter fuer Lyrics-Thread-Cancellation
         self._lyrics_generation: int = 0
 
-        # Settings laden
-        settings = self._settings_store.load()
+        # Datei, fuer die die Wellenform angezeigt/berechnet wird
+        self._waveform_path: Path | None = None
+
+        # Track (row_key), fuer den der Nachfolger bereits vorgeladen wird (Gapless)
+        self._preload_for: str | None = None
+
+        # Settings anwenden
         self._player_service.set_volume(float(settings.get("volume", 0.8)))
 
         # Gespeichertes Theme anwenden (Default: C64)
@@ -142,6 +197,44 @@ class RetroAmpApp(App):
 
         # Aktuelle Tracks im rechten Panel
         self._current_tracks: list[AudioTrack] = []
+        # Verzeichnis, dessen Scan gerade in die Tabelle laeuft
+        self._scan_path: Path | None = None
+
+    @staticmethod
+    def _create_audio_player(
+        backend: str,
+        render_cache: RenderCache,
+        songlengths: SonglengthsIndex | None,
+    ) -> PygameAudioPlayer | MiniaudioAudioPlayer:
+        """Waehlt das Playback-Backend laut Setting "audio_backend"."""
+        if backend == "miniaudio":
+            return MiniaudioAudioPlayer(render_cache=render_cache, songlengths=songlengths)
+        if backend != "pygame":
+            logger.warning("Unbekanntes audio_backend %r, verwende pygame", backend)
+        return PygameAudioPlayer(render_cache=render_cache, songlengths=songlengths)
+
+    @staticmethod
+    def _create_metadata_reader(
+        library_index: bool,
+        songlengths: SonglengthsIndex | None,
+    ) -> MutagenMetadataReader | CachingMetadataReader:
+        """Tag-Reader, bei Setting "library_index" hinter dem SQLite-Index."""
+        reader = MutagenMetadataReader(songlengths=songlengths)
+        if not library_index:
+            return reader
+        variant = f"songlengths={songlengths.database}" if songlengths is not None else ""
+        return CachingMetadataReader(reader, variant=variant)
+
+    @staticmethod
+    def _create_songlengths(database: str, library: str) -> SonglengthsIndex | None:
+        """HVSC-Songlengths laut Setting "hvsc_songlengths" oder aus der Bibliothek."""
+        path = Path(database).expanduser() if database else None
+        if path is None and library:
+            path = find_songlengths(Path(library).expanduser())
+        if path is None or not path.is_file():
+            return None
+        logger.info("HVSC-Songlengths: %s", path)
+        return SonglengthsIndex(path, cache=DiskCache("songlengths", max_bytes=16 * 1024 * 1024))
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -171,6 +264,7 @@ class RetroAmpApp(App):
         with Horizontal(id="transport-row"):
             yield Visualizer(id="visualizer")
             yield TransportBar(id="transport")
+            yield LevelMeter(id="level-meter")
         yield RichLog(id="app-log", highlight=True, markup=True)
         yield Footer()
 
@@ -179,6 +273,7 @@ class RetroAmpApp(App):
         self._position_timer = self.set_interval(0.5, self._tick_position)
         self._player_service.set_callbacks(
             on_finished=self._on_track_finished,
+            on_track_changed=self._on_track_changed,
         )
         # Theme-Name in Titelleiste
         display = THEME_DISPLAY_NAMES.get(self.theme, self.theme)
@@ -431,19 +526,20 @@ class RetroAmpApp(App):
             ".mp3", ".ogg", ".oga", ".opus", ".flac", ".wav",
             ".mod", ".xm", ".s3m", ".sid",
         }
-        try:
-            for p in sorted(root.rglob("*")):
-                if query_lower in p.name.lower():
-                    try:
-                        rel = p.relative_to(root)
-                    except ValueError:
-                        rel = p
-                    if p.is_dir():
-                        results.append((p, f"\U0001f4c1 {rel}"))
-                    elif p.suffix.lower() in audio_exts:
-                        results.append((p, f"\u266a {rel}"))
-        except PermissionError:
-            pass
+        # Typ kommt aus dem scandir-Listing, kein stat pro Treffer
+        matches = sorted(
+            (entry.path, entry.is_dir) for entry in walk(root)
+            if query_lower in entry.path.name.lower()
+        )
+        for p, is_dir in matches:
+            try:
+                rel = p.relative_to(root)
+            except ValueError:
+                rel = p
+            if is_dir:
+                results.append((p, f"\U0001f4c1 {rel}"))
+            elif p.suffix.lower() in audio_exts:
+                results.append((p, f"\u266a {rel}"))
         return results[:200]
 
     def _apply_search_results(
@@ -638,6 +734,7 @@ class RetroAmpApp(App):
                     if p.is_file()
                 ]
                 if tracks:
+                    self._scan_path = None
                     self._current_tracks = tracks
                     file_table = self.query_one("#file-table", FileTable)
                     file_table.update_tracks(tracks)
@@ -749,20 +846,61 @@ class RetroAmpApp(App):
 
     @work(exclusive=True, group="scan", thread=True)
     def _scan_directory(self, directory: Path) -> None:
-        """Scannt ein Verzeichnis im Background-Thread."""
-        tracks = self._metadata_service.scan_directory(directory)
+        """Scannt ein Verzeichnis im Background-Thread.
+
+        Erst erscheinen die Dateien (nur stat), dann werden Tags und Dauer
+        batchweise nachgereicht.
+        """
+        worker = get_current_worker()
+        entries = self._metadata_service.list_audio_files(directory)
+        tracks = [self._metadata_service.placeholder(entry) for entry in entries]
         self.call_from_thread(self._apply_scan_result, tracks, directory)
+        batches = self._metadata_service.iter_metadata(entries)
+        try:
+            for batch in batches:
+                if worker.is_cancelled:
+                    break
+                self.call_from_thread(self._apply_scan_batch, batch, directory)
+        finally:
+            batches.close()
+            if isinstance(self._metadata_reader, CachingMetadataReader):
+                self._metadata_reader.flush()
+        if not worker.is_cancelled:
+            self.call_from_thread(self._finish_scan, directory)
 
     def _apply_scan_result(self, tracks: list[AudioTrack], directory: Path) -> None:
-        """Wendet Scan-Ergebnis auf die UI an (im Main-Thread)."""
+        """Zeigt die Dateien eines Verzeichnisses sofort an (im Main-Thread)."""
+        self._scan_path = directory
         self._current_tracks = tracks
         file_table = self.query_one("#file-table", FileTable)
         file_table.set_path(directory)
         file_table.update_tracks(self._current_tracks)
-        self._write_log(t("log.directory", path=directory, count=len(tracks)))
+
+    def _apply_scan_batch(self, tracks: list[AudioTrack], directory: Path) -> None:
+        """Uebernimmt nachgelesene Metadaten in die Tabelle (im Main-Thread)."""
+        if directory != self._scan_path:
+            return
+        file_table = self.query_one("#file-table", FileTable)
+        file_table.update_metadata(tracks)
+        previous, self._current_tracks = self._current_tracks, list(file_table.tracks)
+        # Laeuft ein Track aus diesem Ordner, bekommt auch der Player die Tags
+        # (Dauer fuer Uhr und Lueckenmessung, Titel, Index nach Subtunes)
+        state = self._player_service.state
+        if state.track_list is previous and self._player_service.refresh_tracks(self._current_tracks):
+            if state.current_track is not None:
+                self.sub_title = state.current_track.display_name
+            self._update_transport()
+
+    def _finish_scan(self, directory: Path) -> None:
+        """Protokolliert den abgeschlossenen Scan (im Main-Thread)."""
+        if directory != self._scan_path:
+            return
+        self._write_log(t("log.directory", path=directory, count=len(self._current_tracks)))
 
     def _play_track(self, track: AudioTrack) -> None:
         """Spielt einen Track ab und aktualisiert UI."""
+        # Neu gestartet: Nachfolger erneut vorladen (auch bei gleichem Track)
+        self._preload_for = None
         # Tracklist laden falls noetig
         if track in self._current_tracks:
             idx = self._current_tracks.index(track)
@@ -788,7 +926,7 @@ class RetroAmpApp(App):
         """Markiert den aktuellen Track in der Tabelle und im Baum."""
         track = self._player_service.state.current_track
         file_table = self.query_one("#file-table", FileTable)
-        file_table.mark_playing(track.path if track else None)
+        file_table.mark_playing(track)
         if track:
             file_table.highlight_track(track)
             folder_browser = self.query_one("#folder-browser", FolderBrowser)
@@ -800,26 +938,86 @@ class RetroAmpApp(App):
         self._update_transport()
 
     def _sync_visualizer(self) -> None:
-        """Synchronisiert Visualizer mit Player-State."""
+        """Synchronisiert Visualizer und Pegelanzeige mit Player-State."""
         vis = self.query_one("#visualizer", Visualizer)
+        meter = self.query_one("#level-meter", LevelMeter)
         if self._player_service.state.is_playing:
             track = self._player_service.state.current_track
             if track:
-                self._load_spectrum(track.path)
+                waveform = self._sync_waveform(track.path)
+                self._load_spectrum(track.path, track.subtune, waveform)
+                self._sync_preload(track)
                 vis.set_spectrum_source(
-                    lambda: self._spectrum_analyzer.get_bands(
-                        self._player_service.state.position_seconds
+                    lambda bands: self._spectrum_analyzer.get_bands(
+                        self._player_service.clock_position(), bands
+                    )
+                )
+                meter.set_level_source(
+                    lambda: self._spectrum_analyzer.get_levels(
+                        self._player_service.clock_position()
                     )
                 )
             vis.start()
+            meter.start()
         else:
             vis.set_spectrum_source(None)
             vis.stop()
+            meter.set_level_source(None)
+            meter.stop()
 
     @work(exclusive=True, group="spectrum", thread=True)
-    def _load_spectrum(self, path: Path) -> None:
-        """Laedt Spektrum-Daten im Hintergrund-Thread."""
-        self._spectrum_analyzer.load(path)
+    def _load_spectrum(self, path: Path, subtune: int = 0, waveform: bool = False) -> None:
+        """Laedt Spektrum-Daten (und ggf. die Wellenform) im Hintergrund-Thread.
+
+        Die Wellenform entsteht im selben Dekodier-Durchlauf wie Timeline und
+        Pegel-Index. Eigens dekodiert wird nur, wenn es keinen Durchlauf gab
+        (Timeline aus dem Cache) oder er abgebrochen wurde.
+        """
+        collector = None
+        if waveform:
+            cached = self._waveform_analyzer.cached(path)
+            if cached is not None:
+                self.call_from_thread(self._apply_waveform, path, cached)
+            else:
+                collector = self._waveform_analyzer.collector(path)
+        self._spectrum_analyzer.load(
+            path, subtune=subtune, shared=self._audio_player.decoded_audio(), sink=collector,
+        )
+        if collector is None:
+            return
+        result = collector.result
+        if result is None:
+            result = self._waveform_analyzer.compute(
+                path, should_stop=lambda: path != self._waveform_path,
+            )
+        if result:
+            self.call_from_thread(self._apply_waveform, path, result)
+
+    def _sync_preload(self, track: AudioTrack) -> None:
+        """Startet das Vorladen des naechsten Tracks (einmal pro Track)."""
+        if track.row_key == self._preload_for:
+            return
+        self._preload_for = track.row_key
+        self._preload_next()
+
+    @work(exclusive=True, group="preload", thread=True)
+    def _preload_next(self) -> None:
+        """Dekodiert/oeffnet den naechsten Track im Hintergrund-Thread."""
+        self._player_service.preload_next()
+
+    def _sync_waveform(self, path: Path) -> bool:
+        """Merkt sich den Track der Wellenform. True wenn sie neu zu laden ist."""
+        if path == self._waveform_path:
+            return False
+        self._waveform_path = path
+        self.query_one("#transport", TransportBar).set_waveform(None)
+        return True
+
+    def _apply_waveform(self, path: Path, waveform: Waveform) -> None:
+        """Zeigt die Wellenform an, sofern der Track noch aktuell ist (Main-Thread)."""
+        if path != self._waveform_path:
+            return
+        self.query_one("#transport", TransportBar).set_waveform(waveform)
 
     def _update_transport(self) -> None:
         """Transport-Leiste mit aktuellem State aktualisieren."""
@@ -847,17 +1045,35 @@ class RetroAmpApp(App):
             self._lyrics_generation += 1
         else:
             self._highlight_current_track()
-            track = self._player_service.state.current_track
-            if track:
-                self.sub_title = track.display_name
-                if track.artist and track.title:
-                    next_name = f"{track.artist} \u2013 {track.title}"
-                else:
-                    next_name = track.display_name
-                self._write_log(t("log.play", name=next_name))
-                self._load_tabs_for_track(track)
+            self._announce_track()
+        self._update_transport()
+
+    def _on_track_changed(self) -> None:
+        """Callback nach einem lueckenlosen Wechsel auf den vorgeladenen Track."""
+        self._sync_visualizer()
+        self._highlight_current_track()
+        self._announce_track()
         self._update_transport()
 
+    def _announce_track(self) -> None:
+        """Titel, Log und Tabs fuer den neu gestarteten Track."""
+        state = self._player_service.state
+        gap = state.last_gap_seconds
+        if gap is not None:
+            if gap == 0.0:
+                self._write_log(t("log.gapless"))
+            else:
+                self._write_log(t("log.gap", ms=round(gap * 1000)))
+        track = state.current_track
+        if track:
+            self.sub_title = track.display_name
+            if track.artist and track.title:
+                next_name = f"{track.artist} \u2013 {track.title}"
+            else:
+                next_name = track.display_name
+            self._write_log(t("log.play", name=next_name))
+            self._load_tabs_for_track(track)
+
     def _save_last_path(self, path: Path) -> None:
         """Speichert den letzten Ordner in Settings."""
         settings = self._settings_store.load()
@@ -974,3 +1190,7 @@ class RetroAmpApp(App):
         self._lyrics_generation += 1  # Offene Lyrics-Threads ignorieren
         self._spectrum_analyzer.unload()
         self._audio_player.cleanup()
+        if self._songlengths is not None:
+            self._songlengths.save()
+        if isinstance(self._metadata_reader, CachingMetadataReader):
+            self._metadata_reader.close()
@@ -1,8 +1,8 @@
 """Domain-Models fuer retro-amp."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 
@@ -52,6 +52,31 @@ class AudioFormat(Enum):
         return {".mp3", ".ogg", ".oga", ".opus", ".flac", ".wav", ".mod", ".xm", ".s3m", ".sid"}
 
 
+@dataclass(frozen=True)
+class FileEntry:
+    """Verzeichniseintrag mit den beim Auflisten gelesenen Dateisystem-Daten.
+
+    Groesse und mtime sind nur bei Dateien gesetzt, die beim Auflisten
+    ge-stat-et wurden (sonst 0); Leser sparen sich damit ein eigenes stat.
+    """
+
+    path: Path
+    is_dir: bool = False
+    size: int = 0
+    mtime_ns: int = 0
+
+    @property
+    def has_stat(self) -> bool:
+        return self.mtime_ns > 0
+
+    @property
+    def modified_date(self) -> str:
+        """Aenderungsdatum als ISO-String (UTC), leer ohne stat."""
+        if not self.has_stat:
+            return ""
+        return datetime.fromtimestamp(self.mtime_ns / 1e9, tz=timezone.utc).isoformat()
+
+
 @dataclass
 class AudioTrack:
     """Metadaten eines Audio-Tracks."""
@@ -67,6 +92,11 @@ class AudioTrack:
     title: str = ""
     file_size_bytes: int = 0
     modified_date: str = ""
+    # SID-Subtunes: 0 = Standard-Song der Datei, sonst 1-basierte Nummer
+    subtune: int = 0
+    subtune_count: int = 1
+    # Laengen aller Subtunes in Sekunden (leer = unbekannt)
+    subtune_durations: tuple[float, ...] = ()
 
     def __post_init__(self) -> None:
         if not self.name:
@@ -74,12 +104,36 @@ class AudioTrack:
         if self.format == AudioFormat.UNKNOWN:
             self.format = AudioFormat.from_extension(self.path.suffix)
 
+    @property
+    def row_key(self) -> str:
+        """Eindeutiger Schluessel (Pfad, bei Subtunes mit Nummer)."""
+        if self.subtune:
+            return f"{self.path}#{self.subtune}"
+        return str(self.path)
+
     @property
     def display_name(self) -> str:
-        """Anzeigename: Titel aus Tags oder Dateiname."""
-        if self.title:
-            return self.title
-        return self.path.stem
+        """Anzeigename: Titel aus Tags oder Dateiname (Subtunes mit Nummer)."""
+        name = self.title or self.path.stem
+        if self.subtune:
+            return f"{name} ({self.subtune}/{self.subtune_count})"
+        return name
+
+    def subtunes(self) -> list[AudioTrack]:
+        """Ein virtueller Track pro Subtune (nur fuer Dateien mit mehreren Songs)."""
+        if self.subtune or self.subtune_count <= 1:
+            return [self]
+        return [
+            replace(
+                self,
+                subtune=number,
+                duration_seconds=(
+                    self.subtune_durations[number - 1]
+                    if number <= len(self.subtune_durations) else 0.0
+                ),
+            )
+            for number in range(1, self.subtune_count + 1)
+        ]
 
     @property
     def duration_display(self) -> str:
@@ -136,6 +190,8 @@ class PlayerState:
     volume: float = 0.8
     track_list: list[AudioTrack] = field(default_factory=list)
     current_index: int = -1
+    # Stille zwischen den letzten beiden Tracks (0.0 = lueckenlos, None = unbekannt)
+    last_gap_seconds: float | None = None
 
     @property
     def is_playing(self) -> bool:
@@ -157,6 +213,13 @@ class PlayerState:
     def has_previous(self) -> bool:
         return self.current_index > 0
 
+    @property
+    def upcoming_track(self) -> AudioTrack | None:
+        """Naechster Track der Liste (Kandidat fuer Gapless-Preload)."""
+        if self.current_index < 0 or not self.has_next:
+            return None
+        return self.track_list[self.current_index + 1]
+
     @property
     def progress(self) -> float:
         """Fortschritt als Wert zwischen 0.0 und 1.0."""
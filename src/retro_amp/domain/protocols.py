@@ -8,14 +8,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Callable, Protocol
 
-from .models import AudioTrack, Playlist
+from .models import AudioTrack, FileEntry, Playlist
 
 
 class AudioPlayer(Protocol):
     """Interface fuer Audio-Playback."""
 
-    def play(self, path: Path) -> None:
-        """Spielt eine Audio-Datei ab."""
+    def play(self, path: Path, subtune: int = 0) -> None:
+        """Spielt eine Audio-Datei ab (subtune: SID-Song, 0 = Standard)."""
         ...
 
     def pause(self) -> None:
@@ -46,12 +46,46 @@ class AudioPlayer(Protocol):
         """Prueft ob gerade abgespielt wird."""
         ...
 
+    def preload(self, path: Path, subtune: int = 0) -> None:
+        """Bereitet den naechsten Track fuer einen lueckenlosen Uebergang vor.
+
+        Blockierend (dekodiert ggf. vorab) — im Hintergrund-Thread aufrufen.
+        Endet der aktuelle Track, wechselt der Player ohne Pause selbst.
+        """
+        ...
+
+    def playing_path(self) -> Path | None:
+        """Datei, die der Player gerade wiedergibt (aendert sich beim Gapless-Wechsel)."""
+        ...
+
 
 class MetadataReader(Protocol):
     """Interface fuer Audio-Metadaten."""
 
-    def read(self, path: Path) -> AudioTrack:
-        """Liest Metadaten einer Audio-Datei."""
+    def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+        """Liest Metadaten einer Audio-Datei.
+
+        entry: Eintrag aus dem Verzeichnis-Listing; Groesse und mtime
+        werden daraus uebernommen statt die Datei erneut zu stat-en.
+        """
+        ...
+
+
+class DirectoryLister(Protocol):
+    """Interface fuer das Auflisten eines Verzeichnisses."""
+
+    def list_dir(
+        self,
+        directory: Path,
+        suffixes: set[str] | None = None,
+        stat_files: bool = True,
+    ) -> list[FileEntry]:
+        """Eintraege eines Verzeichnisses (unsortiert).
+
+        suffixes: Nur Dateien mit diesen Endungen, ohne Ordner (None = alles).
+        stat_files: Groesse und mtime fuer Dateien mitliefern.
+        Raises OSError, wenn das Verzeichnis nicht lesbar ist.
+        """
         ...
 
 
@@ -90,4 +124,5 @@ class SettingsStore(Protocol):
 # Callback-Typen fuer entkoppelte Kommunikation
 OnProgressCallback = Callable[[float], None]
 OnFinishedCallback = Callable[[], None]
+OnTrackChangedCallback = Callable[[], None]
 OnErrorCallback = Callable[[str], None]
@@ -1,24 +1,42 @@
 """Audio-Playback via pygame.mixer.
 
 OGG/Opus-Dateien werden per pyogg dekodiert und als WAV-Stream geladen,
-da pygame's SDL_mixer nur Vorbis (nicht Opus) unterstuetzt.
+da pygame's SDL_mixer nur Vorbis (nicht Opus) unterstuetzt. Der Stream
+dekodiert erst beim Lesen (konstanter Speicher, sofortiger Start).
 
 SID-Dateien (C64) werden per sidplayfp Subprocess zu WAV dekodiert,
-falls sidplayfp installiert ist.
+falls sidplayfp installiert ist. Die Ausgabe wird ueber eine Pipe
+mitgelesen; die Wiedergabe startet mit dem ersten Puffer.
+
+Fuer lueckenlose Uebergaenge wird der naechste Track vorab dekodiert und
+per pygame.mixer.music.queue eingereiht; SDL_mixer wechselt dann ohne
+Pause. Den Wechsel erkennt der Player daran, dass get_pos() neu beginnt.
 """
 from __future__ import annotations
 
+import bisect
 import ctypes
 import io
 import logging
+import math
 import shutil
 import struct
 import subprocess
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, NamedTuple, cast
 
 import pygame
 import pygame.mixer
 
+from .pcm_map import _parse_riff
+from .render_cache import RenderCache, RenderedPcm
+from .songlengths import SonglengthsIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
 logger = logging.getLogger(__name__)
 
 # Unterstuetzte Formate fuer pygame.mixer
@@ -39,36 +57,253 @@ def _is_opus(path: Path) -> bool:
         return False
 
 
-def _decode_opus_to_wav(path: Path) -> io.BytesIO:
-    """Dekodiert eine OGG/Opus-Datei zu einem WAV-Stream im Speicher."""
-    import pyogg
+# Opener fuer PCM ab einem Frame: liefert interleaved int16 (bytes/memoryview)
+PcmBytesOpener = Callable[[int], Iterator["Buffer"]]
+
+
+class DecodedAudio(NamedTuple):
+    """PCM, das der Player fuer den laufenden Track bereits dekodiert/rendert.
+
+    Weitere Leser (Spektrum-Analyse) lesen daraus mit, statt die Datei
+    ein zweites Mal zu dekodieren. chunks(start) liefert interleaved int16
+    ab Byte-Offset start, nicht zwingend an Frame-Grenzen ausgerichtet.
+    complete: fertiger Render aus dem Render-Cache (laufende Iteratoren
+    ueberstehen das Schliessen durch den Player), kein laufender Prozess.
+    """
+
+    path: Path
+    subtune: int
+    channels: int
+    sample_rate: int
+    chunks: Callable[[int], Iterator[Buffer]]
+    complete: bool = False
+
+
+def frame_aligned(chunks: Iterator[Buffer], frame_bytes: int) -> Iterator[Buffer]:
+    """Richtet Chunks an Frame-Grenzen aus (kopiert nur angebrochene Frames)."""
+    rest = b""
+    for chunk in chunks:
+        view = memoryview(chunk).cast("B")
+        if rest:
+            need = frame_bytes - len(rest)
+            if len(view) < need:
+                rest += bytes(view)
+                continue
+            yield rest + bytes(view[:need])
+            view = view[need:]
+        usable = len(view) - len(view) % frame_bytes
+        rest = bytes(view[usable:])
+        if usable:
+            yield view[:usable]
+
+
+_WAV_HEADER_SIZE = 44
+
+# Datengroesse, wenn die Laenge unbekannt ist (WAV-Maximum)
+_WAV_UNKNOWN_SIZE = 0xFFFFFFFF - 36
+
+# Bytes pro Lesevorgang aus einer Render-Pipe (~0.37 s Stereo bei 44.1 kHz)
+_PIPE_CHUNK = 65536
+
+# Maximale Wartezeit auf den ersten Puffer von sidplayfp
+_SID_START_TIMEOUT = 10.0
 
-    opus = pyogg.OpusFile(str(path))
-    pcm = ctypes.cast(
-        opus.buffer,
-        ctypes.POINTER(ctypes.c_char * opus.buffer_length),
-    ).contents.raw
+# Render-Parameter fuer sidplayfp (Teil des Render-Cache-Schluessels)
+SID_DURATION = 180
+_SID_SAMPLE_RATE = 44100
 
-    channels: int = opus.channels
-    sample_rate: int = opus.frequency
+
+def _wav_header(channels: int, sample_rate: int, data_size: int) -> bytes:
+    """44-Byte-Header fuer 16-bit PCM."""
     bits = 16
-    data_size = len(pcm)
-
-    wav = io.BytesIO()
-    wav.write(b"RIFF")
-    wav.write(struct.pack("<I", 36 + data_size))
-    wav.write(b"WAVE")
-    wav.write(b"fmt ")
-    wav.write(struct.pack(
-        "<IHHIIHH", 16, 1, channels, sample_rate,
-        sample_rate * channels * bits // 8,
-        channels * bits // 8, bits,
+    return b"".join((
+        b"RIFF",
+        struct.pack("<I", min(36 + data_size, 0xFFFFFFFF)),
+        b"WAVE",
+        b"fmt ",
+        struct.pack(
+            "<IHHIIHH", 16, 1, channels, sample_rate,
+            sample_rate * channels * bits // 8,
+            channels * bits // 8, bits,
+        ),
+        b"data",
+        struct.pack("<I", min(data_size, 0xFFFFFFFF)),
     ))
-    wav.write(b"data")
-    wav.write(struct.pack("<I", data_size))
-    wav.write(pcm)
-    wav.seek(0)
-    return wav
+
+
+class LazyWavStream(io.RawIOBase):
+    """Lesbarer, seekbarer WAV-Stream, dessen PCM erst beim read() entsteht.
+
+    Der Header wird vorab erzeugt; Samples liefert ein Opener, der ab einem
+    beliebigen Frame dekodiert. Gehalten wird nur der aktuelle Decoder-Chunk,
+    der Speicherbedarf ist daher unabhaengig von der Spieldauer. Reads und
+    Seeks innerhalb dieses Chunks sind memoryview-Slices (ohne Kopie und
+    ohne Decoder-Neustart).
+
+    Args:
+        channels: Kanalzahl
+        sample_rate: Sample-Rate in Hz
+        frames: Laenge in Frames (None = unbekannt)
+        open_pcm: Opener fuer interleaved int16-Bytes ab einem Frame
+        on_close: Wird beim Schliessen gerufen (z.B. Render-Prozess beenden)
+        decoded: Geteilter Zugriff auf das zugrunde liegende PCM (SID-Render)
+    """
+
+    def __init__(
+        self,
+        channels: int,
+        sample_rate: int,
+        frames: int | None,
+        open_pcm: PcmBytesOpener,
+        on_close: Callable[[], None] | None = None,
+        decoded: DecodedAudio | None = None,
+    ) -> None:
+        super().__init__()
+        self.decoded = decoded
+        self._on_close = on_close
+        self._block_align = channels * 2
+        data_size = frames * self._block_align if frames is not None else _WAV_UNKNOWN_SIZE
+        self._header = _wav_header(channels, sample_rate, data_size)
+        self._data_size = data_size
+        self._size = _WAV_HEADER_SIZE + data_size
+        self._open_pcm = open_pcm
+        self._pos = 0
+        # Decoder-Zustand: Iterator, aktueller Chunk und dessen Byte-Offset
+        # im PCM (-1 = Decoder nicht gestartet)
+        self._chunks: Iterator[Buffer] | None = None
+        self._chunk = memoryview(b"")
+        self._chunk_start = -1
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def readinto(self, buffer: Buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        written = 0
+        if self._pos < _WAV_HEADER_SIZE:
+            part = self._header[self._pos:self._pos + len(view)]
+            view[:len(part)] = part
+            written = len(part)
+            self._pos += written
+        while written < len(view):
+            data = self._read_pcm(self._pos - _WAV_HEADER_SIZE, len(view) - written)
+            if not data:
+                break
+            view[written:written + len(data)] = data
+            written += len(data)
+            self._pos += len(data)
+        return written
+
+    def _read_pcm(self, offset: int, size: int) -> memoryview | bytes:
+        """Bis zu size Bytes PCM ab offset (Decoder wird bei Bedarf versetzt)."""
+        if offset >= self._data_size:
+            # SDL_mixer prueft beim Laden das Dateiende — dafuer nicht dekodieren
+            return b""
+        start = offset - self._chunk_start
+        if self._chunk_start < 0 or not 0 <= start <= len(self._chunk):
+            self._reposition(offset)
+            start = offset - self._chunk_start
+        if start >= len(self._chunk) and self._chunk:
+            # Chunk aufgebraucht: der naechste schliesst direkt an
+            self._chunk_start += len(self._chunk)
+            start -= len(self._chunk)
+            self._chunk = self._next_chunk()
+        return self._chunk[start:start + size]
+
+    def _next_chunk(self) -> memoryview:
+        if self._chunks is None:
+            return memoryview(b"")
+        for chunk in self._chunks:
+            if chunk:
+                return memoryview(chunk).cast("B")
+        self._chunks = None
+        return memoryview(b"")
+
+    def _reposition(self, offset: int) -> None:
+        """Startet den Decoder am Frame von offset neu."""
+        self._close_chunks()
+        frame = offset // self._block_align
+        self._chunks = iter(self._open_pcm(frame))
+        self._chunk_start = frame * self._block_align
+        self._chunk = self._next_chunk()
+        # Rest innerhalb des Frames kann ueber Chunk-Grenzen reichen
+        while self._chunk and offset - self._chunk_start > len(self._chunk):
+            self._chunk_start += len(self._chunk)
+            self._chunk = self._next_chunk()
+
+    def _close_chunks(self) -> None:
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+        self._chunks = None
+
+    def close(self) -> None:
+        self._close_chunks()
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+        super().close()
+
+
+def _opus_pcm(path: Path) -> tuple[int, int | None, PcmBytesOpener]:
+    """Kanalzahl, Laenge (Frames) und Byte-Opener fuer eine Opus-Datei.
+
+    pyogg bietet kein Seeking: ist op_pcm_seek nicht verfuegbar, wird ab
+    Dateianfang dekodiert und bis zum Ziel-Frame verworfen.
+    """
+    import pyogg
+
+    probe = pyogg.OpusFileStream(str(path))
+    channels: int = probe.channels
+    total = int(getattr(probe, "pcm_size", -1))
+    probe.clean_up()
+    block_align = channels * 2
+
+    def _open(start_frame: int) -> Iterator[bytes]:
+        stream = pyogg.OpusFileStream(str(path))
+        skip = start_frame * block_align
+        seek = getattr(getattr(pyogg, "opus", None), "op_pcm_seek", None)
+        if skip and seek is not None and seek(stream.of, start_frame) == 0:
+            skip = 0
+        try:
+            while True:
+                result = stream.get_buffer()
+                if result is None:
+                    return
+                buf, length = result
+                data = ctypes.string_at(buf, length)
+                if skip >= len(data):
+                    skip -= len(data)
+                    continue
+                if skip:
+                    data = data[skip:]
+                    skip = 0
+                yield data
+        finally:
+            if hasattr(stream, "ptr"):
+                stream.clean_up()
+
+    return channels, total if total > 0 else None, _open
+
+
+def _open_opus_wav(path: Path) -> LazyWavStream:
+    """OGG/Opus als WAV-Stream, der erst beim Lesen dekodiert."""
+    channels, frames, opener = _opus_pcm(path)
+    return LazyWavStream(channels, 48000, frames, opener)
 
 
 def _find_sidplayfp() -> str | None:
@@ -76,47 +311,242 @@ def _find_sidplayfp() -> str | None:
     return shutil.which("sidplayfp") or shutil.which("sidplay2")
 
 
-def _decode_sid_to_wav(path: Path, duration: int = 180) -> io.BytesIO | None:
-    """Dekodiert eine SID-Datei zu einem WAV-Stream per sidplayfp.
+class PipeRender:
+    """Liest die WAV-Ausgabe eines Render-Prozesses (sidplayfp) progressiv mit.
+
+    Ein Reader-Thread sammelt stdout in unveraenderlichen Bloecken, sobald
+    Daten kommen. Leser blockieren nur, bis der angefragte Bereich gerendert
+    ist, und bekommen Sichten auf die Bloecke (ohne Kopie) — Wiedergabe und
+    Spektrum-Analyse lesen so denselben Render, waehrend der Prozess im
+    Hintergrund weiterrendert. close() beendet den Prozess.
+
+    Args:
+        cmd: Kommandozeile; der Prozess schreibt ein 16-bit-PCM-WAV nach stdout.
+        on_complete: Wird nach erfolgreichem Ende mit (PCM, Kanaele,
+            Sample-Rate) gerufen, nicht bei Abbruch (im Reader-Thread).
+    """
+
+    def __init__(
+        self,
+        cmd: list[str],
+        on_complete: Callable[[memoryview, int, int], None] | None = None,
+    ) -> None:
+        self.channels = 0
+        self.sample_rate = 0
+        self._on_complete = on_complete
+        self._closed = False
+        # stdout-Bloecke und ihre Start-Offsets (Bytes ab Dateianfang)
+        self._blocks: list[bytes] = []
+        self._starts: list[int] = []
+        self._size = 0
+        self._pcm_offset = -1
+        self._done = False
+        self._cond = threading.Condition()
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        self._thread = threading.Thread(target=self._pump, name="pipe-render", daemon=True)
+        self._thread.start()
+
+    def _pump(self) -> None:
+        """Reader-Thread: stdout bis EOF in den Puffer lesen."""
+        # Popen(stdout=PIPE) liefert einen BufferedReader (read1 statt read)
+        stdout = cast("io.BufferedReader | None", self._proc.stdout)
+        try:
+            while stdout is not None:
+                chunk = stdout.read1(_PIPE_CHUNK)
+                if not chunk:
+                    break
+                with self._cond:
+                    self._blocks.append(chunk)
+                    self._starts.append(self._size)
+                    self._size += len(chunk)
+                    if self._pcm_offset < 0:
+                        self._parse_header()
+                    self._cond.notify_all()
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+        if self._on_complete is not None and self._proc.wait() == 0:
+            with self._cond:
+                blocks, offset = self._blocks, self._pcm_offset
+                complete = not self._closed and 0 <= offset < self._size
+            if complete:
+                try:
+                    pcm = memoryview(b"".join(blocks))[offset:]
+                    self._on_complete(pcm, self.channels, self.sample_rate)
+                except Exception:
+                    logger.debug("Render-Callback fehlgeschlagen", exc_info=True)
+
+    def _parse_header(self) -> None:
+        """Sucht fmt- und data-Chunk im bisher gelesenen Anfang."""
+        info = _parse_riff(io.BytesIO(b"".join(self._blocks)), self._size)
+        if info is not None:
+            self._pcm_offset, _, self.sample_rate, self.channels, _ = info
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wartet auf Header und ersten PCM-Puffer. False bei Fehler/Timeout."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._done or (0 <= self._pcm_offset < self._size),
+                timeout=timeout,
+            )
+            return 0 <= self._pcm_offset < self._size
+
+    def chunks(self, start: int) -> Iterator[memoryview]:
+        """PCM ab Byte-Offset start als Block-Sichten; wartet auf noch nicht gerenderte Daten.
+
+        Die Sichten sind nicht an Frame-Grenzen ausgerichtet.
+        """
+        pos = start
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._done
+                    or 0 <= self._pcm_offset and self._pcm_offset + pos < self._size,
+                )
+                begin = self._pcm_offset + pos
+                if self._pcm_offset < 0 or begin >= self._size:
+                    return
+                index = bisect.bisect_right(self._starts, begin) - 1
+                data = memoryview(self._blocks[index])[begin - self._starts[index]:]
+            pos += len(data)
+            yield data
+
+    def close(self) -> None:
+        """Beendet den Prozess (Skip/Stop) und gibt den Puffer frei."""
+        if self._proc.poll() is None:
+            self._proc.kill()
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            logger.warning("Render-Prozess reagiert nicht: %s", self._proc.args)
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+        with self._cond:
+            self._closed = True
+            self._done = True
+            self._blocks = []
+            self._starts = []
+            self._size = 0
+            self._cond.notify_all()
+
+
+def sid_duration(
+    path: Path,
+    songlengths: SonglengthsIndex | None = None,
+    subtune: int = 0,
+) -> int:
+    """Render-Dauer einer SID-Datei bzw. eines Subtunes in Sekunden.
+
+    Mit HVSC-Songlengths die exakte Laenge (aufgerundet), sonst SID_DURATION.
+    """
+    if songlengths is not None:
+        length = songlengths.length_for(path, subtune)
+        if length:
+            return math.ceil(length)
+    return SID_DURATION
+
+
+def sid_render_key(path: Path, duration: int = SID_DURATION, subtune: int = 0) -> str | None:
+    """Render-Cache-Schluessel einer SID-Datei (Parameter wie beim Abspielen)."""
+    return RenderCache.key(
+        path,
+        renderer="sidplayfp",
+        duration=duration,
+        sample_rate=_SID_SAMPLE_RATE,
+        subtune=subtune,
+    )
+
+
+def _start_sid_render(
+    path: Path,
+    duration: int = SID_DURATION,
+    cache: RenderCache | None = None,
+    subtune: int = 0,
+) -> PipeRender | RenderedPcm | None:
+    """Liefert einen SID-Render: aus dem Cache oder per sidplayfp.
+
+    sidplayfp wird gestartet und es wird nur auf den ersten Puffer
+    gewartet; ein vollstaendiger Render landet anschliessend im Cache.
 
     Args:
         path: Pfad zur SID-Datei
         duration: Maximale Spieldauer in Sekunden (Default: 3 Minuten)
+        cache: Optionaler Render-Cache
+        subtune: Song-Nummer (1-basiert), 0 = Start-Song laut Header
 
     Returns:
-        WAV-Stream oder None wenn sidplayfp nicht verfuegbar
+        Render oder None wenn sidplayfp nicht verfuegbar ist/scheitert
     """
+    key = sid_render_key(path, duration, subtune) if cache is not None else None
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
     sid_bin = _find_sidplayfp()
     if not sid_bin:
         logger.warning("sidplayfp nicht gefunden — SID-Playback nicht verfuegbar")
         return None
 
+    on_complete = None
+    if cache is not None:
+        def on_complete(pcm: memoryview, channels: int, sample_rate: int) -> None:
+            cache.put(key, pcm, channels, sample_rate)
+
+    cmd = [
+        sid_bin,
+        "--wav=-",                  # WAV nach stdout
+        f"-t{duration}",            # Maximale Dauer
+        f"-f{_SID_SAMPLE_RATE}",    # Sample Rate
+    ]
+    if subtune:
+        cmd.append(f"-o{subtune}")  # Subtune
+    cmd.append(str(path))
     try:
-        result = subprocess.run(
-            [
-                sid_bin,
-                "--wav=-",       # WAV nach stdout
-                f"-t{duration}",  # Maximale Dauer
-                "-f44100",        # Sample Rate
-                str(path),
-            ],
-            capture_output=True,
-            timeout=duration + 10,
-        )
-        if result.returncode != 0 or len(result.stdout) < 44:
-            logger.warning("sidplayfp Fehler fuer %s: %s", path, result.stderr[:200])
-            return None
-        wav = io.BytesIO(result.stdout)
-        return wav
-    except FileNotFoundError:
-        logger.warning("sidplayfp nicht gefunden")
+        render = PipeRender(cmd, on_complete=on_complete)
+    except OSError:
+        logger.warning("sidplayfp konnte nicht gestartet werden")
         return None
-    except subprocess.TimeoutExpired:
-        logger.warning("sidplayfp Timeout fuer %s", path)
+    if not render.wait_ready(_SID_START_TIMEOUT):
+        logger.warning("sidplayfp lieferte keine Daten fuer %s", path)
+        render.close()
         return None
-    except Exception:
-        logger.exception("SID-Dekodierung fehlgeschlagen fuer %s", path)
+    return render
+
+
+def _open_sid_wav(
+    path: Path,
+    duration: int = SID_DURATION,
+    cache: RenderCache | None = None,
+    subtune: int = 0,
+) -> LazyWavStream | None:
+    """SID als WAV-Stream, der waehrend der Wiedergabe weiterrendert."""
+    render = _start_sid_render(path, duration, cache, subtune)
+    if render is None:
         return None
+    block_align = render.channels * 2
+    frames = render.frames if isinstance(render, RenderedPcm) else duration * render.sample_rate
+    return LazyWavStream(
+        render.channels,
+        render.sample_rate,
+        frames,
+        lambda frame: render.chunks(frame * block_align),
+        on_close=render.close,
+        decoded=DecodedAudio(
+            path, subtune, render.channels, render.sample_rate, render.chunks,
+            complete=isinstance(render, RenderedPcm),
+        ),
+    )
+
+
+def _as_file(source: io.IOBase | str) -> IO[bytes] | str:
+    """Quelle fuer pygame.mixer.music.load/queue (Dateiname oder Binaer-Stream)."""
+    return source if isinstance(source, str) else cast("IO[bytes]", source)
 
 
 class PygameAudioPlayer:
@@ -125,16 +555,35 @@ class PygameAudioPlayer:
     Implementiert das AudioPlayer-Protocol aus domain/protocols.py.
     OGG/Opus-Dateien werden automatisch per pyogg dekodiert.
     SID-Dateien werden per sidplayfp Subprocess dekodiert (falls installiert).
+
+    Args:
+        frequency: Sample-Rate des Mixers.
+        buffer_size: Puffergroesse des Mixers in Samples.
+        render_cache: Optionaler Cache fuer fertige SID-Renders.
+        songlengths: Optionale HVSC-Songlengths fuer exakte SID-Dauern.
     """
 
-    def __init__(self, frequency: int = 44100, buffer_size: int = 8192) -> None:
+    def __init__(
+        self,
+        frequency: int = 44100,
+        buffer_size: int = 8192,
+        render_cache: RenderCache | None = None,
+        songlengths: SonglengthsIndex | None = None,
+    ) -> None:
         self._initialized = False
+        self._render_cache = render_cache
+        self._songlengths = songlengths
         self._frequency = frequency
         self._buffer_size = buffer_size
         self._current_path: Path | None = None
         self._seek_offset: float = 0.0
-        self._opus_wav: io.BytesIO | None = None
-        self._sid_wav: io.BytesIO | None = None
+        self._opus_wav: io.IOBase | None = None
+        self._sid_wav: io.IOBase | None = None
+        # Eingereihter naechster Track (Gapless) und zuletzt gesehenes get_pos()
+        self._lock = threading.Lock()
+        self._queued_path: Path | None = None
+        self._queued_source: io.IOBase | str | None = None
+        self._last_pos_ms = 0
         self._init_mixer()
 
     def _init_mixer(self) -> None:
@@ -152,35 +601,118 @@ class PygameAudioPlayer:
             logger.exception("pygame.mixer konnte nicht initialisiert werden")
             self._initialized = False
 
-    def play(self, path: Path) -> None:
-        """Spielt eine Audio-Datei ab."""
+    def play(self, path: Path, subtune: int = 0) -> None:
+        """Spielt eine Audio-Datei ab (bei SID optional einen Subtune)."""
         if not self._initialized:
             self._init_mixer()
         if not self._initialized:
             return
 
         try:
-            self._opus_wav = None
-            self._sid_wav = None
-            ext = path.suffix.lower()
-
-            if ext == ".sid":
-                self._sid_wav = _decode_sid_to_wav(path)
-                if self._sid_wav is None:
-                    logger.warning("SID-Playback nicht moeglich: %s", path)
-                    return
-                pygame.mixer.music.load(self._sid_wav)
-            elif ext in _OGG_EXTENSIONS and _is_opus(path):
-                self._opus_wav = _decode_opus_to_wav(path)
-                pygame.mixer.music.load(self._opus_wav)
-            else:
-                pygame.mixer.music.load(str(path))
-            pygame.mixer.music.play()
-            self._current_path = path
-            self._seek_offset = 0.0
+            source = self._load_source(path, subtune)
+            if source is None:
+                return
+            with self._lock:
+                # load() verwirft die Queue (SDL_mixer schliesst deren Stream)
+                self._queued_path = None
+                self._queued_source = None
+                self._opus_wav = None
+                self._sid_wav = None
+                if isinstance(source, io.IOBase):
+                    self._keep_decoded(path, source)
+                pygame.mixer.music.load(_as_file(source))
+                pygame.mixer.music.play()
+                self._current_path = path
+                self._seek_offset = 0.0
+                self._last_pos_ms = 0
         except Exception:
             logger.exception("Fehler beim Abspielen von %s", path)
 
+    def _load_source(self, path: Path, subtune: int = 0) -> io.IOBase | str | None:
+        """Dateiname fuer SDL_mixer oder WAV-Stream (SID/Opus entstehen beim Lesen)."""
+        ext = path.suffix.lower()
+        if ext == ".sid":
+            wav = _open_sid_wav(
+                path,
+                sid_duration(path, self._songlengths, subtune),
+                cache=self._render_cache,
+                subtune=subtune,
+            )
+            if wav is None:
+                logger.warning("SID-Playback nicht moeglich: %s", path)
+            return wav
+        if ext in _OGG_EXTENSIONS and _is_opus(path):
+            return _open_opus_wav(path)
+        return str(path)
+
+    def _keep_decoded(self, path: Path, wav: io.IOBase) -> None:
+        """Haelt dekodierte Streams am Leben, solange SDL_mixer daraus liest."""
+        if path.suffix.lower() == ".sid":
+            self._sid_wav = wav
+        else:
+            self._opus_wav = wav
+
+    @staticmethod
+    def _discard(source: io.IOBase | str) -> None:
+        """Schliesst einen nicht eingereihten Stream (beendet z.B. sidplayfp)."""
+        if isinstance(source, io.IOBase):
+            source.close()
+
+    def preload(self, path: Path, subtune: int = 0) -> None:
+        """Dekodiert den naechsten Track vorab und reiht ihn ein (Gapless)."""
+        if not self._initialized:
+            return
+        playing = self._current_path
+        try:
+            source = self._load_source(path, subtune)
+        except Exception:
+            logger.debug("Preload fehlgeschlagen: %s", path, exc_info=True)
+            return
+        if source is None:
+            return
+        with self._lock:
+            # Inzwischen anderer Track gestartet: Queue waere veraltet
+            if self._current_path != playing or playing is None:
+                self._discard(source)
+                return
+            if isinstance(source, io.IOBase):
+                source.seek(0)
+            try:
+                pygame.mixer.music.queue(_as_file(source))
+            except Exception:
+                logger.debug("Queue nicht moeglich: %s", path, exc_info=True)
+                self._discard(source)
+                return
+            self._queued_path = path
+            self._queued_source = source
+
+    def _check_handover(self, pos_ms: int) -> None:
+        """Erkennt den Start des eingereihten Tracks (get_pos() beginnt neu)."""
+        with self._lock:
+            if self._queued_path is not None and 0 <= pos_ms < self._last_pos_ms:
+                source = self._queued_source
+                self._current_path = self._queued_path
+                self._queued_path = None
+                self._queued_source = None
+                self._seek_offset = 0.0
+                self._opus_wav = None
+                self._sid_wav = None
+                if isinstance(source, io.IOBase):
+                    self._keep_decoded(self._current_path, source)
+            if pos_ms >= 0:
+                self._last_pos_ms = pos_ms
+
+    def playing_path(self) -> Path | None:
+        """Datei, die gerade wiedergegeben wird."""
+        if self._initialized:
+            self._check_handover(pygame.mixer.music.get_pos())
+        return self._current_path
+
+    def decoded_audio(self) -> DecodedAudio | None:
+        """Geteiltes PCM des laufenden Tracks (SID-Render), sonst None."""
+        wav = self._sid_wav
+        return wav.decoded if isinstance(wav, LazyWavStream) else None
+
     def pause(self) -> None:
         """Pausiert die Wiedergabe."""
         if self._initialized:
@@ -195,7 +727,14 @@ class PygameAudioPlayer:
         """Stoppt die Wiedergabe."""
         if self._initialized:
             pygame.mixer.music.stop()
-            self._current_path = None
+            # Entladen schliesst die Streams — laufende SID-Renders enden sofort
+            pygame.mixer.music.unload()
+            with self._lock:
+                self._current_path = None
+                self._queued_path = None
+                self._queued_source = None
+                self._opus_wav = None
+                self._sid_wav = None
 
     def set_volume(self, volume: float) -> None:
         """Setzt die Lautstaerke (0.0 bis 1.0)."""
@@ -207,6 +746,7 @@ class PygameAudioPlayer:
         if not self._initialized:
             return 0.0
         pos_ms = pygame.mixer.music.get_pos()
+        self._check_handover(pos_ms)
         if pos_ms < 0:
             return 0.0
         return self._seek_offset + pos_ms / 1000.0
@@ -217,8 +757,11 @@ class PygameAudioPlayer:
             return
         try:
             pos = max(0.0, position_seconds)
-            pygame.mixer.music.set_pos(pos)
-            self._seek_offset = pos
+            with self._lock:
+                elapsed_ms = pygame.mixer.music.get_pos()
+                pygame.mixer.music.set_pos(pos)
+                # get_pos() zaehlt ab play() weiter und ignoriert set_pos()
+                self._seek_offset = pos - max(0, elapsed_ms) / 1000.0
         except Exception:
             logger.debug("Seek nicht unterstuetzt fuer dieses Format")
 
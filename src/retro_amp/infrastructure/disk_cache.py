@@ -0,0 +1,141 @@
+"""Groessenbegrenzter Datei-Cache in ~/.retro-amp/cache/.
+
+Jeder Eintrag ist eine Datei, deren Name aus einem Schluessel abgeleitet wird.
+Die mtime eines Eintrags dient als LRU-Zeitstempel: Treffer setzen sie neu,
+beim Schreiben werden die am laengsten ungenutzten Eintraege verdraengt.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_CACHE_DIR = Path.home() / ".retro-amp" / "cache"
+
+# Blockgroesse fuer Content-Hashes
+_HASH_CHUNK = 1024 * 1024
+
+
+def file_key(path: Path, extra: str = "", content_hash: bool = False) -> str | None:
+    """Bildet einen Cache-Schluessel fuer eine Datei.
+
+    Args:
+        path: Quelldatei
+        extra: Zusaetzliche Parameter (Format-Version, Render-Optionen, ...)
+        content_hash: True = SHA-1 ueber den Dateiinhalt (ueberlebt
+            Umbenennen/Verschieben), False = Pfad + Groesse + mtime (schnell)
+
+    Returns:
+        Hex-Schluessel oder None wenn die Datei nicht lesbar ist.
+    """
+    try:
+        if content_hash:
+            digest = hashlib.sha1()
+            with open(path, "rb") as f:
+                while chunk := f.read(_HASH_CHUNK):
+                    digest.update(chunk)
+        else:
+            stat = path.stat()
+            digest = hashlib.sha1(
+                f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8"),
+            )
+        digest.update(extra.encode("utf-8"))
+        return digest.hexdigest()
+    except OSError:
+        return None
+
+
+class DiskCache:
+    """Schluessel/Wert-Cache mit Groessenlimit und LRU-Verdraengung.
+
+    Fail-safe: Lese- und Schreibfehler werden geloggt und als Cache-Miss
+    behandelt, nie als Exception weitergereicht.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self._dir = (cache_dir or _CACHE_DIR) / name
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    def _entry(self, key: str) -> Path:
+        return self._dir / f"{key}.bin"
+
+    def get(self, key: str) -> bytes | None:
+        """Liest einen Eintrag und markiert ihn als zuletzt benutzt."""
+        entry = self._entry(key)
+        try:
+            data = entry.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Schreibt einen Eintrag atomar und haelt das Groessenlimit ein."""
+        if len(data) > self._max_bytes:
+            return
+        entry = self._entry(key)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, entry)
+        except OSError:
+            logger.debug("Cache-Eintrag konnte nicht geschrieben werden: %s", entry)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Loescht die am laengsten ungenutzten Eintraege bis zum Limit."""
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        try:
+            with os.scandir(self._dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith(".bin"):
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, Path(dir_entry.path)))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        if total <= self._max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= self._max_bytes:
+                break
+
+    def clear(self) -> None:
+        """Entfernt alle Eintraege."""
+        try:
+            for entry in self._dir.glob("*.bin"):
+                entry.unlink()
+        except OSError:
+            logger.debug("Cache konnte nicht geleert werden: %s", self._dir)
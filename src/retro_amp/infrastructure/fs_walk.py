@@ -0,0 +1,104 @@
+"""Verzeichnisse per os.scandir auflisten und durchlaufen.
+
+os.scandir liefert den Eintragstyp (Datei/Ordner) aus dem Verzeichnis-
+Listing selbst, ohne stat pro Eintrag; unter Windows sind auch Groesse
+und mtime schon enthalten. Die Funktionen geben diese Daten als
+FileEntry weiter, damit Aufrufer (Scan, Tag-Reader, Ordnerbaum, Suche)
+nicht jede Datei einzeln erneut abfragen — auf SMB/NFS ist jeder
+stat-Aufruf ein Netzwerk-Roundtrip.
+"""
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from ..domain.models import FileEntry
+
+
+def _entry(dir_entry: os.DirEntry[str], stat_files: bool) -> FileEntry | None:
+    """FileEntry aus einem DirEntry. None fuer Sonstiges (Sockets, tote Links)."""
+    try:
+        if dir_entry.is_dir():
+            return FileEntry(Path(dir_entry.path), is_dir=True)
+        if not dir_entry.is_file():
+            return None
+        if not stat_files:
+            return FileEntry(Path(dir_entry.path))
+        stat = dir_entry.stat()
+    except OSError:
+        return None
+    return FileEntry(Path(dir_entry.path), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def list_dir(
+    directory: Path,
+    suffixes: set[str] | None = None,
+    stat_files: bool = True,
+) -> list[FileEntry]:
+    """Eintraege eines Verzeichnisses (unsortiert).
+
+    Args:
+        directory: Zu listendes Verzeichnis.
+        suffixes: Nur Dateien mit diesen Endungen (kleingeschrieben);
+            Ordner werden dann weggelassen. None = alles.
+        stat_files: Groesse und mtime fuer Dateien lesen (ein stat pro
+            Datei unter POSIX, unter Windows ohne Zusatzkosten).
+
+    Raises:
+        OSError: Wenn das Verzeichnis nicht lesbar ist.
+    """
+    entries: list[FileEntry] = []
+    with os.scandir(directory) as it:
+        for dir_entry in it:
+            if suffixes is not None and os.path.splitext(dir_entry.name)[1].lower() not in suffixes:
+                continue
+            entry = _entry(dir_entry, stat_files)
+            if entry is None or (suffixes is not None and entry.is_dir):
+                continue
+            entries.append(entry)
+    return entries
+
+
+class ScandirLister:
+    """Verzeichnis-Listing per os.scandir. Implementiert DirectoryLister Protocol."""
+
+    def list_dir(
+        self,
+        directory: Path,
+        suffixes: set[str] | None = None,
+        stat_files: bool = True,
+    ) -> list[FileEntry]:
+        """Eintraege eines Verzeichnisses, siehe list_dir()."""
+        return list_dir(directory, suffixes, stat_files)
+
+
+def walk(
+    root: Path,
+    should_stop: Callable[[], bool] | None = None,
+) -> Iterator[FileEntry]:
+    """Alle Eintraege unterhalb von root (rekursiv, ohne stat pro Datei).
+
+    Symlinks auf Ordner werden nicht verfolgt (keine Zyklen). Nicht
+    lesbare Unterordner werden uebersprungen.
+
+    Args:
+        root: Startordner (selbst nicht enthalten).
+        should_stop: Abbruch-Abfrage, wird pro Ordner geprueft.
+    """
+    pending = [root]
+    while pending:
+        if should_stop is not None and should_stop():
+            return
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    entry = _entry(dir_entry, stat_files=False)
+                    if entry is None:
+                        continue
+                    if entry.is_dir and not dir_entry.is_symlink():
+                        pending.append(entry.path)
+                    yield entry
+        except OSError:
+            continue
@@ -0,0 +1,213 @@
+"""Pegel-Index fuer VU-/Peak-Anzeige — RMS und Spitze in O(1) pro Abfrage.
+
+Beim Laden wird das PCM einmal in Bloecke zu LEVEL_BLOCK Frames zerlegt.
+Pro Kanal entstehen daraus:
+
+- eine Prefix-Summe der Quadratsummen (RMS eines Bereichs = Differenz
+  zweier Eintraege),
+- eine Sparse-Table der Block-Maxima (Spitze eines Bereichs = Maximum
+  zweier ueberlappender Zweierpotenz-Intervalle).
+
+Damit kostet eine Abfrage unabhaengig von der Fensterlaenge nur wenige
+Lookups und kann vom UI mit hoher Bildrate gepollt werden.
+"""
+from __future__ import annotations
+
+import array
+import math
+import operator
+import struct
+from itertools import accumulate
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:  # optional — stdlib-Fallback
+    np = None  # type: ignore[assignment]
+    _HAS_NUMPY = False
+
+# Frames pro Block (~23 ms bei 44.1 kHz) = zeitliche Aufloesung der Abfragen
+LEVEL_BLOCK = 1024
+
+# Sparse-Table-Stufen: 2^7 Bloecke (~3 s) werden mit zwei Lookups abgedeckt,
+# laengere Fenster mit entsprechend mehr (begrenzt den Speicherbedarf)
+_MAX_LEVEL = 7
+
+# Bloecke pro NumPy-Batch (begrenzt temporaeren Speicher)
+_BATCH_BLOCKS = 256
+
+# Serialisierung: Sample-Rate, Kanaele, Bloecke, Frames
+_HEADER = struct.Struct("<IHIQ")
+
+_FULL_SCALE = 32768.0
+
+
+class ChannelLevels(NamedTuple):
+    """Pegel eines Kanals, linear relativ zur Vollaussteuerung (0.0–1.0)."""
+
+    rms: float
+    peak: float
+
+
+class LevelIndex:
+    """Unveraenderlicher Pegel-Index eines Tracks (bis zu zwei Kanaele)."""
+
+    def __init__(
+        self,
+        sample_rate: int,
+        total_frames: int,
+        prefix: list[array.array[float]],
+        peaks: list[array.array[int]],
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.total_frames = total_frames
+        self.channels = len(prefix)
+        self._blocks = len(peaks[0]) if peaks else 0
+        self._prefix = prefix
+        self._tables = [self._sparse_table(p) for p in peaks]
+
+    @staticmethod
+    def _sparse_table(peaks: array.array[int]) -> list[array.array[int]]:
+        """Stufe j enthaelt das Maximum von 2^j Bloecken ab Index i."""
+        tables = [peaks]
+        width = 1
+        while width * 2 <= len(peaks) and len(tables) <= _MAX_LEVEL:
+            prev = tables[-1]
+            tables.append(array.array("H", map(max, prev[:len(prev) - width], prev[width:])))
+            width *= 2
+        return tables
+
+    def levels(self, start_frame: int, end_frame: int) -> list[ChannelLevels]:
+        """RMS und Spitze je Kanal fuer [start_frame, end_frame).
+
+        Gerundet auf ganze Bloecke; ausserhalb des Tracks gilt Stille.
+        """
+        first = max(0, start_frame // LEVEL_BLOCK)
+        last = min(self._blocks, -(-end_frame // LEVEL_BLOCK))
+        if last <= first:
+            return [ChannelLevels(0.0, 0.0)] * self.channels
+
+        span = last - first
+        count = span * LEVEL_BLOCK
+        result: list[ChannelLevels] = []
+        for prefix, tables in zip(self._prefix, self._tables):
+            energy = prefix[last] - prefix[first]
+            rms = math.sqrt(max(0.0, energy) / count) / _FULL_SCALE
+
+            k = min(span.bit_length() - 1, len(tables) - 1)
+            width = 1 << k
+            table = tables[k]
+            peak = table[last - width]
+            if span > 2 * width:
+                # Fenster laenger als zwei Stufen-Intervalle: in Schritten abdecken
+                peak = max(peak, max(table[first:last - width:width]))
+            else:
+                peak = max(peak, table[first])
+            result.append(ChannelLevels(min(1.0, rms), min(1.0, peak / _FULL_SCALE)))
+        return result
+
+    def to_bytes(self) -> bytes:
+        """Serialisiert Prefix-Summen und Block-Maxima (Sparse-Table wird neu gebaut)."""
+        parts = [_HEADER.pack(self.sample_rate, self.channels, self._blocks, self.total_frames)]
+        for prefix, tables in zip(self._prefix, self._tables):
+            parts.append(prefix.tobytes())
+            parts.append(tables[0].tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> LevelIndex | None:
+        """Gegenstueck zu to_bytes. None bei unpassenden Daten."""
+        if len(data) < _HEADER.size:
+            return None
+        sample_rate, channels, blocks, total_frames = _HEADER.unpack_from(data)
+        prefix_bytes = (blocks + 1) * 8
+        peak_bytes = blocks * 2
+        if channels == 0 or len(data) != _HEADER.size + channels * (prefix_bytes + peak_bytes):
+            return None
+
+        prefix: list[array.array[float]] = []
+        peaks: list[array.array[int]] = []
+        offset = _HEADER.size
+        for _ in range(channels):
+            p = array.array("d")
+            p.frombytes(data[offset:offset + prefix_bytes])
+            offset += prefix_bytes
+            m = array.array("H")
+            m.frombytes(data[offset:offset + peak_bytes])
+            offset += peak_bytes
+            prefix.append(p)
+            peaks.append(m)
+        return cls(sample_rate, total_frames, prefix, peaks)
+
+
+class LevelIndexBuilder:
+    """Baut einen LevelIndex inkrementell aus interleaved int16-PCM.
+
+    Haelt nur einen unvollstaendigen Block zurueck und eignet sich daher
+    sowohl fuer komplett dekodierte Puffer als auch fuer Streaming-Chunks.
+    Bei mehr als zwei Kanaelen werden die ersten beiden ausgewertet.
+    """
+
+    def __init__(self, sample_rate: int, channels: int) -> None:
+        self._sample_rate = sample_rate
+        self._stride = max(1, channels)
+        self._channels = min(self._stride, 2)
+        self._block_len = LEVEL_BLOCK * self._stride
+        self._pending = array.array("h")
+        self._samples = 0
+        self._sums: list[array.array[float]] = [array.array("d") for _ in range(self._channels)]
+        self._peaks: list[array.array[int]] = [array.array("H") for _ in range(self._channels)]
+
+    def feed(self, samples: memoryview | array.array[int]) -> None:
+        """Verarbeitet interleaved Samples (memoryview 'h' oder array('h'))."""
+        self._samples += len(samples)
+        if self._pending:
+            need = self._block_len - len(self._pending)
+            self._pending.extend(samples[:need])
+            samples = samples[need:]
+            if len(self._pending) < self._block_len:
+                return
+            self._blocks(self._pending)
+            self._pending = array.array("h")
+
+        full = len(samples) - len(samples) % self._block_len
+        if full:
+            self._blocks(samples[:full])
+        self._pending.extend(samples[full:])
+
+    def finish(self) -> LevelIndex:
+        """Schliesst ab (letzter Block mit Stille aufgefuellt)."""
+        if self._pending:
+            self._pending.extend([0] * (self._block_len - len(self._pending)))
+            self._blocks(self._pending)
+            self._pending = array.array("h")
+        prefix = [array.array("d", accumulate(sums, initial=0.0)) for sums in self._sums]
+        return LevelIndex(self._sample_rate, self._samples // self._stride, prefix, self._peaks)
+
+    def _blocks(self, samples: Buffer) -> None:
+        """Quadratsummen und Maxima fuer ganze Bloecke."""
+        if _HAS_NUMPY:
+            self._blocks_numpy(samples)
+            return
+        stride = self._stride
+        block_len = self._block_len
+        for start in range(0, len(samples), block_len):  # type: ignore[arg-type]
+            block = samples[start:start + block_len]  # type: ignore[index]
+            for ch in range(self._channels):
+                seg = block[ch::stride]
+                self._sums[ch].append(float(sum(map(operator.mul, seg, seg))))
+                self._peaks[ch].append(max(max(seg), -min(seg)))
+
+    def _blocks_numpy(self, samples: Buffer) -> None:
+        data = np.frombuffer(samples, dtype=np.int16).reshape(-1, LEVEL_BLOCK, self._stride)
+        for first in range(0, len(data), _BATCH_BLOCKS):
+            batch = data[first:first + _BATCH_BLOCKS, :, :self._channels].astype(np.int32)
+            sums = np.einsum("bfc,bfc->bc", batch, batch, dtype=np.float64)
+            peaks = np.abs(batch).max(axis=1).astype(np.uint16)
+            for ch in range(self._channels):
+                self._sums[ch].frombytes(np.ascontiguousarray(sums[:, ch]).tobytes())
+                self._peaks[ch].frombytes(np.ascontiguousarray(peaks[:, ch]).tobytes())
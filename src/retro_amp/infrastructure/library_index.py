@@ -0,0 +1,200 @@
+"""Persistenter Track-Index (SQLite) in ~/.retro-amp/library.db.
+
+CachingMetadataReader legt sich als Decorator um einen MetadataReader:
+Treffer werden ueber Pfad + Groesse + mtime validiert und ohne Tag-Lesen
+aus der Datenbank geliefert, nur neue oder geaenderte Dateien gehen an
+den eigentlichen Reader. Gespeichert werden alle Felder von AudioTrack.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import fields
+from pathlib import Path
+
+from ..domain.models import AudioFormat, AudioTrack, FileEntry
+from ..domain.protocols import MetadataReader
+
+logger = logging.getLogger(__name__)
+
+_DATABASE = Path.home() / ".retro-amp" / "library.db"
+
+# Bei Aenderungen an AudioTrack oder am Reader erhoehen (alte Eintraege verfallen)
+_SCHEMA_VERSION = 1
+
+# Neue Eintraege werden gesammelt committet (ein fsync pro Batch statt pro Datei)
+_COMMIT_EVERY = 200
+_COMMIT_INTERVAL = 2.0
+
+_CREATE = """
+CREATE TABLE IF NOT EXISTS tracks (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    variant TEXT NOT NULL,
+    data TEXT NOT NULL
+)
+"""
+
+# Der Pfad ist Tabellenschluessel und steht nicht im JSON
+_SKIP_FIELDS = {"path"}
+
+
+def _encode(track: AudioTrack) -> str:
+    data: dict[str, object] = {}
+    for f in fields(track):
+        if f.name in _SKIP_FIELDS:
+            continue
+        value = getattr(track, f.name)
+        if isinstance(value, AudioFormat):
+            value = value.value
+        elif isinstance(value, tuple):
+            value = list(value)
+        data[f.name] = value
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _decode(path: Path, raw: str) -> AudioTrack | None:
+    try:
+        data = json.loads(raw)
+        data["format"] = AudioFormat(data.get("format", AudioFormat.UNKNOWN.value))
+        data["subtune_durations"] = tuple(data.get("subtune_durations", ()))
+        return AudioTrack(path=path, **data)
+    except (ValueError, TypeError):
+        return None
+
+
+class CachingMetadataReader:
+    """MetadataReader-Decorator mit persistentem SQLite-Index.
+
+    Implementiert das MetadataReader-Protocol aus domain/protocols.py.
+    Thread-sicher (Scans laufen in Worker-Threads). Fail-safe: Datenbank-
+    Fehler werden geloggt, dann liest der innere Reader direkt.
+
+    Args:
+        reader: Eigentlicher Reader fuer neue/geaenderte Dateien.
+        database: SQLite-Datei (Default ~/.retro-amp/library.db).
+        variant: Reader-Konfiguration, von der die Metadaten abhaengen
+            (z.B. die Songlengths-Datenbank); eine andere Variante gilt
+            als Cache-Miss.
+    """
+
+    def __init__(
+        self,
+        reader: MetadataReader,
+        database: Path | None = None,
+        variant: str = "",
+    ) -> None:
+        self._reader = reader
+        self._database = database or _DATABASE
+        self._variant = f"v{_SCHEMA_VERSION}|{variant}"
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._failed = False
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    @property
+    def database(self) -> Path:
+        return self._database
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Oeffnet die Datenbank beim ersten Zugriff (nur unter dem Lock rufen)."""
+        if self._conn is not None or self._failed:
+            return self._conn
+        try:
+            self._database.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._database), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_CREATE)
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            logger.warning("Track-Index nicht nutzbar: %s", self._database, exc_info=True)
+            self._failed = True
+        return self._conn
+
+    def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+        """Liest Metadaten aus dem Index oder (bei Miss) ueber den Reader.
+
+        Mit einem FileEntry aus dem Listing kostet ein Treffer kein stat.
+        """
+        if entry is None or not entry.has_stat:
+            try:
+                stat = path.stat()
+            except OSError:
+                return self._reader.read(path, entry)
+            entry = FileEntry(path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        key = str(path)
+
+        with self._lock:
+            cached = self._lookup(key, entry.size, entry.mtime_ns)
+        if cached is not None:
+            track = _decode(path, cached)
+            if track is not None:
+                return track
+
+        track = self._reader.read(path, entry)
+        with self._lock:
+            self._store(key, entry.size, entry.mtime_ns, track)
+        return track
+
+    def _lookup(self, key: str, size: int, mtime_ns: int) -> str | None:
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT data FROM tracks"
+                " WHERE path = ? AND size = ? AND mtime_ns = ? AND variant = ?",
+                (key, size, mtime_ns, self._variant),
+            ).fetchone()
+        except sqlite3.Error:
+            logger.debug("Track-Index: Lesefehler", exc_info=True)
+            return None
+        return row[0] if row else None
+
+    def _store(self, key: str, size: int, mtime_ns: int, track: AudioTrack) -> None:
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO tracks (path, size, mtime_ns, variant, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, size, mtime_ns, self._variant, _encode(track)),
+            )
+            self._pending += 1
+            if (
+                self._pending >= _COMMIT_EVERY
+                or time.monotonic() - self._last_commit >= _COMMIT_INTERVAL
+            ):
+                self._commit()
+        except sqlite3.Error:
+            logger.debug("Track-Index: Schreibfehler", exc_info=True)
+
+    def _commit(self) -> None:
+        if self._conn is not None and self._pending:
+            self._conn.commit()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def flush(self) -> None:
+        """Schreibt gesammelte Eintraege in die Datenbank."""
+        with self._lock:
+            try:
+                self._commit()
+            except sqlite3.Error:
+                logger.debug("Track-Index: Commit fehlgeschlagen", exc_info=True)
+
+    def close(self) -> None:
+        """Committet offene Eintraege und schliesst die Datenbank."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -10,7 +10,10 @@ import re
 from datetime import datetime, timezone
 from pathlib import Path
 
-from ..domain.models import AudioFormat, AudioTrack
+from ..domain.models import AudioFormat, AudioTrack, FileEntry
+from .mp3_header import read_mp3_info
+from .sid_header import read_sid_header
+from .songlengths import SonglengthsIndex
 
 logger = logging.getLogger(__name__)
 
@@ -102,9 +105,8 @@ def _read_header_title(path: Path) -> str:
                 header = f.read(37)
                 raw = header[17:37] if len(header) >= 37 else b""
             elif ext == ".sid":
-                # PSID/RSID: Bytes 0x16-0x35 = Name (32 Bytes, ASCII)
-                header = f.read(0x36)
-                raw = header[0x16:0x36] if len(header) >= 0x36 else b""
+                sid = read_sid_header(path)
+                return sid.name if sid is not None else ""
             else:
                 return ""
             return raw.decode("ascii", errors="replace").strip("\x00").strip()
@@ -114,47 +116,57 @@ def _read_header_title(path: Path) -> str:
 
 def _read_sid_artist(path: Path) -> str:
     """Liest den Artist aus dem SID-Header."""
-    try:
-        with open(path, "rb") as f:
-            header = f.read(0x56)
-            # PSID/RSID: Bytes 0x36-0x55 = Author (32 Bytes, ASCII)
-            if len(header) >= 0x56:
-                return header[0x36:0x56].decode("ascii", errors="replace").strip("\x00").strip()
-    except Exception:
-        pass
-    return ""
+    header = read_sid_header(path)
+    return header.author if header is not None else ""
 
 
 class MutagenMetadataReader:
     """MetadataReader-Implementation mit mutagen.
 
     Implementiert das MetadataReader-Protocol aus domain/protocols.py.
-    Tracker-Formate (MOD/S3M/XM) liest es direkt aus dem Header.
+    Tracker-Formate (MOD/S3M/XM) liest es direkt aus dem Header, MP3s
+    zuerst ueber den schnellen Header-Parser (mutagen nur als Fallback).
+
+    Args:
+        songlengths: Optionale HVSC-Songlengths; liefert die Dauer von
+            SID-Dateien, die im Header nicht steht.
     """
 
-    def read(self, path: Path) -> AudioTrack:
-        """Liest Metadaten einer Audio-Datei."""
+    def __init__(self, songlengths: SonglengthsIndex | None = None) -> None:
+        self._songlengths = songlengths
+
+    def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+        """Liest Metadaten einer Audio-Datei (stat-Daten aus entry, falls vorhanden)."""
         track = AudioTrack(path=path)
 
         # Dateigroesse und Aenderungsdatum lesen
-        try:
-            stat = path.stat()
-            track.file_size_bytes = stat.st_size
-            track.modified_date = datetime.fromtimestamp(
-                stat.st_mtime, tz=timezone.utc,
-            ).isoformat()
-        except OSError:
-            pass
-
-        # Tracker/SID-Formate: mutagen unterstuetzt diese nicht
+        if entry is not None and entry.has_stat:
+            track.file_size_bytes = entry.size
+            track.modified_date = entry.modified_date
+        else:
+            try:
+                stat = path.stat()
+                track.file_size_bytes = stat.st_size
+                track.modified_date = datetime.fromtimestamp(
+                    stat.st_mtime, tz=timezone.utc,
+                ).isoformat()
+            except OSError:
+                pass
+
+        # SID: ein Header-Lesevorgang fuer Titel, Autor und Subtunes
+        if path.suffix.lower() == ".sid":
+            self._read_sid(path, track)
+            return track
+
+        # Tracker-Formate: mutagen unterstuetzt diese nicht
         if path.suffix.lower() in _HEADER_EXTENSIONS:
             title = _read_header_title(path)
             if title:
                 track.title = title
-            if path.suffix.lower() == ".sid":
-                artist = _read_sid_artist(path)
-                if artist:
-                    track.artist = artist
+            return track
+
+        if path.suffix.lower() == ".mp3" and self._read_mp3_fast(path, track):
+            self._apply_fallbacks(path, track)
             return track
 
         try:
@@ -185,6 +197,29 @@ class MutagenMetadataReader:
         except Exception:
             logger.debug("Metadaten konnten nicht gelesen werden: %s", path)
 
+        self._apply_fallbacks(path, track)
+        return track
+
+    def _read_mp3_fast(self, path: Path, track: AudioTrack) -> bool:
+        """MP3 ohne mutagen lesen (nur ID3v2-Bereich + erster Frame).
+
+        Returns:
+            False, wenn der Header-Parser die Datei nicht sicher versteht.
+        """
+        info = read_mp3_info(path, track.file_size_bytes or None)
+        if info is None:
+            return False
+        track.duration_seconds = info.duration_seconds
+        track.bitrate_kbps = info.bitrate // 1000 if info.bitrate > 1000 else info.bitrate
+        track.sample_rate = info.sample_rate
+        track.title = info.title
+        track.artist = info.artist
+        track.album = info.album
+        return True
+
+    @staticmethod
+    def _apply_fallbacks(path: Path, track: AudioTrack) -> None:
+        """Ergaenzt fehlenden Artist/Titel aus Title-Tag bzw. Dateiname."""
         # Fallback 1: Title-Tag enthaelt "Artist — Title" → aufteilen
         if track.title and not track.artist:
             parsed_artist, parsed_title = _parse_title_tag(track.title)
@@ -200,7 +235,19 @@ class MutagenMetadataReader:
             if not track.title and fn_title:
                 track.title = fn_title
 
-        return track
+    def _read_sid(self, path: Path, track: AudioTrack) -> None:
+        """Uebernimmt Name, Autor, Subtune-Anzahl und (per Songlengths) Dauern."""
+        header = read_sid_header(path)
+        if header is None:
+            return
+        track.title = header.name
+        track.artist = header.author
+        track.subtune_count = header.songs
+        if self._songlengths is None:
+            return
+        track.subtune_durations = self._songlengths.lengths_for(path)
+        if 0 < header.start_song <= len(track.subtune_durations):
+            track.duration_seconds = track.subtune_durations[header.start_song - 1]
 
     def _read_tag(self, audio: object, *tag_names: str) -> str:
         """Versucht einen Tag unter verschiedenen Namen zu lesen."""
@@ -0,0 +1,565 @@
+"""Audio-Playback via miniaudio (Streaming in ein Playback-Device).
+
+Die Datei wird nie komplett dekodiert: der Callback des Devices fordert
+pro Periode genau die benoetigten Frames an, die direkt aus dem Decoder
+gelesen werden. Daraus ergeben sich
+
+- konstanter Speicherbedarf (ein Decoder-Puffer, kein PCM im RAM),
+- eine Position aus gezaehlten Frames statt aus einer Wanduhr,
+- Seek fuer jedes Format durch Neu-Oeffnen des Decoders ab einem Frame,
+- lueckenlose Uebergaenge: ein vorab geoeffneter naechster Stream wird im
+  selben Device-Callback angehaengt, in dem der aktuelle endet.
+
+Opus wird per pyogg gestreamt (miniaudio kennt kein Opus), SID per
+sidplayfp progressiv mitgelesen. Tracker-Formate (MOD/XM/S3M) dekodiert
+miniaudio nicht — dafuer wird intern an PygameAudioPlayer delegiert.
+"""
+from __future__ import annotations
+
+import array
+import logging
+import threading
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import NamedTuple
+
+import miniaudio
+
+from .audio_player import (
+    _OGG_EXTENSIONS,
+    SID_DURATION,
+    DecodedAudio,
+    PcmBytesOpener,
+    PygameAudioPlayer,
+    _is_opus,
+    _opus_pcm,
+    _start_sid_render,
+    frame_aligned,
+    sid_duration,
+)
+from .render_cache import RenderCache, RenderedPcm
+from .songlengths import SonglengthsIndex
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:  # optional — stdlib-Fallback
+    np = None  # type: ignore[assignment]
+    _HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# Formate, die miniaudio selbst dekodiert
+_MINIAUDIO_FORMATS = {".mp3", ".flac", ".wav", ".wave", ".ogg", ".oga"}
+
+# Formate ohne miniaudio-Decoder (per pygame abgespielt)
+_FALLBACK_FORMATS = {".mod", ".xm", ".s3m"}
+
+# Ausgabe ist immer Stereo, int16
+_CHANNELS = 2
+
+# Obergrenze pro Decoder-Aufruf (miniaudio allokiert 16384 Frames)
+_MAX_READ_FRAMES = 16384
+
+# Decoder-Generator: bekommt per send() die gewuenschte Frame-Anzahl und
+# liefert interleaved Stereo-int16 (hoechstens so viele Frames)
+FrameStream = Generator["array.array[int]", int, None]
+
+
+class _Source(NamedTuple):
+    """Oeffnet einen FrameStream ab einem Start-Frame."""
+
+    open: Callable[[int], FrameStream]
+    sample_rate: int
+    # Gibt Ressourcen der Quelle frei (z.B. Render-Prozess beenden)
+    close: Callable[[], None] | None = None
+    # Geteiltes PCM fuer weitere Leser (nur SID-Renders)
+    decoded: DecodedAudio | None = None
+
+
+class _Preloaded(NamedTuple):
+    """Vorab geoeffneter naechster Track (Gapless)."""
+
+    path: Path
+    source: _Source
+    stream: FrameStream
+    subtune: int = 0
+
+
+def _to_stereo(chunk: array.array[int], channels: int) -> array.array[int]:
+    """Interleaved PCM mit beliebiger Kanalzahl -> Stereo."""
+    if channels == _CHANNELS:
+        return chunk
+    if channels == 1:
+        stereo = array.array("h", bytes(len(chunk) * 4))
+        stereo[0::2] = chunk
+        stereo[1::2] = chunk
+        return stereo
+    stereo = array.array("h", bytes((len(chunk) // channels) * 4))
+    stereo[0::2] = chunk[0::channels]
+    stereo[1::2] = chunk[1::channels]
+    return stereo
+
+
+def _miniaudio_source(path: Path) -> _Source:
+    """Decoder-Stream fuer alle von miniaudio unterstuetzten Formate."""
+    sample_rate = miniaudio.get_file_info(str(path)).sample_rate
+
+    def _open(start_frame: int) -> FrameStream:
+        stream: FrameStream = miniaudio.stream_file(
+            str(path),
+            nchannels=_CHANNELS,
+            sample_rate=sample_rate,
+            seek_frame=start_frame,
+        )
+        return stream
+
+    return _Source(_open, sample_rate)
+
+
+def _pcm_source(
+    channels: int,
+    sample_rate: int,
+    open_pcm: PcmBytesOpener,
+    close: Callable[[], None] | None = None,
+    decoded: DecodedAudio | None = None,
+) -> _Source:
+    """Stereo-Stream ueber einen Byte-Opener (interleaved int16, beliebige Kanaele)."""
+
+    def _frames(start_frame: int) -> FrameStream:
+        raw = open_pcm(start_frame)
+        chunks = frame_aligned(raw, channels * 2)
+        pending = array.array("h")
+        try:
+            want = yield array.array("h")
+            while True:
+                while len(pending) < want * _CHANNELS:
+                    data = next(chunks, None)
+                    if data is None:
+                        break
+                    chunk = array.array("h")
+                    chunk.frombytes(data)
+                    pending.extend(_to_stereo(chunk, channels))
+                if not pending:
+                    return
+                take = pending[:want * _CHANNELS]
+                del pending[:want * _CHANNELS]
+                want = yield take
+        finally:
+            chunks_close = getattr(raw, "close", None)
+            if chunks_close is not None:
+                chunks_close()
+
+    def _open(start_frame: int) -> FrameStream:
+        gen = _frames(start_frame)
+        next(gen)
+        return gen
+
+    return _Source(_open, sample_rate, close, decoded)
+
+
+def _opus_source(path: Path) -> _Source:
+    """Opus per pyogg (dekodiert immer mit 48 kHz)."""
+    channels, _, open_pcm = _opus_pcm(path)
+    return _pcm_source(channels, 48000, open_pcm)
+
+
+def _sid_source(
+    path: Path,
+    duration: int = SID_DURATION,
+    cache: RenderCache | None = None,
+    subtune: int = 0,
+) -> _Source | None:
+    """SID aus dem Render-Cache oder per sidplayfp (spielt, waehrend weitergerendert wird)."""
+    render = _start_sid_render(path, duration, cache, subtune)
+    if render is None:
+        return None
+    block_align = render.channels * 2
+    return _pcm_source(
+        render.channels,
+        render.sample_rate,
+        lambda frame: render.chunks(frame * block_align),
+        close=render.close,
+        decoded=DecodedAudio(
+            path, subtune, render.channels, render.sample_rate, render.chunks,
+            complete=isinstance(render, RenderedPcm),
+        ),
+    )
+
+
+def _scale(chunk: array.array[int], volume: float) -> array.array[int] | bytes:
+    """Wendet die Lautstaerke auf int16-Samples an."""
+    if volume >= 1.0:
+        return chunk
+    if _HAS_NUMPY:
+        data = np.frombuffer(chunk, dtype=np.int16)
+        return (data * volume).astype(np.int16).tobytes()
+    return array.array("h", [int(s * volume) for s in chunk])
+
+
+class MiniaudioAudioPlayer:
+    """AudioPlayer-Implementation mit miniaudio-Streaming.
+
+    Implementiert das AudioPlayer-Protocol aus domain/protocols.py.
+    Die Position wird aus den an das Device gelieferten Frames berechnet
+    (abzueglich der Device-Latenz) und ist damit sample-genau. Seek oeffnet
+    den Decoder ab dem Ziel-Frame neu und funktioniert fuer alle Formate.
+
+    Args:
+        buffer_msec: Puffergroesse des Playback-Devices.
+        backends: Bevorzugte miniaudio-Backends (None = automatisch).
+        render_cache: Optionaler Cache fuer fertige SID-Renders.
+        songlengths: Optionale HVSC-Songlengths fuer exakte SID-Dauern.
+    """
+
+    def __init__(
+        self,
+        buffer_msec: int = 100,
+        backends: list[miniaudio.Backend] | None = None,
+        render_cache: RenderCache | None = None,
+        songlengths: SonglengthsIndex | None = None,
+    ) -> None:
+        self._buffer_msec = buffer_msec
+        self._backends = backends
+        self._render_cache = render_cache
+        self._songlengths = songlengths
+        self._lock = threading.Lock()
+        self._device: miniaudio.PlaybackDevice | None = None
+        self._device_rate = 0
+        self._path: Path | None = None
+        self._source: _Source | None = None
+        self._stream: FrameStream | None = None
+        self._next: _Preloaded | None = None
+        # Beim Gapless-Wechsel abgeloeste Quellen; geschlossen wird im
+        # Steuer-Thread (_reap), nie im Audio-Callback
+        self._retired: list[tuple[_Source, FrameStream | None]] = []
+        self._frames = 0
+        self._delivered = 0
+        self._start_frame = 0
+        self._paused = False
+        self._ended = True
+        self._volume = 1.0
+        self._fallback: PygameAudioPlayer | None = None
+        self._delegating = False
+
+    # --- Device-Callback (laeuft im Audio-Thread) ---
+
+    def _pump(self) -> Generator[array.array[int] | bytes, int, None]:
+        """Callback-Generator: liefert pro Anfrage genau framecount Frames."""
+        framecount = yield b""
+        while True:
+            with self._lock:
+                data = self._read(framecount)
+            framecount = yield data
+
+    def _read(self, framecount: int) -> array.array[int] | bytes:
+        """Liest framecount Frames aus dem Decoder (Stille bei Pause/Ende)."""
+        silence = bytes(framecount * _CHANNELS * 2)
+        if self._paused or self._stream is None:
+            return silence
+        if self._ended:
+            # Nachlauf: Device-Puffer leerspielen, bevor is_busy() False wird
+            self._delivered += framecount
+            return silence
+
+        out = array.array("h")
+        want = framecount
+        while want > 0:
+            try:
+                chunk = self._stream.send(min(want, _MAX_READ_FRAMES))
+            except StopIteration:
+                chunk = None
+            except Exception:
+                logger.exception("Dekodierung abgebrochen")
+                chunk = None
+            if not chunk:
+                if self._advance(framecount - want):
+                    continue
+                self._ended = True
+                break
+            out.extend(chunk)
+            frames = len(chunk) // _CHANNELS
+            self._frames += frames
+            want -= frames
+
+        self._delivered += framecount
+        if want > 0:
+            out.frombytes(silence[:want * _CHANNELS * 2])
+        return _scale(out, self._volume)
+
+    def _advance(self, frames_in_callback: int) -> bool:
+        """Haengt den vorgeladenen Track an (im Audio-Thread, Lock gehalten).
+
+        Der alte Track wird nur vorgemerkt: PipeRender.close() kann blockieren
+        und wuerde im Callback Aussetzer verursachen.
+
+        Args:
+            frames_in_callback: Frames des alten Tracks im laufenden Callback.
+                Sie werden vom Lieferzaehler des neuen Tracks abgezogen, damit
+                dessen Position erst mit dem ersten eigenen Frame beginnt.
+        """
+        preloaded, self._next = self._next, None
+        if preloaded is None:
+            return False
+        old_source, old_stream = self._source, self._stream
+        self._path = preloaded.path
+        self._source = preloaded.source
+        self._stream = preloaded.stream
+        self._frames = 0
+        self._start_frame = 0
+        self._delivered = -frames_in_callback
+        if old_source is not None:
+            self._retired.append((old_source, old_stream))
+        return True
+
+    # --- Device-Verwaltung ---
+
+    def _ensure_device(self, sample_rate: int) -> bool:
+        """Oeffnet das Device mit der Sample-Rate der Quelle (bei Bedarf neu)."""
+        if self._device is not None and self._device_rate == sample_rate:
+            return True
+        self._close_device()
+        try:
+            device = miniaudio.PlaybackDevice(
+                output_format=miniaudio.SampleFormat.SIGNED16,
+                nchannels=_CHANNELS,
+                sample_rate=sample_rate,
+                buffersize_msec=self._buffer_msec,
+                backends=self._backends,
+                app_name="retro-amp",
+            )
+            pump = self._pump()
+            next(pump)
+            device.start(pump)
+        except Exception:
+            logger.exception("miniaudio-Device konnte nicht geoeffnet werden")
+            return False
+        self._device = device
+        self._device_rate = sample_rate
+        return True
+
+    def _close_device(self) -> None:
+        if self._device is not None:
+            try:
+                self._device.close()
+            except Exception:
+                pass
+            self._device = None
+            self._device_rate = 0
+
+    def _swap_stream(self, stream: FrameStream | None, start_frame: int) -> None:
+        """Ersetzt den Decoder-Stream atomar (alter Stream wird geschlossen)."""
+        with self._lock:
+            old, self._stream = self._stream, stream
+            self._frames = start_frame
+            self._delivered = start_frame
+            self._start_frame = start_frame
+            self._ended = stream is None
+        if old is not None:
+            old.close()
+
+    def _reap(self) -> None:
+        """Schliesst im Audio-Thread abgeloeste Quellen (Steuer-Thread)."""
+        with self._lock:
+            retired, self._retired = self._retired, []
+        for source, stream in retired:
+            self._release(source, stream)
+
+    @staticmethod
+    def _release(source: _Source | None, stream: FrameStream | None = None) -> None:
+        """Schliesst Stream und Quelle (Render-Prozesse enden sofort)."""
+        if stream is not None:
+            stream.close()
+        if source is not None and source.close is not None:
+            source.close()
+
+    def _open_source(self, path: Path, subtune: int = 0) -> _Source | None:
+        ext = path.suffix.lower()
+        if ext == ".sid":
+            duration = sid_duration(path, self._songlengths, subtune)
+            return _sid_source(path, duration, self._render_cache, subtune)
+        if ext in _OGG_EXTENSIONS and _is_opus(path):
+            return _opus_source(path)
+        if ext in _MINIAUDIO_FORMATS:
+            return _miniaudio_source(path)
+        return None
+
+    def _pygame(self) -> PygameAudioPlayer:
+        if self._fallback is None:
+            self._fallback = PygameAudioPlayer()
+            self._fallback.set_volume(self._volume)
+        return self._fallback
+
+    # --- AudioPlayer-Protocol ---
+
+    def play(self, path: Path, subtune: int = 0) -> None:
+        """Spielt eine Audio-Datei ab (bei SID optional einen Subtune)."""
+        with self._lock:
+            preloaded, self._next = self._next, None
+        if preloaded is not None and (preloaded.path, preloaded.subtune) != (path, subtune):
+            self._release(preloaded.source, preloaded.stream)
+            preloaded = None
+        self.stop()
+        if path.suffix.lower() in _FALLBACK_FORMATS:
+            self._delegating = True
+            self._pygame().play(path)
+            return
+
+        try:
+            if preloaded is not None:
+                source, stream = preloaded.source, preloaded.stream
+            else:
+                opened = self._open_source(path, subtune)
+                if opened is None:
+                    logger.warning("Format nicht unterstuetzt: %s", path)
+                    return
+                source, stream = opened, opened.open(0)
+            if not self._ensure_device(source.sample_rate):
+                self._release(source, stream)
+                return
+        except Exception:
+            logger.exception("Fehler beim Abspielen von %s", path)
+            return
+        self._path = path
+        self._source = source
+        self._paused = False
+        self._swap_stream(stream, 0)
+
+    def preload(self, path: Path, subtune: int = 0) -> None:
+        """Oeffnet den naechsten Track vorab fuer einen lueckenlosen Uebergang.
+
+        Angehaengt wird nur bei gleicher Sample-Rate; sonst muss das Device
+        neu geoeffnet werden und der Wechsel laeuft ueber play().
+        """
+        if path.suffix.lower() in _FALLBACK_FORMATS:
+            if self._delegating:
+                self._pygame().preload(path)
+            return
+        playing = self._path
+        if playing is None or self._delegating:
+            return
+        try:
+            source = self._open_source(path, subtune)
+            if source is None:
+                return
+            if source.sample_rate != self._device_rate:
+                self._release(source)
+                return
+            stream = source.open(0)
+        except Exception:
+            logger.debug("Preload fehlgeschlagen: %s", path, exc_info=True)
+            return
+        with self._lock:
+            # Inzwischen anderer Track gestartet: Preload waere veraltet
+            if self._path != playing or self._ended:
+                stale: _Preloaded | None = _Preloaded(path, source, stream, subtune)
+            else:
+                stale, self._next = self._next, _Preloaded(path, source, stream, subtune)
+        if stale is not None:
+            self._release(stale.source, stale.stream)
+
+    def playing_path(self) -> Path | None:
+        """Datei, die gerade dekodiert wird (wechselt beim Gapless-Uebergang)."""
+        if self._delegating:
+            return self._pygame().playing_path()
+        self._reap()
+        return self._path
+
+    def decoded_audio(self) -> DecodedAudio | None:
+        """Geteiltes PCM des laufenden Tracks (SID-Render), sonst None."""
+        source = self._source
+        if self._delegating or source is None:
+            return None
+        return source.decoded
+
+    def pause(self) -> None:
+        """Pausiert die Wiedergabe."""
+        if self._delegating:
+            self._pygame().pause()
+            return
+        with self._lock:
+            self._paused = True
+
+    def unpause(self) -> None:
+        """Setzt die Wiedergabe fort."""
+        if self._delegating:
+            self._pygame().unpause()
+            return
+        with self._lock:
+            self._paused = False
+
+    def stop(self) -> None:
+        """Stoppt die Wiedergabe."""
+        if self._delegating:
+            self._pygame().stop()
+            self._delegating = False
+        with self._lock:
+            preloaded, self._next = self._next, None
+        if preloaded is not None:
+            self._release(preloaded.source, preloaded.stream)
+        source, self._source = self._source, None
+        self._path = None
+        self._paused = False
+        self._swap_stream(None, 0)
+        self._release(source)
+        self._reap()
+
+    def set_volume(self, volume: float) -> None:
+        """Setzt die Lautstaerke (0.0 bis 1.0)."""
+        with self._lock:
+            self._volume = max(0.0, min(1.0, volume))
+        if self._fallback is not None:
+            self._fallback.set_volume(self._volume)
+
+    def get_position(self) -> float:
+        """Gibt die aktuelle Position in Sekunden zurueck.
+
+        Gelieferte Frames minus Device-Puffer, begrenzt auf die dekodierten
+        Frames und nie vor dem letzten Seek-Ziel.
+        """
+        if self._delegating:
+            return self._pygame().get_position()
+        self._reap()
+        source = self._source
+        if source is None:
+            return 0.0
+        with self._lock:
+            audible = self._delivered - self._latency_frames()
+            frames = max(self._start_frame, min(self._frames, audible))
+        return frames / source.sample_rate
+
+    def _latency_frames(self) -> int:
+        return self._device_rate * self._buffer_msec // 1000
+
+    def seek(self, position_seconds: float) -> None:
+        """Springt zu einer bestimmten Position in Sekunden."""
+        if self._delegating:
+            self._pygame().seek(position_seconds)
+            return
+        source = self._source
+        if source is None:
+            return
+        frame = int(max(0.0, position_seconds) * source.sample_rate)
+        try:
+            stream = source.open(frame)
+        except Exception:
+            logger.debug("Seek fehlgeschlagen", exc_info=True)
+            return
+        self._swap_stream(stream, frame)
+
+    def is_busy(self) -> bool:
+        """Prueft ob gerade abgespielt wird."""
+        if self._delegating:
+            return self._pygame().is_busy()
+        with self._lock:
+            if self._stream is None or self._paused:
+                return False
+            return not self._ended or self._delivered - self._latency_frames() < self._frames
+
+    def cleanup(self) -> None:
+        """Schliesst Decoder und Device."""
+        self.stop()
+        self._close_device()
+        if self._fallback is not None:
+            self._fallback.cleanup()
+            self._fallback = None
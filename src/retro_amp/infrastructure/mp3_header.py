@@ -0,0 +1,357 @@
+"""Schneller MP3-Header-Parser fuer Bulk-Scans.
+
+Liest nur, was die Datei-Tabelle braucht: Titel/Artist/Album aus dem
+ID3v2-Tag (grosse Frames wie Cover werden uebersprungen, nicht gelesen),
+dazu den ersten MPEG-Frame mit Xing/Info- bzw. VBRI-Header fuer exakte
+Dauer und Bitrate. Die Berechnung folgt mutagen (inkl. LAME-Encoder-
+Delay/Padding), damit beide Pfade dieselben Werte liefern. Alles, was
+ungewoehnlich aussieht (Unsynchronisation, komprimierte Frames, kein
+sauberer Frame-Sync), ergibt None — dann liest der Aufrufer per mutagen.
+"""
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+# Nach den ID3v2-Tags wird so weit nach dem ersten Frame gesucht
+_SYNC_WINDOW = 64 * 1024
+
+# Gesuchte Text-Frames: ID3v2.3/2.4 bzw. ID3v2.2 -> Feld
+_TEXT_FRAMES = {
+    b"TIT2": "title", b"TPE1": "artist", b"TALB": "album",
+    b"TT2": "title", b"TP1": "artist", b"TAL": "album",
+}
+
+# Bitraten in kbit/s je (MPEG-Version, Layer III); Index 0 und 15 ungueltig
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_SAMPLE_RATES = {
+    1: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    25: (11025, 12000, 8000),
+}
+_VERSIONS = {0: 25, 2: 2, 3: 1}  # Bits -> MPEG 2.5 / 2 / 1 (1 = reserviert)
+_MONO = 3
+
+_XING_FRAMES = 0x1
+_XING_BYTES = 0x2
+_XING_TOC = 0x4
+_XING_SCALE = 0x8
+
+_VBRI = struct.Struct(">4sHHHIIHHHH")
+
+
+@dataclass(frozen=True)
+class Mp3Info:
+    """Stream-Daten und Tags einer MP3-Datei (Bitrate in bit/s)."""
+
+    duration_seconds: float
+    bitrate: int
+    sample_rate: int
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+
+
+@dataclass(frozen=True)
+class _FrameHeader:
+    version: int  # 1, 2 oder 25 (MPEG 2.5)
+    bitrate: int
+    sample_rate: int
+    mode: int
+    length: int
+    samples: int
+
+
+def _syncsafe(data: bytes) -> int | None:
+    if any(b & 0x80 for b in data):
+        return None
+    value = 0
+    for b in data:
+        value = (value << 7) | b
+    return value
+
+
+def _parse_frame_header(data: bytes, pos: int = 0) -> _FrameHeader | None:
+    """MPEG-Layer-III-Header ab pos. None bei ungueltigem Header."""
+    if len(data) < pos + 4 or data[pos] != 0xFF or data[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    version = _VERSIONS.get((b1 >> 3) & 0x3)
+    layer = (b1 >> 1) & 0x3
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x3
+    if version is None or layer != 1 or rate_index == 3 or bitrate_index in (0, 15):
+        return None
+    table = _BITRATES_V1 if version == 1 else _BITRATES_V2
+    bitrate = table[bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    samples = 1152 if version == 1 else 576
+    padding = (b2 >> 1) & 0x1
+    length = (samples // 8 * bitrate) // sample_rate + padding
+    return _FrameHeader(version, bitrate, sample_rate, b3 >> 6, length, samples)
+
+
+def _decode_text(data: bytes) -> str:
+    """Erster Wert eines ID3-Text-Frames (Encoding-Byte + Text)."""
+    if not data:
+        return ""
+    encoding, raw = data[0], data[1:]
+    if encoding in (1, 2):
+        # UTF-16: Terminator ist ein ausgerichtetes Null-Paar
+        for i in range(0, len(raw) - 1, 2):
+            if raw[i] == 0 and raw[i + 1] == 0:
+                raw = raw[:i]
+                break
+        codec = "utf-16" if encoding == 1 else "utf-16-be"
+    else:
+        raw = raw.split(b"\x00", 1)[0]
+        codec = "utf-8" if encoding == 3 else "latin-1"
+    try:
+        return raw.decode(codec).strip()
+    except UnicodeDecodeError:
+        return raw.decode(codec, errors="replace").strip()
+
+
+def _read_id3v2(f: BinaryIO, tags: dict[str, str]) -> int | None:
+    """Liest Text-Frames aus ID3v2-Tags am Dateianfang.
+
+    Returns:
+        Offset hinter dem letzten Tag (mehrere Tags wie bei WMP werden
+        uebersprungen) oder None bei Tags, die der schnelle Pfad nicht
+        versteht.
+    """
+    offset = 0
+    first = True
+    while True:
+        f.seek(offset)
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b"ID3":
+            return offset
+        size = _syncsafe(header[6:10])
+        if size is None:
+            return None
+        if size == 0:
+            return offset
+        end = offset + 10 + size + (10 if header[5] & 0x10 else 0)
+        if first:
+            if not _read_frames(f, header[3], header[5], offset + 10, offset + 10 + size, tags):
+                return None
+            first = False
+        offset = end
+
+
+def _read_frames(
+    f: BinaryIO,
+    major: int,
+    flags: int,
+    start: int,
+    end: int,
+    tags: dict[str, str],
+) -> bool:
+    """Sammelt die gesuchten Text-Frames eines Tags; False = mutagen ueberlassen."""
+    if major not in (2, 3, 4) or (flags & 0x80 and major < 4) or (major == 2 and flags & 0x40):
+        return False
+    pos = start
+    if flags & 0x40:
+        f.seek(pos)
+        raw = f.read(4)
+        ext_size = _syncsafe(raw) if major == 4 else int.from_bytes(raw, "big") + 4
+        if ext_size is None:
+            return False
+        pos += ext_size
+
+    id_len, header_len = (3, 6) if major == 2 else (4, 10)
+    wanted = len({name for name in _TEXT_FRAMES.values()})
+    while pos + header_len <= end and len(tags) < wanted:
+        f.seek(pos)
+        frame = f.read(header_len)
+        frame_id = frame[:id_len]
+        if len(frame) < header_len or not frame_id.strip(b"\x00"):
+            break  # Padding
+        if major == 2:
+            size = int.from_bytes(frame[3:6], "big")
+            frame_flags = 0
+        elif major == 4:
+            synced = _syncsafe(frame[4:8])
+            if synced is None:
+                return False
+            size = synced
+            frame_flags = frame[9]
+        else:
+            size = int.from_bytes(frame[4:8], "big")
+            frame_flags = frame[9]
+        pos += header_len
+        if pos + size > end:
+            return False
+        field = _TEXT_FRAMES.get(frame_id)
+        if field is not None and field not in tags:
+            data = f.read(size)
+            if major == 4:
+                if frame_flags & 0x0C:  # komprimiert/verschluesselt
+                    return False
+                if frame_flags & 0x40:  # Gruppierung
+                    data = data[1:]
+                if frame_flags & 0x01:  # Datenlaengen-Indikator
+                    data = data[4:]
+                if frame_flags & 0x02 or flags & 0x80:
+                    data = data.replace(b"\xff\x00", b"\xff")
+            elif major == 3:
+                if frame_flags & 0xC0:
+                    return False
+                if frame_flags & 0x20:
+                    data = data[1:]
+            value = _decode_text(data)
+            if value:
+                tags[field] = value
+        pos += size
+    return True
+
+
+def _read_id3v1(f: BinaryIO, tags: dict[str, str]) -> None:
+    """Ergaenzt fehlende Felder aus einem ID3v1-Tag am Dateiende."""
+    try:
+        f.seek(-128, 2)
+    except OSError:
+        return
+    data = f.read(128)
+    if len(data) != 128 or data[:3] != b"TAG":
+        return
+    for field, raw in (("title", data[3:33]), ("artist", data[33:63]), ("album", data[63:93])):
+        if field not in tags:
+            value = raw.split(b"\x00", 1)[0].decode("latin-1").strip()
+            if value:
+                tags[field] = value
+
+
+def _xing_offset(frame: _FrameHeader) -> int:
+    if frame.version == 1:
+        return 21 if frame.mode == _MONO else 36
+    return 13 if frame.mode == _MONO else 21
+
+
+def _lame_delay(data: bytes, pos: int) -> int | None:
+    """Encoder-Delay + Padding aus dem LAME-Tag ab pos. None ohne LAME-Tag."""
+    tag = data[pos:pos + 36]
+    if len(tag) < 36 or not tag.startswith((b"LAME", b"L3.99")):
+        return None
+    version = tag[4:9] if tag.startswith(b"LAME") else tag[1:6]
+    major, _, minor = version.partition(b".")
+    digits = bytes(c for c in minor if 48 <= c <= 57)
+    try:
+        if (int(major), int(digits)) < (3, 90):
+            return None
+    except ValueError:
+        return None
+    if tag[9] >> 4 != 0:  # Header-Revision
+        return None
+    delay = (tag[21] << 4) | (tag[22] >> 4)
+    padding = ((tag[22] & 0x0F) << 8) | tag[23]
+    return delay + padding
+
+
+def _stream_info(data: bytes, base: int, file_size: int) -> tuple[float, int, int] | None:
+    """Dauer, Bitrate und Sample-Rate ab dem ersten gueltigen Frame."""
+    pos = data.find(b"\xff")
+    while 0 <= pos < len(data) - 4:
+        frame = _parse_frame_header(data, pos)
+        if frame is not None:
+            info = _vbr_info(data, pos, frame)
+            if info is not None:
+                return info
+            # Ohne VBR-Header: Folge-Frame muss passen (kein Zufalls-Sync)
+            follow = _parse_frame_header(data, pos + frame.length)
+            if (
+                follow is not None
+                and follow.version == frame.version
+                and follow.sample_rate == frame.sample_rate
+            ):
+                content = file_size - (base + pos)
+                return 8 * content / float(frame.bitrate), frame.bitrate, frame.sample_rate
+        pos = data.find(b"\xff", pos + 1)
+    return None
+
+
+def _vbr_info(data: bytes, pos: int, frame: _FrameHeader) -> tuple[float, int, int] | None:
+    """Xing/Info- oder VBRI-Header im ersten Frame (wie mutagen ausgewertet)."""
+    xing = pos + _xing_offset(frame)
+    if data[xing:xing + 4] in (b"Xing", b"Info") and len(data) >= xing + 8:
+        flags = int.from_bytes(data[xing + 4:xing + 8], "big")
+        cursor = xing + 8
+        frames = total_bytes = -1
+        if flags & _XING_FRAMES:
+            frames = int.from_bytes(data[cursor:cursor + 4], "big")
+            cursor += 4
+        if flags & _XING_BYTES:
+            total_bytes = int.from_bytes(data[cursor:cursor + 4], "big")
+            cursor += 4
+        if flags & _XING_TOC:
+            cursor += 100
+        if flags & _XING_SCALE:
+            cursor += 4
+        if len(data) < cursor:
+            return None
+        if frames == -1:
+            return None  # mutagen schaetzt dann ueber die Dateigroesse
+        samples = frame.samples * frames
+        bitrate = frame.bitrate
+        if total_bytes != -1 and samples > 0:
+            audio_bytes = max(0, total_bytes - frame.length)
+            bitrate = int(round(audio_bytes * 8 * frame.sample_rate / float(samples)))
+        delay = _lame_delay(data, cursor)
+        if delay is not None:
+            samples = max(0, samples - delay)
+        return samples / frame.sample_rate, bitrate, frame.sample_rate
+
+    vbri = pos + 36
+    if data[vbri:vbri + 4] == b"VBRI" and len(data) >= vbri + _VBRI.size:
+        _, version, _, _, total_bytes, frames, toc_entries, _, entry_size, _ = (
+            _VBRI.unpack_from(data, vbri)
+        )
+        toc_end = vbri + _VBRI.size + toc_entries * entry_size
+        if version != 1 or entry_size not in (2, 4) or len(data) < toc_end:
+            return None
+        length = frame.samples * frames / frame.sample_rate
+        bitrate = int(total_bytes * 8 / length) if length else frame.bitrate
+        return length, bitrate, frame.sample_rate
+    return None
+
+
+def read_mp3_info(path: Path, file_size: int | None = None) -> Mp3Info | None:
+    """Liest Tags und Stream-Daten einer MP3-Datei ohne mutagen.
+
+    Args:
+        path: MP3-Datei
+        file_size: Bekannte Dateigroesse (spart ein seek ans Ende bei CBR)
+
+    Returns:
+        None, wenn der schnelle Pfad die Datei nicht sicher versteht.
+    """
+    try:
+        with open(path, "rb") as f:
+            tags: dict[str, str] = {}
+            audio_start = _read_id3v2(f, tags)
+            if audio_start is None:
+                return None
+            f.seek(audio_start)
+            data = f.read(_SYNC_WINDOW)
+            if file_size is None or file_size <= 0:
+                file_size = f.seek(0, 2)
+            stream = _stream_info(data, audio_start, file_size)
+            if stream is None:
+                return None
+            if len(tags) < 3:
+                _read_id3v1(f, tags)
+    except OSError:
+        return None
+    duration, bitrate, sample_rate = stream
+    return Mp3Info(
+        duration_seconds=duration,
+        bitrate=bitrate,
+        sample_rate=sample_rate,
+        title=tags.get("title", ""),
+        artist=tags.get("artist", ""),
+        album=tags.get("album", ""),
+    )
@@ -0,0 +1,224 @@
+"""Memory-Mapping fuer unkomprimierte PCM-Dateien (WAV/RF64, AIFF/AIFC).
+
+Der Header wird einmal geparst, der Daten-Chunk per mmap eingeblendet.
+Samples werden als Zero-Copy-Sichten (memoryview) direkt aus dem Mapping
+gelesen; der Speicherbedarf ist damit unabhaengig von der Dateigroesse.
+Unterstuetzt wird 16-bit PCM; alles andere liefert None (Decoder-Pfad).
+"""
+from __future__ import annotations
+
+import array
+import logging
+import mmap
+import struct
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+logger = logging.getLogger(__name__)
+
+MAPPABLE_EXTENSIONS = {".wav", ".wave", ".aif", ".aiff", ".aifc"}
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Frames pro Chunk beim sequentiellen Lesen (Timeline, Pegel)
+_CHUNK_FRAMES = 65536
+
+_NATIVE_BIG = sys.byteorder == "big"
+
+
+def _parse_extended(data: bytes) -> float:
+    """80-bit IEEE Extended (AIFF-Sample-Rate) -> float."""
+    exponent: int
+    mantissa: int
+    exponent, mantissa = struct.unpack(">HQ", data)
+    sign = -1.0 if exponent & 0x8000 else 1.0
+    exponent &= 0x7FFF
+    if exponent == 0 and mantissa == 0:
+        return 0.0
+    return sign * mantissa * 2.0 ** (exponent - 16383 - 63)
+
+
+def _iter_chunks(f: BinaryIO, start: int, end: int, big_endian: bool) -> Iterator[tuple[bytes, int, int]]:
+    """Liefert (Chunk-ID, Daten-Offset, Groesse) fuer alle Chunks in [start, end)."""
+    fmt = ">4sI" if big_endian else "<4sI"
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        chunk_id, size = struct.unpack(fmt, header)
+        yield chunk_id, pos + 8, size
+        pos += 8 + size + (size & 1)
+
+
+def _parse_riff(f: BinaryIO, file_size: int) -> tuple[int, int, int, int, bool] | None:
+    """WAV/RF64: (Daten-Offset, Daten-Bytes, Sample-Rate, Kanaele, big_endian)."""
+    magic = f.read(12)
+    if len(magic) < 12 or magic[:4] not in (b"RIFF", b"RF64") or magic[8:12] != b"WAVE":
+        return None
+
+    ds64_data_size: int | None = None
+    fmt: tuple[int, int, int] | None = None
+    for chunk_id, offset, size in _iter_chunks(f, 12, file_size, big_endian=False):
+        if chunk_id == b"ds64":
+            f.seek(offset)
+            ds64 = f.read(24)
+            if len(ds64) == 24:
+                ds64_data_size = struct.unpack("<QQQ", ds64)[1]
+        elif chunk_id == b"fmt ":
+            f.seek(offset)
+            raw = f.read(min(size, 40))
+            if len(raw) < 16:
+                return None
+            audio_format, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", raw)
+            if audio_format == _WAVE_FORMAT_EXTENSIBLE and len(raw) >= 26:
+                audio_format = struct.unpack_from("<H", raw, 24)[0]
+            if audio_format != _WAVE_FORMAT_PCM or bits != 16 or channels < 1:
+                return None
+            fmt = (sample_rate, channels, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            if size == 0xFFFFFFFF and ds64_data_size is not None:
+                size = ds64_data_size
+            elif size in (0, 0xFFFFFFFF):
+                # Nicht finalisierte Aufnahme: Daten reichen bis zum Dateiende
+                size = file_size - offset
+            size = min(size, file_size - offset)
+            return offset, size, fmt[0], fmt[1], False
+    return None
+
+
+def _parse_aiff(f: BinaryIO, file_size: int) -> tuple[int, int, int, int, bool] | None:
+    """AIFF/AIFC: (Daten-Offset, Daten-Bytes, Sample-Rate, Kanaele, big_endian)."""
+    magic = f.read(12)
+    if len(magic) < 12 or magic[:4] != b"FORM" or magic[8:12] not in (b"AIFF", b"AIFC"):
+        return None
+
+    comm: tuple[int, int, int, bool] | None = None
+    for chunk_id, offset, size in _iter_chunks(f, 12, file_size, big_endian=True):
+        if chunk_id == b"COMM":
+            f.seek(offset)
+            raw = f.read(min(size, 22))
+            if len(raw) < 18:
+                return None
+            channels, frames, bits = struct.unpack_from(">hIh", raw)
+            sample_rate = int(round(_parse_extended(raw[8:18])))
+            big_endian = True
+            if magic[8:12] == b"AIFC" and len(raw) >= 22:
+                compression = raw[18:22]
+                if compression == b"sowt":
+                    big_endian = False
+                elif compression not in (b"NONE", b"twos"):
+                    return None
+            if bits != 16 or channels < 1 or sample_rate <= 0:
+                return None
+            comm = (channels, frames, sample_rate, big_endian)
+        elif chunk_id == b"SSND":
+            if comm is None:
+                return None
+            f.seek(offset)
+            data_offset = struct.unpack(">I", f.read(4))[0]
+            start = offset + 8 + data_offset
+            channels, frames, sample_rate, big_endian = comm
+            size = min(frames * channels * 2, size - 8 - data_offset, file_size - start)
+            return start, size, sample_rate, channels, big_endian
+    return None
+
+
+class MappedPcm:
+    """Per mmap eingeblendete 16-bit-PCM-Daten einer WAV/AIFF-Datei.
+
+    Lesezugriffe liefern interleaved int16 in nativer Byte-Reihenfolge: als
+    Zero-Copy-memoryview, bei fremder Byte-Reihenfolge (AIFF) als Kopie
+    nur des angefragten Ausschnitts.
+    """
+
+    def __init__(
+        self,
+        mm: mmap.mmap,
+        offset: int,
+        size: int,
+        sample_rate: int,
+        channels: int,
+        swap: bool,
+    ) -> None:
+        self._mm = mm
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frames = size // (2 * channels)
+        self._swap = swap
+        end = offset + self.frames * 2 * channels
+        self._view: memoryview | None = memoryview(mm)[offset:end].cast("h")
+
+    @classmethod
+    def open(cls, path: Path) -> MappedPcm | None:
+        """Parst den Header und blendet den Daten-Chunk ein.
+
+        Returns:
+            None wenn die Datei kein unkomprimiertes 16-bit PCM enthaelt
+            oder nicht gelesen werden kann.
+        """
+        if path.suffix.lower() not in MAPPABLE_EXTENSIONS:
+            return None
+        try:
+            with open(path, "rb") as f:
+                file_size = f.seek(0, 2)
+                f.seek(0)
+                head = f.read(4)
+                f.seek(0)
+                if head == b"FORM":
+                    info = _parse_aiff(f, file_size)
+                else:
+                    info = _parse_riff(f, file_size)
+                if info is None:
+                    return None
+                offset, size, sample_rate, channels, big_endian = info
+                if size < 2 * channels or sample_rate <= 0:
+                    return None
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, struct.error):
+            logger.debug("PCM-Mapping fehlgeschlagen: %s", path, exc_info=True)
+            return None
+        return cls(mm, offset, size, sample_rate, channels, big_endian != _NATIVE_BIG)
+
+    def read(self, start_frame: int, frame_count: int) -> Buffer:
+        """Interleaved Samples fuer [start_frame, start_frame + frame_count)."""
+        view = self._view
+        if view is None:
+            return array.array("h")
+        start = max(0, min(start_frame, self.frames)) * self.channels
+        end = max(0, min(start_frame + frame_count, self.frames)) * self.channels
+        try:
+            part = view[start:end]
+        except ValueError:
+            # Parallel freigegeben (Trackwechsel)
+            return array.array("h")
+        if not self._swap:
+            return part
+        swapped = array.array("h", part)
+        swapped.byteswap()
+        return swapped
+
+    def chunks(self, frames_per_chunk: int = _CHUNK_FRAMES) -> Iterator[Buffer]:
+        """Sequentielles Lesen in Chunks (fuer Timeline/Pegel in einem Durchlauf)."""
+        for start in range(0, self.frames, frames_per_chunk):
+            yield self.read(start, frames_per_chunk)
+
+    def close(self) -> None:
+        """Gibt das Mapping frei (sobald keine Sichten mehr existieren)."""
+        view, self._view = self._view, None
+        try:
+            if view is not None:
+                view.release()
+            self._mm.close()
+        except BufferError:
+            # Noch exportierte Sichten (laufender Worker): GC schliesst spaeter
+            pass
@@ -0,0 +1,184 @@
+"""Disk-Cache fuer gerendertes PCM (SID per sidplayfp, Tracker-Module).
+
+Renders sind fuer Datei + Parameter (Subtune, Dauer, Sample-Rate)
+deterministisch und werden deshalb einmal abgelegt. Das PCM wird in
+Bloecken fester Frame-Anzahl gespeichert, optional einzeln per zlib
+komprimiert; ein Offset-Index erlaubt das Dekomprimieren nur des Blocks,
+in den ein Seek faellt.
+"""
+from __future__ import annotations
+
+import array
+import logging
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .disk_cache import DiskCache, file_key
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+logger = logging.getLogger(__name__)
+
+# Frames pro Block (~1.5 s bei 44.1 kHz) = Seek-Granularitaet beim Dekomprimieren
+BLOCK_FRAMES = 65536
+
+# Magic, Version, Kanaele, komprimiert, Sample-Rate, Frames, Frames pro Block
+_HEADER = struct.Struct("<4sHBBIQI")
+_MAGIC = b"RARN"
+_VERSION = 1
+
+# zlib-Stufe: schnell genug fuer das Schreiben nach jedem Render
+_ZLIB_LEVEL = 1
+
+
+class RenderedPcm:
+    """Gecachtes PCM (interleaved int16) mit blockweisem Zugriff.
+
+    Bietet dieselbe Lese-Schnittstelle wie ein laufender Render
+    (channels, sample_rate, chunks(), close()), ist aber sofort komplett.
+    Mehrere Leser (Player, Spektrum) duerfen parallel chunks() iterieren:
+    jeder Iterator haelt seinen dekomprimierten Block selbst.
+    """
+
+    def __init__(
+        self,
+        blob: bytes,
+        channels: int,
+        sample_rate: int,
+        frames: int,
+        block_frames: int,
+        compressed: bool,
+        offsets: array.array[int],
+        data_start: int,
+    ) -> None:
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.frames = frames
+        self._blob = blob
+        self._block_bytes = block_frames * channels * 2
+        self._compressed = compressed
+        self._offsets = offsets
+        self._data_start = data_start
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> RenderedPcm | None:
+        """Parst einen Cache-Eintrag. None bei fremden/defekten Daten."""
+        if len(blob) < _HEADER.size:
+            return None
+        magic, version, channels, compressed, sample_rate, frames, block_frames = (
+            _HEADER.unpack_from(blob)
+        )
+        if magic != _MAGIC or version != _VERSION or channels == 0 or block_frames == 0:
+            return None
+        blocks = -(-frames // block_frames)
+        index_end = _HEADER.size + (blocks + 1) * 8
+        if len(blob) < index_end:
+            return None
+        offsets = array.array("Q")
+        offsets.frombytes(blob[_HEADER.size:index_end])
+        if offsets[-1] != len(blob) - index_end:
+            return None
+        return cls(
+            blob, channels, sample_rate, frames, block_frames,
+            bool(compressed), offsets, index_end,
+        )
+
+    @staticmethod
+    def to_bytes(
+        pcm: Buffer,
+        channels: int,
+        sample_rate: int,
+        compress: bool = True,
+        block_frames: int = BLOCK_FRAMES,
+    ) -> bytes:
+        """Serialisiert PCM blockweise (jeder Block einzeln komprimiert)."""
+        view = memoryview(pcm).cast("B")
+        block_bytes = block_frames * channels * 2
+        frames = len(view) // (channels * 2)
+        parts: list[bytes] = []
+        offsets = array.array("Q", [0])
+        for start in range(0, frames * channels * 2, block_bytes):
+            block = bytes(view[start:min(start + block_bytes, frames * channels * 2)])
+            if compress:
+                block = zlib.compress(block, _ZLIB_LEVEL)
+            parts.append(block)
+            offsets.append(offsets[-1] + len(block))
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, channels, int(compress), sample_rate, frames, block_frames,
+        )
+        return header + offsets.tobytes() + b"".join(parts)
+
+    def _block(self, blob: bytes, offsets: array.array[int], index: int) -> bytes | memoryview:
+        """Block index (dekomprimiert); kein gemeinsamer Zustand zwischen Lesern."""
+        start = self._data_start + offsets[index]
+        end = self._data_start + offsets[index + 1]
+        data = memoryview(blob)[start:end]
+        return zlib.decompress(data) if self._compressed else data
+
+    def chunks(self, start: int) -> Iterator[memoryview]:
+        """PCM ab Byte-Offset start, blockweise als Sicht auf den Block (ohne Kopie).
+
+        Jeder Block wird pro Iterator genau einmal dekomprimiert.
+        """
+        blob, offsets = self._blob, self._offsets
+        index, offset = divmod(max(0, start), self._block_bytes)
+        while index < len(offsets) - 1:
+            data = self._block(blob, offsets, index)
+            if offset < len(data):
+                yield memoryview(data)[offset:]
+            offset = 0
+            index += 1
+
+    def close(self) -> None:
+        """Gibt die Daten frei (Schnittstelle wie ein laufender Render)."""
+        self._blob = b""
+        self._offsets = array.array("Q", [0])
+
+
+class RenderCache:
+    """Groessenbegrenzter Cache fuer gerendertes PCM.
+
+    Schluessel sind Content-Hashes der Quelldatei plus Render-Parameter,
+    damit umbenannte oder verschobene Module weiter getroffen werden.
+
+    Args:
+        cache: Disk-Cache fuer die Eintraege.
+        compress: Bloecke per zlib komprimieren.
+    """
+
+    def __init__(self, cache: DiskCache, compress: bool = True) -> None:
+        self._cache = cache
+        self._compress = compress
+
+    @staticmethod
+    def key(path: Path, **params: object) -> str | None:
+        """Cache-Schluessel fuer eine Datei und ihre Render-Parameter."""
+        extra = ",".join(f"{name}={params[name]}" for name in sorted(params))
+        return file_key(path, extra=f"render-v{_VERSION}|{extra}", content_hash=True)
+
+    def get(self, key: str | None) -> RenderedPcm | None:
+        """Gecachter Render oder None."""
+        if key is None:
+            return None
+        blob = self._cache.get(key)
+        if blob is None:
+            return None
+        rendered = RenderedPcm.from_bytes(blob)
+        if rendered is None:
+            logger.debug("Ungueltiger Render-Cache-Eintrag: %s", key)
+        return rendered
+
+    def put(self, key: str | None, pcm: Buffer, channels: int, sample_rate: int) -> None:
+        """Legt einen vollstaendigen Render ab (blocking)."""
+        if key is None or channels <= 0:
+            return
+        try:
+            blob = RenderedPcm.to_bytes(pcm, channels, sample_rate, compress=self._compress)
+        except (ValueError, TypeError, zlib.error):
+            logger.debug("Render konnte nicht serialisiert werden", exc_info=True)
+            return
+        self._cache.put(key, blob)
@@ -16,6 +16,20 @@ _DEFAULTS: dict[str, object] = {
     "volume": 0.8,
     "last_path": "",
     "music_library": "",
+    "spectrum_cache_mb": 64,
+    "spectrum_cache_content_hash": False,
+    "spectrum_latency_budget_ms": 8.0,
+    # "pygame" (SDL_mixer) oder "miniaudio" (Streaming, sample-genaue Position)
+    "audio_backend": "pygame",
+    # Gerenderte SID-/Tracker-Daten (zlib-komprimierte Bloecke)
+    "render_cache_mb": 256,
+    "render_cache_compress": True,
+    # Pfad zur HVSC-Songlengths.md5 ("" = in der Musik-Bibliothek suchen)
+    "hvsc_songlengths": "",
+    # Metadaten in ~/.retro-amp/library.db zwischenspeichern
+    "library_index": True,
+    # Parallele Tag-Reader beim Ordner-Scan (1 = sequentiell)
+    "scan_workers": 8,
 }
 
 
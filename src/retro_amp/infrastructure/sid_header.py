@@ -0,0 +1,65 @@
+"""PSID/RSID-Header von SID-Dateien lesen.
+
+Ein Lesevorgang liefert alle Felder, die Metadaten, Songlengths-Lookup
+und Playback brauchen (Anzahl Songs, Start-Song, Name, Autor, Released).
+"""
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+# Magic, Version, Data-Offset, Load/Init/Play-Adresse, Songs, Start-Song, Speed,
+# danach Name, Autor, Released (je 32 Bytes ASCII, null-padded)
+_HEADER = struct.Struct(">4sHHHHHHHI32s32s32s")
+_MAGICS = (b"PSID", b"RSID")
+
+
+def _text(raw: bytes) -> str:
+    return raw.decode("ascii", errors="replace").strip("\x00").strip()
+
+
+@dataclass(frozen=True)
+class SidHeader:
+    """Felder des PSID/RSID-Headers (Subtunes 1-basiert wie im Header)."""
+
+    magic: str
+    version: int
+    songs: int
+    start_song: int
+    name: str
+    author: str
+    released: str
+
+    @property
+    def is_multi_tune(self) -> bool:
+        return self.songs > 1
+
+
+def parse_sid_header(data: bytes) -> SidHeader | None:
+    """Parst die ersten 0x76 Bytes einer SID-Datei. None wenn kein PSID/RSID."""
+    if len(data) < _HEADER.size:
+        return None
+    (magic, version, _, _, _, _, songs, start_song, _,
+     name, author, released) = _HEADER.unpack_from(data)
+    if magic not in _MAGICS:
+        return None
+    songs = max(1, songs)
+    return SidHeader(
+        magic=magic.decode("ascii"),
+        version=version,
+        songs=songs,
+        start_song=start_song if 1 <= start_song <= songs else 1,
+        name=_text(name),
+        author=_text(author),
+        released=_text(released),
+    )
+
+
+def read_sid_header(path: Path) -> SidHeader | None:
+    """Liest den Header einer SID-Datei. None bei Fehler oder fremdem Format."""
+    try:
+        with open(path, "rb") as f:
+            return parse_sid_header(f.read(_HEADER.size))
+    except OSError:
+        return None
@@ -0,0 +1,254 @@
+"""HVSC-Songlengths-Datenbank: exakte Spieldauern fuer SID-Dateien.
+
+Die Songlengths.md5 der High Voltage SID Collection ordnet dem MD5 jeder
+SID-Datei die Laengen aller Subtunes zu ("m:ss" oder "m:ss.mmm"). Die
+Textdatei wird einmal in einen kompakten Index geparst (sortierte
+16-Byte-Digests plus Millisekunden als uint32) und im Disk-Cache abgelegt;
+ein Lookup ist eine binaere Suche. Die MD5s der SID-Dateien werden erst bei
+Bedarf berechnet und ebenfalls gecacht (Schluessel: Pfad + Groesse + mtime).
+"""
+from __future__ import annotations
+
+import array
+import hashlib
+import logging
+import re
+import struct
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from .disk_cache import DiskCache, file_key
+from .sid_header import read_sid_header
+
+logger = logging.getLogger(__name__)
+
+# Index: Magic, Version, Anzahl Eintraege; danach Digests, Start-Offsets, Laengen
+_HEADER = struct.Struct("<4sHI")
+_MAGIC = b"RASL"
+_VERSION = 1
+_DIGEST_SIZE = 16
+
+# Cache-Eintrag fuer die MD5s der SID-Dateien (20 Byte Dateischluessel + 16 Byte MD5)
+_HASHES_KEY = "sid-md5-v1"
+_HASH_ENTRY = 20 + _DIGEST_SIZE
+_HASH_FLUSH_EVERY = 5000  # neue Hashes bis zum Zwischenspeichern
+
+# "1:23", "1:23.456", optional mit Attribut wie "(G)" dahinter
+_TIME = re.compile(r"(\d+):(\d{1,2})(?:\.(\d{1,3}))?")
+_ENTRY = re.compile(r"^([0-9a-fA-F]{32})\s*=\s*(.+)$")
+
+# Typische Lage in einem HVSC-Baum
+_CANDIDATES = (
+    Path("DOCUMENTS") / "Songlengths.md5",
+    Path("C64Music") / "DOCUMENTS" / "Songlengths.md5",
+)
+
+
+def _millis(minutes: str, seconds: str, fraction: str) -> int:
+    return (int(minutes) * 60 + int(seconds)) * 1000 + int((fraction or "0").ljust(3, "0"))
+
+
+def parse_time(text: str) -> int | None:
+    """Wandelt "m:ss[.mmm]" in Millisekunden um. None wenn kein Zeitwert."""
+    m = _TIME.match(text.strip())
+    return _millis(*m.groups()) if m else None
+
+
+def find_songlengths(root: Path) -> Path | None:
+    """Sucht die Songlengths.md5 unterhalb eines HVSC-Ordners."""
+    for candidate in _CANDIDATES:
+        path = root / candidate
+        if path.is_file():
+            return path
+    return None
+
+
+def build_index(lines: Iterable[str]) -> bytes:
+    """Parst Songlengths.md5-Zeilen in den kompakten Binaer-Index."""
+    entries: dict[bytes, list[int]] = {}
+    for line in lines:
+        m = _ENTRY.match(line.strip())
+        if not m:
+            continue
+        millis = [_millis(*groups) for groups in _TIME.findall(m.group(2))]
+        if millis:
+            entries[bytes.fromhex(m.group(1))] = millis
+
+    digests = sorted(entries)
+    starts = array.array("I", [0])
+    lengths = array.array("I")
+    for digest in digests:
+        lengths.extend(entries[digest])
+        starts.append(len(lengths))
+    return (
+        _HEADER.pack(_MAGIC, _VERSION, len(digests))
+        + b"".join(digests)
+        + starts.tobytes()
+        + lengths.tobytes()
+    )
+
+
+class SonglengthsIndex:
+    """Lookup der Subtune-Laengen einer SID-Datei ueber ihren MD5.
+
+    Thread-sicher; der Index wird beim ersten Zugriff geladen bzw. gebaut.
+
+    Args:
+        database: Pfad zur Songlengths.md5
+        cache: Optionaler Disk-Cache fuer Index und Datei-Hashes. Ohne
+            Cache wird die Datenbank bei jedem Start neu geparst.
+    """
+
+    def __init__(self, database: Path, cache: DiskCache | None = None) -> None:
+        self._database = database
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._count = 0
+        self._digests = b""
+        self._starts = array.array("I")
+        self._lengths = array.array("I")
+        # Dateischluessel -> MD5 (beides binaer), None = noch nicht geladen
+        self._hashes: dict[bytes, bytes] | None = None
+        self._new_hashes = 0
+
+    @property
+    def database(self) -> Path:
+        return self._database
+
+    def _load(self) -> None:
+        """Laedt den Index aus dem Cache oder parst die Datenbank (einmalig)."""
+        self._loaded = True
+        key = file_key(self._database, extra=f"songlengths-v{_VERSION}")
+        if key is None:
+            logger.warning("Songlengths-Datenbank nicht lesbar: %s", self._database)
+            return
+        blob = self._cache.get(key) if self._cache is not None else None
+        if blob is None or not self._parse(blob):
+            try:
+                with open(self._database, encoding="latin-1") as f:
+                    blob = build_index(f)
+            except OSError:
+                logger.warning("Songlengths-Datenbank nicht lesbar: %s", self._database)
+                return
+            self._parse(blob)
+            if self._cache is not None:
+                self._cache.put(key, blob)
+        logger.debug("Songlengths: %d Eintraege aus %s", self._count, self._database)
+
+    def _parse(self, blob: bytes) -> bool:
+        if len(blob) < _HEADER.size:
+            return False
+        magic, version, count = _HEADER.unpack_from(blob)
+        if magic != _MAGIC or version != _VERSION:
+            return False
+        digests_end = _HEADER.size + count * _DIGEST_SIZE
+        starts_end = digests_end + (count + 1) * 4
+        if len(blob) < starts_end:
+            return False
+        starts = array.array("I")
+        starts.frombytes(blob[digests_end:starts_end])
+        lengths = array.array("I")
+        lengths.frombytes(blob[starts_end:])
+        if starts[-1] != len(lengths):
+            return False
+        self._count = count
+        self._digests = blob[_HEADER.size:digests_end]
+        self._starts = starts
+        self._lengths = lengths
+        return True
+
+    def _find(self, digest: bytes) -> int:
+        """Binaere Suche ueber die sortierten Digests. -1 wenn nicht gefunden."""
+        lo, hi = 0, self._count
+        digests = self._digests
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = digests[mid * _DIGEST_SIZE:(mid + 1) * _DIGEST_SIZE]
+            if probe < digest:
+                lo = mid + 1
+            elif probe > digest:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def lengths(self, md5: str) -> tuple[float, ...]:
+        """Subtune-Laengen in Sekunden fuer einen MD5 (hex). Leer wenn unbekannt."""
+        try:
+            digest = bytes.fromhex(md5)
+        except ValueError:
+            return ()
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            index = self._find(digest)
+            if index < 0:
+                return ()
+            return tuple(
+                ms / 1000.0
+                for ms in self._lengths[self._starts[index]:self._starts[index + 1]]
+            )
+
+    def lengths_for(self, path: Path) -> tuple[float, ...]:
+        """Subtune-Laengen einer SID-Datei (MD5 ueber die ganze Datei)."""
+        md5 = self._file_md5(path)
+        return self.lengths(md5) if md5 is not None else ()
+
+    def length_for(self, path: Path, subtune: int = 0) -> float | None:
+        """Laenge eines Subtunes (1-basiert, 0 = Start-Song laut Header)."""
+        lengths = self.lengths_for(path)
+        if not lengths:
+            return None
+        song = subtune
+        if not song:
+            header = read_sid_header(path)
+            song = header.start_song if header is not None else 1
+        return lengths[song - 1] if 0 < song <= len(lengths) else None
+
+    def _file_md5(self, path: Path) -> str | None:
+        """MD5 einer SID-Datei, gecacht ueber Pfad + Groesse + mtime."""
+        key = file_key(path)
+        if key is None:
+            return None
+        file_id = bytes.fromhex(key)
+        with self._lock:
+            if self._hashes is None:
+                self._hashes = self._load_hashes()
+            hashes = self._hashes
+            cached = hashes.get(file_id)
+        if cached is not None:
+            return cached.hex()
+
+        try:
+            digest = hashlib.md5(path.read_bytes()).digest()
+        except OSError:
+            return None
+        with self._lock:
+            hashes[file_id] = digest
+            self._new_hashes += 1
+            flush = self._new_hashes >= _HASH_FLUSH_EVERY
+        if flush:
+            self.save()
+        return digest.hex()
+
+    def _load_hashes(self) -> dict[bytes, bytes]:
+        blob = self._cache.get(_HASHES_KEY) if self._cache is not None else None
+        if not blob or len(blob) % _HASH_ENTRY:
+            return {}
+        return {
+            blob[pos:pos + 20]: blob[pos + 20:pos + _HASH_ENTRY]
+            for pos in range(0, len(blob), _HASH_ENTRY)
+        }
+
+    def save(self) -> None:
+        """Schreibt neu berechnete Datei-Hashes in den Cache."""
+        if self._cache is None:
+            return
+        with self._lock:
+            if self._hashes is None or not self._new_hashes:
+                return
+            blob = b"".join(file_id + md5 for file_id, md5 in self._hashes.items())
+            self._new_hashes = 0
+        self._cache.put(_HASHES_KEY, blob)
@@ -1,15 +1,52 @@
-"""Spectrum-Analyzer — FFT-basierte Frequenzanalyse fuer Visualizer."""
+"""Spectrum-Analyzer — FFT-basierte Frequenzanalyse fuer Visualizer.
+
+Ist NumPy installiert, laufen Fensterung, FFT, Magnituden und Band-Mittelung
+vektorisiert. Ohne NumPy wird die stdlib-FFT verwendet (gleiche Ergebnisse).
+"""
 from __future__ import annotations
 
 import array
 import cmath
+import ctypes
 import logging
 import math
+import operator
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterator
+from itertools import repeat
 from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
 
 import pygame
 import pygame.mixer
 
+from .audio_player import (
+    DecodedAudio,
+    PcmBytesOpener,
+    _is_opus,
+    _opus_pcm,
+    frame_aligned,
+    sid_duration,
+    sid_render_key,
+)
+from .disk_cache import DiskCache, file_key
+from .level_meter import ChannelLevels, LevelIndex, LevelIndexBuilder
+from .pcm_map import MappedPcm
+from .render_cache import RenderCache
+from .songlengths import SonglengthsIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:  # optional — stdlib-Fallback
+    np = None  # type: ignore[assignment]
+    _HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
 # Konstanten
@@ -19,6 +56,40 @@ MIN_FREQ = 20.0
 MAX_FREQ = 18000.0
 DB_FLOOR = -60.0  # Untergrenze in dB
 
+# Live-Analyse: waehlbare FFT-Groessen (klein = schneller, aber groeber im
+# Bass) und Grenzen fuer die vom Visualizer angefragte Bandzahl
+FFT_SIZES = (512, 1024, 2048)
+MIN_BANDS = 1
+MAX_BANDS = 256
+_CALIBRATION_ROUNDS = 3  # Messlaeufe pro FFT-Groesse fuers Latenzbudget
+
+# Vorberechnete Timeline: ein Band-Satz pro Hop (~1/50 s), quantisiert auf uint8
+TIMELINE_HOPS_PER_SECOND = 50
+_TIMELINE_CHUNK = 256  # Frames pro NumPy-Batch (begrenzt den Speicherbedarf)
+_INV_255 = 1.0 / 255.0
+
+# Formate, die pygame komplett rendert (Ergebnis landet im Render-Cache)
+_TRACKER_EXTENSIONS = frozenset({".mod", ".xm", ".s3m"})
+
+# Streaming-Modus: grosse Dateien werden nicht komplett dekodiert, sondern
+# nur ein begrenzter Ring um die Abspielposition gehalten
+STREAMING_MIN_BYTES = 48 * 1024 * 1024
+_RING_SECONDS = 4.0  # Ringgroesse (Mono-Samples) um die Abspielposition
+_RESYNC_GAP_SECONDS = 1.0  # Sprung nach vorne ab dem neu synchronisiert wird
+_STREAM_CHUNK_FRAMES = 4096
+
+# Oeffnet einen Mono-PCM-Stream (int16) ab einem Frame-Index
+PcmStreamOpener = Callable[[int], Iterator["array.array[int]"]]
+
+# Pegelanzeige: Standard-Fenster vor der Abspielposition
+LEVEL_WINDOW_SECONDS = 0.1
+
+# Cache-Format: Magic, Version, Sample-Rate, Hop, Baender, Frames;
+# danach Timeline und (optional) serialisierter Pegel-Index
+_CACHE_HEADER = struct.Struct("<4sHIIHI")
+_CACHE_MAGIC = b"RASP"
+_CACHE_VERSION = 2
+
 
 def _fft(x: list[complex]) -> list[complex]:
     """Iterative Cooley-Tukey Radix-2 FFT (stdlib only)."""
@@ -55,87 +126,906 @@ def _fft(x: list[complex]) -> list[complex]:
     return result
 
 
+class _FFTPlan:
+    """Wiederverwendbarer FFT-Plan fuer reelle Eingaben fester Laenge (stdlib).
+
+    Bit-Reversal-Permutation und Twiddle-Faktoren werden einmal berechnet.
+    Das reelle Signal der Laenge n wird als komplexes Signal der Laenge n/2
+    gepackt (gerade Samples = Realteil, ungerade = Imaginaerteil), per
+    halb so grosser FFT transformiert und danach wieder aufgespalten.
+    Arbeits- und Ergebnislisten sind vorab allokiert und werden wiederverwendet.
+    """
+
+    def __init__(self, n: int) -> None:
+        if n < 4 or n & (n - 1):
+            raise ValueError(f"FFT-Groesse muss eine Zweierpotenz >= 4 sein: {n}")
+        m = n // 2
+        bits = m.bit_length() - 1
+        self.size = n
+        self._m = m
+
+        # Bit-Reversal als (Ziel, Quelle-gerade, Quelle-ungerade)-Tabelle
+        self._perm = [
+            (int(format(i, f"0{bits}b")[::-1], 2) if bits else 0, 2 * i, 2 * i + 1)
+            for i in range(m)
+        ]
+
+        # Butterfly-Stufen ab size=4 (size=2 hat nur den Faktor 1)
+        twiddles = [cmath.exp(-2j * math.pi * k / m) for k in range(m // 2)]
+        self._stages: list[tuple[int, int, list[tuple[complex, range]]]] = []
+        size = 4
+        while size <= m:
+            half = size // 2
+            step = m // size
+            groups = [(twiddles[k * step], range(k, m, size)) for k in range(half)]
+            self._stages.append((size, half, groups))
+            size *= 2
+
+        # Aufspaltung des gepackten Spektrums: X[k] = E[k] + W^k * O[k]
+        self._split = [-0.5j * cmath.exp(-2j * math.pi * k / n) for k in range(m)]
+        self._buf: list[complex] = [0j] * m
+        self._mags: list[float] = [0.0] * m
+
+    def magnitudes(self, samples: array.array[int], window: list[float]) -> list[float]:
+        """|X[k]| fuer k < n/2 von samples * window, skaliert mit 2/n.
+
+        Die zurueckgegebene Liste wird beim naechsten Aufruf ueberschrieben.
+        """
+        buf = self._buf
+        m = self._m
+        for dst, even, odd in self._perm:
+            buf[dst] = complex(samples[even] * window[even], samples[odd] * window[odd])
+
+        # Erste Stufe (Twiddle = 1)
+        for i in range(0, m - 1, 2):
+            a = buf[i]
+            b = buf[i + 1]
+            buf[i] = a + b
+            buf[i + 1] = a - b
+
+        for _size, half, groups in self._stages:
+            for w, starts in groups:
+                for i in starts:
+                    j = i + half
+                    t = w * buf[j]
+                    a = buf[i]
+                    buf[i] = a + t
+                    buf[j] = a - t
+
+        mags = self._mags
+        split = self._split
+        scale = 1.0 / m
+        z0 = buf[0]
+        mags[0] = abs(z0.real + z0.imag) * scale
+        for k in range(1, m):
+            zk = buf[k]
+            zc = buf[m - k].conjugate()
+            mags[k] = abs(0.5 * (zk + zc) + split[k] * (zk - zc)) * scale
+        return mags
+
+
+def _int16_view(raw: Buffer) -> memoryview:
+    """Zero-Copy-Sicht auf beliebige PCM-Puffer als signed 16-bit Samples."""
+    view = memoryview(raw)
+    if view.format == "h" and view.ndim == 1:
+        return view
+    view = view.cast("B")
+    return view[:len(view) - len(view) % 2].cast("h")
+
+
+def _mix_to_mono(raw: Buffer, channels: int) -> array.array[int]:
+    """Mischt interleaved Stereo-PCM zu Mono (Mittelwert beider Kanaele).
+
+    Arbeitet auf Zero-Copy-Sichten des Eingangspuffers: mit NumPy als
+    Array-Operation, sonst ueber strided memoryviews und map() (ohne
+    Python-Schleife pro Sample). Ergebnis wie (links + rechts) // 2.
+    """
+    samples = _int16_view(raw)
+    mono = array.array("h")
+    if channels < 2 or len(samples) < 2:
+        if isinstance(raw, array.array) and raw.typecode == "h":
+            return raw
+        mono.frombytes(samples.cast("B"))
+        return mono
+
+    if _HAS_NUMPY:
+        data = np.frombuffer(samples, dtype=np.int16)
+        frames = data[:len(data) - len(data) % channels].reshape(-1, channels)
+        mixed = (frames[:, 0].astype(np.int32) + frames[:, 1]) >> 1
+        mono.frombytes(memoryview(mixed.astype(np.int16)).cast("B"))
+        return mono
+
+    mono.extend(map(
+        operator.rshift,
+        map(operator.add, samples[0::channels], samples[1::channels]),
+        repeat(1),
+    ))
+    return mono
+
+
+def _miniaudio_stream(path: Path) -> PcmStreamOpener:
+    """Mono-Stream per miniaudio (MP3, FLAC, Vorbis, WAV); miniaudio mischt selbst."""
+    import miniaudio
+
+    def _open(start_frame: int) -> Iterator[array.array[int]]:
+        stream: Iterator[array.array[int]] = miniaudio.stream_file(
+            str(path),
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=1,
+            sample_rate=44100,
+            frames_to_read=_STREAM_CHUNK_FRAMES,
+            seek_frame=start_frame,
+        )
+        return stream
+
+    return _open
+
+
+def _opus_stream(path: Path) -> PcmStreamOpener:
+    """Mono-Stream per pyogg (Seek-Verhalten siehe audio_player._opus_pcm)."""
+
+    def _open(start_frame: int) -> Iterator[array.array[int]]:
+        channels, _, open_pcm = _opus_pcm(path)
+        chunks = open_pcm(start_frame)
+        try:
+            for data in chunks:
+                chunk = array.array("h")
+                chunk.frombytes(data)
+                yield _mix_to_mono(chunk, channels)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    return _open
+
+
+def _pcm_bytes_stream(channels: int, chunks: PcmBytesOpener) -> PcmStreamOpener:
+    """Mono-Stream ueber interleaved int16-Bytes (gecachter oder laufender Render)."""
+    frame_bytes = channels * 2
+
+    def _open(start_frame: int) -> Iterator[array.array[int]]:
+        for data in frame_aligned(chunks(start_frame * frame_bytes), frame_bytes):
+            yield _mix_to_mono(data, channels)
+
+    return _open
+
+
+def pcm_stream_source(path: Path) -> tuple[PcmStreamOpener, int] | None:
+    """Mono-Stream-Opener und Sample-Rate fuer eine Datei.
+
+    Returns:
+        None fuer Formate ohne Streaming-Decoder (Tracker, SID).
+    """
+    ext = path.suffix.lower()
+    if ext in {".ogg", ".oga", ".opus"} and _is_opus(path):
+        return _opus_stream(path), 48000
+    if ext in {".mp3", ".flac", ".ogg", ".oga", ".wav"}:
+        return _miniaudio_stream(path), 44100
+    return None
+
+
+class MonoSink(Protocol):
+    """Empfaenger des Mono-PCM aus dem Analyse-Durchlauf (z.B. Wellenform)."""
+
+    def feed(self, mono: array.array[int]) -> None: ...
+
+    def finish(self) -> None:
+        """Durchlauf vollstaendig (wird bei Abbruch nicht aufgerufen)."""
+        ...
+
+
+class _WindowSource(Protocol):
+    """Quelle fuer Live-Fenster (Streaming-Ring oder mmap)."""
+
+    def total_samples(self) -> int | None: ...
+
+    def window(self, start: int, size: int = FFT_SIZE) -> array.array[int]: ...
+
+    def close(self) -> None: ...
+
+
+class _StreamingPcm:
+    """Begrenzter Ring dekodierter Mono-Samples um die Abspielposition.
+
+    Liest beim Abspielen nur so weit voraus wie fuer das naechste FFT-Fenster
+    noetig und verwirft alles, was mehr als _RING_SECONDS zurueckliegt.
+    Rueckwaerts-Seeks und groessere Spruenge oeffnen den Stream neu.
+    """
+
+    def __init__(self, opener: PcmStreamOpener, sample_rate: int) -> None:
+        self._opener = opener
+        self._capacity = max(FFT_SIZE * 2, int(_RING_SECONDS * sample_rate))
+        self._resync_gap = int(_RESYNC_GAP_SECONDS * sample_rate)
+        self._buf = array.array("h")
+        self._start = 0
+        self._chunks: Iterator[array.array[int]] | None = None
+        self._eof = False
+        self._lock = threading.Lock()
+
+    @property
+    def buffered_samples(self) -> int:
+        return len(self._buf)
+
+    def total_samples(self) -> int | None:
+        """Gesamtlaenge, sobald das Stream-Ende erreicht wurde."""
+        return self._start + len(self._buf) if self._eof else None
+
+    def window(self, start: int, size: int = FFT_SIZE) -> array.array[int]:
+        """Liefert size Samples ab start (mit Nullen aufgefuellt)."""
+        end = start + size
+        with self._lock:
+            buf_end = self._start + len(self._buf)
+            if self._chunks is None or start < self._start or start > buf_end + self._resync_gap:
+                self._resync(start)
+                buf_end = self._start
+
+            while buf_end < end and not self._eof:
+                try:
+                    chunk = next(self._chunks)  # type: ignore[arg-type]
+                except StopIteration:
+                    self._eof = True
+                    break
+                self._buf.extend(chunk)
+                buf_end += len(chunk)
+
+            # Ring begrenzen: nur Samples vor dem aktuellen Fenster verwerfen
+            excess = len(self._buf) - self._capacity
+            if excess > 0:
+                drop = min(excess, start - self._start)
+                if drop > 0:
+                    del self._buf[:drop]
+                    self._start += drop
+
+            offset = start - self._start
+            window = self._buf[offset:offset + size]
+
+        if len(window) < size:
+            window.extend([0] * (size - len(window)))
+        return window
+
+    def _resync(self, start: int) -> None:
+        """Oeffnet den Stream an einer neuen Position (Seek)."""
+        self._close_stream()
+        self._start = max(0, start)
+        self._buf = array.array("h")
+        self._eof = False
+        self._chunks = self._opener(self._start)
+
+    def _close_stream(self) -> None:
+        if self._chunks is not None:
+            close = getattr(self._chunks, "close", None)
+            if close is not None:
+                close()
+            self._chunks = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_stream()
+            self._buf = array.array("h")
+
+
+class _MappedSource:
+    """Live-Fenster direkt aus einer per mmap eingeblendeten PCM-Datei.
+
+    Gemischt wird nur das angefragte Fenster; die Datei selbst wird nie
+    komplett gelesen.
+    """
+
+    def __init__(self, pcm: MappedPcm) -> None:
+        self._pcm = pcm
+
+    def total_samples(self) -> int | None:
+        return self._pcm.frames
+
+    def window(self, start: int, size: int = FFT_SIZE) -> array.array[int]:
+        """Liefert size Mono-Samples ab start (mit Nullen aufgefuellt)."""
+        window = _mix_to_mono(self._pcm.read(start, size), self._pcm.channels)
+        if len(window) < size:
+            window.extend([0] * (size - len(window)))
+        return window
+
+    def close(self) -> None:
+        self._pcm.close()
+
+
+class _TimelineBuilder:
+    """Berechnet das Spektrogramm inkrementell aus Mono-Chunks.
+
+    Haelt nur die Samples, die fuer noch offene Fenster gebraucht werden,
+    damit auch ein Streaming-Durchlauf mit konstantem Speicher auskommt.
+    """
+
+    def __init__(self, analyzer: SpectrumAnalyzer, hop: int) -> None:
+        self._analyzer = analyzer
+        self._hop = hop
+        # Zentrierte Fenster: Frame k deckt [k*hop - FFT/2, k*hop + FFT/2) ab
+        self._pending = array.array("h", [0] * (FFT_SIZE // 2))
+        self._total = 0
+        self._rows = bytearray()
+
+    @property
+    def frames(self) -> int:
+        return len(self._rows) // NUM_BANDS
+
+    def feed(self, mono: array.array[int]) -> None:
+        """Haengt Samples an und berechnet alle vollstaendigen Fenster."""
+        self._pending.extend(mono)
+        self._total += len(mono)
+        self._emit(None)
+
+    def finish(self) -> bytes:
+        """Schliesst die Berechnung ab (Ende mit Nullen aufgefuellt)."""
+        total_frames = (self._total + self._hop - 1) // self._hop
+        self._pending.extend([0] * FFT_SIZE)
+        self._emit(total_frames - self.frames)
+        return bytes(self._rows)
+
+    def _emit(self, limit: int | None) -> None:
+        available = len(self._pending) - FFT_SIZE
+        if available < 0:
+            return
+        count = available // self._hop + 1
+        if limit is not None:
+            count = min(count, limit)
+        if count <= 0:
+            return
+        self._rows += self._analyzer._timeline_rows(self._pending, count, self._hop)
+        del self._pending[:count * self._hop]
+
+
+class _BandLayout:
+    """Band-Grenzen und Fenster fuer eine (Sample-Rate, Baender, FFT)-Kombination."""
+
+    def __init__(
+        self,
+        bins: list[tuple[int, int]],
+        fft_size: int,
+        use_numpy: bool,
+    ) -> None:
+        self.bins = bins
+        self.num_bands = len(bins)
+        self.fft_size = fft_size
+
+        # Hann-Fenster inkl. int16-Normierung
+        self.hann_scaled = [
+            0.5 * (1.0 - math.cos(2.0 * math.pi * i / (fft_size - 1))) / 32768.0
+            for i in range(fft_size)
+        ]
+
+        # NumPy-Tabellen (Fenster, Band-Grenzen fuer Prefix-Summen)
+        if use_numpy:
+            self.hann_np = np.asarray(self.hann_scaled, dtype=np.float64)
+            self.lo_np = np.array([lo for lo, _ in bins], dtype=np.intp)
+            self.hi_np = np.array([hi for _, hi in bins], dtype=np.intp)
+            self.count_np = (self.hi_np - self.lo_np + 1).astype(np.float64)
+
+
+def _resample_bands(values: list[float], count: int) -> list[float]:
+    """Interpoliert Band-Werte linear auf count Baender."""
+    n = len(values)
+    if count == n or n == 0:
+        return values
+    if n == 1 or count == 1:
+        return [sum(values) / n] * count
+    scale = (n - 1) / (count - 1)
+    out: list[float] = []
+    for j in range(count):
+        x = j * scale
+        i = min(int(x), n - 2)
+        lo = values[i]
+        out.append(lo + (values[i + 1] - lo) * (x - i))
+    return out
+
+
 class SpectrumAnalyzer:
     """Analysiert Audio-PCM-Daten und liefert Frequenzband-Werte.
 
     Laedt Audio via pygame.mixer.Sound (separater Pfad von der Wiedergabe),
     extrahiert PCM-Rohdaten und berechnet per FFT die Frequenzverteilung.
+
+    Args:
+        use_numpy: NumPy-Backend erzwingen (True), abschalten (False)
+            oder automatisch waehlen wenn installiert (None).
+        cache: Optionaler Disk-Cache fuer berechnete Timelines. Bei einem
+            Treffer wird die Datei gar nicht erst dekodiert.
+        content_hash: Cache-Schluessel aus dem Dateiinhalt statt aus
+            Pfad + Groesse + mtime bilden.
+        stream_min_bytes: Dateien ab dieser Groesse werden gestreamt statt
+            komplett dekodiert (konstanter Speicherbedarf).
+        latency_budget_ms: Zeitbudget pro Live-Frame. Gesetzt wird einmalig
+            gemessen und die groesste FFT aus FFT_SIZES gewaehlt, die ins
+            Budget passt; None = immer FFT_SIZE.
+        render_cache: Optionaler Cache fuer gerenderte SID-/Tracker-Daten.
+            Treffer werden gestreamt, Tracker-Decodes dort abgelegt.
+        songlengths: Optionale HVSC-Songlengths (SID-Dauer im Render-Schluessel).
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        use_numpy: bool | None = None,
+        cache: DiskCache | None = None,
+        content_hash: bool = False,
+        stream_min_bytes: int = STREAMING_MIN_BYTES,
+        latency_budget_ms: float | None = None,
+        render_cache: RenderCache | None = None,
+        songlengths: SonglengthsIndex | None = None,
+    ) -> None:
         self._pcm: array.array[int] | None = None
+        self._stream: _WindowSource | None = None
+        self._stream_min_bytes = stream_min_bytes
         self._sample_rate: int = 44100
         self._channels: int = 2
         self._ready = False
+        self._generation = 0
 
-        # Hann-Fenster vorberechnen
-        self._hann = [
-            0.5 * (1.0 - math.cos(2.0 * math.pi * i / (FFT_SIZE - 1)))
-            for i in range(FFT_SIZE)
-        ]
+        # Vorberechnete Timeline (NUM_BANDS Bytes pro Hop), None = live FFT
+        self._timeline: bytes | None = None
+        self._timeline_hop: int = 0
+        self._timeline_frames: int = 0
+
+        # Pegel-Index (RMS/Spitze in O(1)), None = nicht verfuegbar
+        self._levels: LevelIndex | None = None
+        self._cache = cache
+        self._content_hash = content_hash
+        self._render_cache = render_cache
+        self._songlengths = songlengths
+        self._use_numpy = _HAS_NUMPY if use_numpy is None else (use_numpy and _HAS_NUMPY)
+
+        # Band-Layouts je (Sample-Rate, Baender, FFT-Groesse), FFT-Plaene je Groesse
+        self._layouts: dict[tuple[int, int, int], _BandLayout] = {}
+        self._plans: dict[int, _FFTPlan] = {}
+
+        # Live-FFT-Groesse: fest oder lazy per Latenzbudget gemessen
+        self._latency_budget_ms = latency_budget_ms
+        self._fft_size: int | None = None if latency_budget_ms is not None else FFT_SIZE
+
+    @property
+    def uses_numpy(self) -> bool:
+        """True wenn das vektorisierte NumPy-Backend aktiv ist."""
+        return self._use_numpy
+
+    @property
+    def fft_size(self) -> int:
+        """FFT-Groesse der Live-Analyse (beim ersten Zugriff kalibriert)."""
+        if self._fft_size is None:
+            self._fft_size = self._pick_fft_size()
+        return self._fft_size
 
-        # Log-skalierte Band-Grenzen (Bin-Indices)
-        self._band_bins: list[tuple[int, int]] = []
-        self._compute_band_bins(self._sample_rate)
+    def _pick_fft_size(self) -> int:
+        """Waehlt die groesste FFT-Groesse, deren Live-Frame ins Budget passt."""
+        budget = self._latency_budget_ms or 0.0
+        chosen = FFT_SIZES[0]
+        for size in FFT_SIZES:
+            layout = self._layout(NUM_BANDS, size)
+            window = array.array("h", bytes(2 * size))
+            started = time.perf_counter()
+            for _ in range(_CALIBRATION_ROUNDS):
+                self._analyze(window, layout)
+            elapsed_ms = (time.perf_counter() - started) * 1000.0 / _CALIBRATION_ROUNDS
+            if elapsed_ms > budget:
+                break
+            chosen = size
+        logger.debug("Spektrum: FFT-Groesse %d (Budget %.1f ms)", chosen, budget)
+        return chosen
 
-    def _compute_band_bins(self, sample_rate: int) -> None:
+    @staticmethod
+    def _compute_band_bins(
+        sample_rate: int,
+        num_bands: int = NUM_BANDS,
+        fft_size: int = FFT_SIZE,
+    ) -> list[tuple[int, int]]:
         """Berechnet die FFT-Bin-Grenzen fuer log-skalierte Baender."""
         nyquist = sample_rate / 2.0
         max_freq = min(MAX_FREQ, nyquist)
-        half_fft = FFT_SIZE // 2
-
-        self._band_bins = []
-        for i in range(NUM_BANDS):
-            lo = MIN_FREQ * (max_freq / MIN_FREQ) ** (i / NUM_BANDS)
-            hi = MIN_FREQ * (max_freq / MIN_FREQ) ** ((i + 1) / NUM_BANDS)
-            lo_bin = max(1, int(lo * FFT_SIZE / sample_rate))
-            hi_bin = min(half_fft - 1, int(hi * FFT_SIZE / sample_rate))
+        half_fft = fft_size // 2
+
+        bins: list[tuple[int, int]] = []
+        for i in range(num_bands):
+            lo = MIN_FREQ * (max_freq / MIN_FREQ) ** (i / num_bands)
+            hi = MIN_FREQ * (max_freq / MIN_FREQ) ** ((i + 1) / num_bands)
+            lo_bin = max(1, int(lo * fft_size / sample_rate))
+            hi_bin = min(half_fft - 1, int(hi * fft_size / sample_rate))
             if hi_bin < lo_bin:
                 hi_bin = lo_bin
-            self._band_bins.append((lo_bin, hi_bin))
+            bins.append((lo_bin, hi_bin))
+        return bins
+
+    def _layout(self, num_bands: int, fft_size: int) -> _BandLayout:
+        """Band-Layout fuer die aktuelle Sample-Rate (einmal berechnet, dann gecacht)."""
+        key = (self._sample_rate, num_bands, fft_size)
+        layout = self._layouts.get(key)
+        if layout is None:
+            bins = self._compute_band_bins(self._sample_rate, num_bands, fft_size)
+            layout = _BandLayout(bins, fft_size, self._use_numpy)
+            self._layouts[key] = layout
+        return layout
+
+    def _plan_for(self, fft_size: int) -> _FFTPlan:
+        plan = self._plans.get(fft_size)
+        if plan is None:
+            plan = self._plans[fft_size] = _FFTPlan(fft_size)
+        return plan
 
-    def load(self, path: Path) -> None:
+    def load(
+        self,
+        path: Path,
+        precompute: bool | None = None,
+        subtune: int = 0,
+        shared: DecodedAudio | None = None,
+        sink: MonoSink | None = None,
+    ) -> None:
         """Laedt PCM-Daten einer Audio-Datei (blocking, in Worker aufrufen).
 
         Nutzt einen separaten Dekodierungspfad (nicht pygame.mixer.Sound),
         um Konflikte mit dem laufenden Music-Stream zu vermeiden.
+
+        Args:
+            path: Audio-Datei
+            precompute: Spektrogramm-Timeline vorberechnen. None = nur mit
+                NumPy (der stdlib-Pfad waere dafuer zu langsam).
+            subtune: SID-Song (Render-Cache-Schluessel), 0 = Standard
+            shared: PCM, das der Player bereits dekodiert (SID-Render, laufend
+                oder aus dem Render-Cache); wird mitgelesen statt ein zweites
+                Mal gerendert bzw. geladen.
+            sink: Bekommt das Mono-PCM des Dekodier-Durchlaufs mit (ohne
+                eigenes Dekodieren). Bei einem Timeline-Cache-Treffer gibt
+                es keinen Durchlauf; finish() bleibt dann aus.
         """
-        self._ready = False
-        self._pcm = None
+        self._reset()
+        generation = self._generation
+        if precompute is None:
+            precompute = self._use_numpy
+
+        # Cache-Treffer: Timeline laden, keine Dekodierung noetig
+        cache_key = self._cache_key(path, subtune)
+        if cache_key is not None and self._load_cached(cache_key, generation):
+            return
+
+        # PCM des Players mitlesen (auch dessen Render aus dem Render-Cache,
+        # statt ihn ein zweites Mal zu laden). Eine Timeline nur bei fertigem
+        # Render cachen: einen laufenden Render kann der Player beim
+        # Trackwechsel mitten im Durchlauf schliessen (gilt auch fuer sink).
+        if shared is not None and (shared.path, shared.subtune) == (path, subtune):
+            self._load_streaming(
+                _pcm_bytes_stream(shared.channels, shared.chunks),
+                shared.sample_rate, generation, precompute,
+                cache_key if shared.complete else None,
+                sink if shared.complete else None,
+            )
+            return
+
+        # SID/Tracker: fertiger Render aus dem Render-Cache
+        render_key = self._render_key(path, subtune)
+        if self._render_cache is not None and render_key is not None:
+            rendered = self._render_cache.get(render_key)
+            if rendered is not None:
+                self._load_streaming(
+                    _pcm_bytes_stream(rendered.channels, rendered.chunks),
+                    rendered.sample_rate, generation, precompute, cache_key, sink,
+                )
+                return
+
+        # Unkomprimiertes WAV/AIFF: Daten-Chunk einblenden statt einlesen
+        mapped = MappedPcm.open(path)
+        if mapped is not None:
+            self._load_mapped(mapped, generation, precompute, cache_key, sink)
+            return
+
+        # Grosse Dateien: Ring-Puffer statt komplettem PCM im Speicher
+        source = self._stream_source(path)
+        if source is not None:
+            self._load_streaming(source[0], source[1], generation, precompute, cache_key, sink)
+            return
 
         try:
             raw, sample_rate, channels = self._decode_to_pcm(path)
             if raw is None:
                 return
+            if self._render_cache is not None and path.suffix.lower() in _TRACKER_EXTENSIONS:
+                self._render_cache.put(render_key, raw, channels, sample_rate)
+            self._ingest(raw, sample_rate, channels)
+        except Exception:
+            logger.debug("Spectrum-Daten konnten nicht geladen werden", exc_info=True)
+            self._pcm = None
+            self._ready = False
+            return
+        del raw
+        if sink is not None and self._pcm is not None and generation == self._generation:
+            sink.feed(self._pcm)
+            sink.finish()
 
-            self._sample_rate = sample_rate
-            self._channels = channels
-            self._compute_band_bins(self._sample_rate)
-
-            # Raw-Bytes in signed 16-bit Array
-            pcm = array.array("h")
-            pcm.frombytes(raw)
+        # Bis die Timeline fertig ist, liefert get_bands live per FFT
+        if precompute:
+            self._build_timeline(generation)
+            if cache_key is not None:
+                self._store_cached(cache_key, generation)
 
-            # Stereo zu Mono mischen
-            if channels == 2 and len(pcm) >= 2:
-                mono = array.array("h")
-                for j in range(0, len(pcm) - 1, 2):
-                    mono.append((pcm[j] + pcm[j + 1]) // 2)
-                self._pcm = mono
-            else:
-                self._pcm = pcm
+    def load_pcm(
+        self,
+        samples: Buffer,
+        sample_rate: int,
+        channels: int,
+        precompute: bool | None = None,
+    ) -> None:
+        """Uebernimmt bereits dekodiertes PCM (interleaved int16, blocking).
 
-            self._ready = True
+        Akzeptiert jeden Puffer (bytes, array, memoryview, ctypes, NumPy);
+        gelesen wird ueber Zero-Copy-Sichten, kopiert wird nur das Mono-Ergebnis.
+        """
+        self._reset()
+        generation = self._generation
+        try:
+            self._ingest(samples, sample_rate, channels)
         except Exception:
-            logger.debug("Spectrum-Daten konnten nicht geladen werden", exc_info=True)
+            logger.debug("PCM konnte nicht uebernommen werden", exc_info=True)
             self._pcm = None
             self._ready = False
+            return
+        if self._use_numpy if precompute is None else precompute:
+            self._build_timeline(generation)
+
+    def _ingest(self, raw: Buffer, sample_rate: int, channels: int) -> None:
+        """Mischt PCM zu Mono und macht den Analyzer bereit.
+
+        Der Pegel-Index wird vorher aus dem Stereo-Signal gebaut.
+        """
+        self._set_sample_rate(sample_rate)
+        self._channels = channels
+        levels = LevelIndexBuilder(sample_rate, channels)
+        levels.feed(_int16_view(raw))
+        self._levels = levels.finish()
+        self._pcm = _mix_to_mono(raw, channels)
+        self._ready = True
+
+    def _reset(self) -> None:
+        """Verwirft alle Daten des vorherigen Tracks und laufende Berechnungen."""
+        self._generation += 1
+        self._ready = False
+        self._pcm = None
+        self._timeline = None
+        self._levels = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _set_sample_rate(self, sample_rate: int) -> None:
+        self._sample_rate = sample_rate
+
+    def _render_key(self, path: Path, subtune: int = 0) -> str | None:
+        """Render-Cache-Schluessel fuer SID/Tracker, sonst None."""
+        if self._render_cache is None:
+            return None
+        ext = path.suffix.lower()
+        if ext == ".sid":
+            duration = sid_duration(path, self._songlengths, subtune)
+            return sid_render_key(path, duration, subtune)
+        if ext in _TRACKER_EXTENSIONS:
+            init_info = pygame.mixer.get_init()
+            if not init_info:
+                return None
+            return RenderCache.key(
+                path, renderer="pygame", sample_rate=init_info[0], channels=init_info[2],
+            )
+        return None
+
+    def _stream_source(self, path: Path) -> tuple[PcmStreamOpener, int] | None:
+        """Streaming-Quelle fuer grosse Dateien, sonst None (komplett dekodieren)."""
+        try:
+            if path.stat().st_size < self._stream_min_bytes:
+                return None
+        except OSError:
+            return None
+        return pcm_stream_source(path)
+
+    def _load_streaming(
+        self,
+        opener: PcmStreamOpener,
+        sample_rate: int,
+        generation: int,
+        precompute: bool,
+        cache_key: str | None,
+        sink: MonoSink | None = None,
+    ) -> None:
+        """Streaming-Modus: Live-FFT aus dem Ring, Timeline und Pegel in einem Durchlauf."""
+        self._set_sample_rate(sample_rate)
+        self._channels = 1
+        self._stream = _StreamingPcm(opener, sample_rate)
+        self._ready = True
+        self._analysis_pass(opener(0), 1, generation, precompute, cache_key, sink)
 
-    def _decode_to_pcm(self, path: Path) -> tuple[bytes | None, int, int]:
+    def _load_mapped(
+        self,
+        mapped: MappedPcm,
+        generation: int,
+        precompute: bool,
+        cache_key: str | None,
+        sink: MonoSink | None = None,
+    ) -> None:
+        """Mapping-Modus: sofort bereit, Fenster und Durchlauf lesen aus dem mmap."""
+        self._set_sample_rate(mapped.sample_rate)
+        self._channels = mapped.channels
+        self._stream = _MappedSource(mapped)
+        self._ready = True
+        self._analysis_pass(
+            mapped.chunks(), mapped.channels, generation, precompute, cache_key, sink,
+        )
+
+    def _analysis_pass(
+        self,
+        chunks: Iterator[Buffer],
+        channels: int,
+        generation: int,
+        precompute: bool,
+        cache_key: str | None,
+        sink: MonoSink | None = None,
+    ) -> None:
+        """Ein sequentieller Durchlauf fuer Pegel-Index, (optional) Timeline und sink.
+
+        Laeuft auch ohne Timeline, damit der (billige) Pegel-Index fuer die
+        VU-Anzeige entsteht. Die Chunks sind interleaved int16.
+        """
+        hop = self._timeline_hop_for(self._sample_rate)
+        builder = _TimelineBuilder(self, hop) if precompute else None
+        levels = LevelIndexBuilder(self._sample_rate, channels)
+        try:
+            for chunk in chunks:
+                if generation != self._generation:
+                    return
+                levels.feed(_int16_view(chunk))
+                if builder is None and sink is None:
+                    continue
+                mono = _mix_to_mono(chunk, channels)
+                if builder is not None:
+                    builder.feed(mono)
+                if sink is not None:
+                    sink.feed(mono)
+            if generation == self._generation:
+                self._levels = levels.finish()
+                if sink is not None:
+                    sink.finish()
+            if builder is not None:
+                self._set_timeline(builder.finish(), hop, builder.frames, generation)
+        except Exception:
+            logger.debug("Analyse-Durchlauf fehlgeschlagen", exc_info=True)
+            return
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        if builder is not None and cache_key is not None:
+            self._store_cached(cache_key, generation)
+
+    def _cache_key(self, path: Path, subtune: int = 0) -> str | None:
+        """Cache-Schluessel inkl. aller Parameter, die die Timeline bestimmen.
+
+        Bei SID gehoeren Subtune und Render-Dauer dazu (wie im Render-Cache).
+        """
+        if self._cache is None:
+            return None
+        params = f"spectrum-v{_CACHE_VERSION}-{FFT_SIZE}-{NUM_BANDS}-{TIMELINE_HOPS_PER_SECOND}"
+        if path.suffix.lower() == ".sid":
+            duration = sid_duration(path, self._songlengths, subtune)
+            params += f"-sid-{duration}-{subtune}"
+        return file_key(path, extra=params, content_hash=self._content_hash)
+
+    def _load_cached(self, key: str, generation: int) -> bool:
+        """Uebernimmt eine Timeline aus dem Cache. True bei Treffer."""
+        if self._cache is None:
+            return False
+        blob = self._cache.get(key)
+        if blob is None or len(blob) < _CACHE_HEADER.size:
+            return False
+        magic, version, sample_rate, hop, bands, frames = _CACHE_HEADER.unpack_from(blob)
+        end = _CACHE_HEADER.size + frames * bands
+        if (
+            magic != _CACHE_MAGIC
+            or version != _CACHE_VERSION
+            or bands != NUM_BANDS
+            or hop <= 0
+            or len(blob) < end
+            or generation != self._generation
+        ):
+            return False
+
+        self._sample_rate = sample_rate
+        self._timeline_hop = hop
+        self._timeline_frames = frames
+        self._timeline = blob[_CACHE_HEADER.size:end]
+        self._levels = LevelIndex.from_bytes(blob[end:])
+        self._ready = True
+        return True
+
+    def _store_cached(self, key: str, generation: int) -> None:
+        """Schreibt die fertige Timeline in den Cache."""
+        timeline = self._timeline
+        if self._cache is None or timeline is None or generation != self._generation:
+            return
+        header = _CACHE_HEADER.pack(
+            _CACHE_MAGIC, _CACHE_VERSION, self._sample_rate,
+            self._timeline_hop, NUM_BANDS, self._timeline_frames,
+        )
+        levels = self._levels
+        self._cache.put(key, header + timeline + (levels.to_bytes() if levels else b""))
+
+    @staticmethod
+    def _timeline_hop_for(sample_rate: int) -> int:
+        return max(1, round(sample_rate / TIMELINE_HOPS_PER_SECOND))
+
+    def _build_timeline(self, generation: int) -> None:
+        """Berechnet das komplette Spektrogramm einmalig (im Worker-Thread).
+
+        Bricht ab sobald ein neuer Track geladen wird (Generation geaendert).
+        """
+        pcm = self._pcm
+        if pcm is None:
+            return
+        hop = self._timeline_hop_for(self._sample_rate)
+        builder = _TimelineBuilder(self, hop)
+        step = hop * _TIMELINE_CHUNK
+
+        try:
+            for offset in range(0, len(pcm), step):
+                if generation != self._generation:
+                    return
+                builder.feed(pcm[offset:offset + step])
+            data = builder.finish()
+        except Exception:
+            logger.debug("Spektrogramm konnte nicht berechnet werden", exc_info=True)
+            return
+        self._set_timeline(data, hop, builder.frames, generation)
+
+    def _set_timeline(self, data: bytes, hop: int, frames: int, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._timeline_hop = hop
+        self._timeline_frames = frames
+        self._timeline = data
+
+    def _timeline_rows(self, samples: array.array[int], count: int, hop: int) -> bytes:
+        """Quantisierte Band-Zeilen fuer count Fenster ab samples[0] im Abstand hop."""
+        layout = self._layout(NUM_BANDS, FFT_SIZE)
+        if self._use_numpy:
+            return self._timeline_rows_numpy(samples, count, hop, layout)
+        out = bytearray()
+        for k in range(count):
+            bands = self._bands_stdlib(samples[k * hop:k * hop + FFT_SIZE], layout)
+            out += bytes(int(v * 255.0 + 0.5) for v in bands)
+        return bytes(out)
+
+    def _timeline_rows_numpy(
+        self,
+        samples: array.array[int],
+        count: int,
+        hop: int,
+        layout: _BandLayout,
+    ) -> bytes:
+        """Wie _timeline_rows, vektorisiert in Batches von _TIMELINE_CHUNK Fenstern."""
+        half = FFT_SIZE // 2
+        view = np.frombuffer(samples, dtype=np.int16)[:(count - 1) * hop + FFT_SIZE]
+        windows = np.lib.stride_tricks.sliding_window_view(view, FFT_SIZE)[::hop]
+        out = np.empty((count, NUM_BANDS), dtype=np.uint8)
+
+        for first in range(0, count, _TIMELINE_CHUNK):
+            batch = windows[first:first + _TIMELINE_CHUNK]
+            windowed = batch * layout.hann_np
+            magnitudes = np.abs(np.fft.rfft(windowed, axis=1)[:, :half]) / half
+            normalized = self._normalize_numpy(magnitudes, layout)
+            out[first:first + len(batch)] = np.rint(normalized * 255.0)
+        return out.tobytes()
+
+    @property
+    def has_timeline(self) -> bool:
+        """True wenn das vorberechnete Spektrogramm verfuegbar ist."""
+        return self._timeline is not None
+
+    def _decode_to_pcm(self, path: Path) -> tuple[Buffer | None, int, int]:
         """Dekodiert Audio zu PCM ohne pygame.mixer.Sound zu verwenden.
 
+        Die Decoder liefern ihre eigenen Puffer (kein bytes()-Kopieren).
+
         Returns:
-            (raw_bytes, sample_rate, channels) oder (None, 0, 0) bei Fehler.
+            (pcm_buffer, sample_rate, channels) oder (None, 0, 0) bei Fehler.
         """
         ext = path.suffix.lower()
 
@@ -154,7 +1044,7 @@ class SpectrumAnalyzer:
         # Tracker (MOD/S3M/XM): Fallback auf pygame.mixer.Sound
         return self._decode_via_pygame(path)
 
-    def _decode_wav(self, path: Path) -> tuple[bytes | None, int, int]:
+    def _decode_wav(self, path: Path) -> tuple[Buffer | None, int, int]:
         """Dekodiert WAV direkt per wave-Modul."""
         import wave
         try:
@@ -166,9 +1056,8 @@ class SpectrumAnalyzer:
         except Exception:
             return None, 0, 0
 
-    def _decode_ogg(self, path: Path) -> tuple[bytes | None, int, int]:
-        """Dekodiert OGG/Opus per pyogg."""
-        import ctypes
+    def _decode_ogg(self, path: Path) -> tuple[Buffer | None, int, int]:
+        """Dekodiert OGG/Opus per pyogg (Puffer des Decoders, ohne Kopie)."""
         try:
             # Erst Opus versuchen
             try:
@@ -177,7 +1066,7 @@ class SpectrumAnalyzer:
                 raw = ctypes.cast(
                     opus.buffer,
                     ctypes.POINTER(ctypes.c_char * opus.buffer_length),
-                ).contents.raw
+                ).contents
                 return raw, opus.frequency, opus.channels
             except Exception:
                 pass
@@ -189,7 +1078,7 @@ class SpectrumAnalyzer:
                 raw = ctypes.cast(
                     vorbis.buffer,
                     ctypes.POINTER(ctypes.c_char * vorbis.buffer_length),
-                ).contents.raw
+                ).contents
                 return raw, vorbis.frequency, vorbis.channels
             except Exception:
                 pass
@@ -199,7 +1088,7 @@ class SpectrumAnalyzer:
         except Exception:
             return None, 0, 0
 
-    def _decode_via_miniaudio(self, path: Path) -> tuple[bytes | None, int, int]:
+    def _decode_via_miniaudio(self, path: Path) -> tuple[Buffer | None, int, int]:
         """Dekodiert MP3/FLAC per miniaudio (kein Konflikt mit pygame Music-Stream)."""
         try:
             import miniaudio
@@ -210,14 +1099,13 @@ class SpectrumAnalyzer:
                 nchannels=2,
                 sample_rate=44100,
             )
-            # decoded.samples ist ein array von interleaved int16
-            raw = bytes(decoded.samples)
-            return raw, decoded.sample_rate, decoded.nchannels
+            # decoded.samples ist bereits ein array von interleaved int16
+            return decoded.samples, decoded.sample_rate, decoded.nchannels
         except Exception:
             logger.debug("miniaudio-Dekodierung fehlgeschlagen: %s", path, exc_info=True)
             return None, 0, 0
 
-    def _decode_via_pygame(self, path: Path) -> tuple[bytes | None, int, int]:
+    def _decode_via_pygame(self, path: Path) -> tuple[Buffer | None, int, int]:
         """Fallback-Dekodierung per pygame.mixer.Sound.
 
         Wartet kurz damit der Music-Stream nicht gestoert wird.
@@ -242,57 +1130,122 @@ class SpectrumAnalyzer:
 
     def unload(self) -> None:
         """Gibt PCM-Daten frei."""
-        self._ready = False
-        self._pcm = None
+        self._reset()
 
     @property
     def is_ready(self) -> bool:
         return self._ready
 
-    def get_bands(self, position_seconds: float) -> list[float]:
+    def get_bands(self, position_seconds: float, num_bands: int = NUM_BANDS) -> list[float]:
         """Berechnet normalisierte Band-Werte (0.0–1.0) fuer eine Position.
 
+        Args:
+            position_seconds: Abspielposition
+            num_bands: Anzahl Baender (z.B. so viele wie der Visualizer
+                Spalten hat). Die Live-FFT rechnet direkt mit passendem
+                Band-Layout. Die Timeline (NUM_BANDS Baender) dient nur bis
+                NUM_BANDS; fuer mehr Baender rechnet die Live-FFT, und nur
+                ohne PCM (Timeline aus dem Cache) wird die Timeline interpoliert.
+
         Returns:
-            Liste mit NUM_BANDS float-Werten, oder leere Liste wenn nicht bereit.
+            Liste mit num_bands float-Werten, oder leere Liste wenn nicht bereit.
         """
-        if not self._ready or self._pcm is None:
+        num_bands = max(MIN_BANDS, min(MAX_BANDS, num_bands))
+        timeline = self._timeline
+        live = self._ready and (self._stream is not None or self._pcm is not None)
+        if timeline is not None and (num_bands <= NUM_BANDS or not live):
+            return _resample_bands(self._timeline_bands(timeline, position_seconds), num_bands)
+
+        stream = self._stream
+        if self._ready and stream is not None:
+            return self._stream_bands(stream, position_seconds, num_bands)
+
+        pcm = self._pcm
+        if not self._ready or pcm is None:
             return []
 
         # Sample-Index fuer Position
         sample_idx = int(position_seconds * self._sample_rate)
-        total_samples = len(self._pcm)
+        total_samples = len(pcm)
 
         if sample_idx < 0 or sample_idx >= total_samples:
-            return [0.0] * NUM_BANDS
+            return [0.0] * num_bands
 
         # Fenster extrahieren
-        start = max(0, sample_idx - FFT_SIZE // 2)
-        end = min(total_samples, start + FFT_SIZE)
-        if end - start < FFT_SIZE:
-            start = max(0, end - FFT_SIZE)
+        layout = self._layout(num_bands, self.fft_size)
+        size = layout.fft_size
+        start = max(0, sample_idx - size // 2)
+        end = min(total_samples, start + size)
+        if end - start < size:
+            start = max(0, end - size)
 
-        window = self._pcm[start:end]
+        window = pcm[start:end]
 
         # Padding falls noetig
-        if len(window) < FFT_SIZE:
-            window.extend([0] * (FFT_SIZE - len(window)))
+        if len(window) < size:
+            window.extend([0] * (size - len(window)))
 
-        # Hann-Fenster anwenden + in Complex umwandeln
-        windowed = [
-            complex(window[i] * self._hann[i] / 32768.0, 0.0)
-            for i in range(FFT_SIZE)
-        ]
+        return self._analyze(window, layout)
 
-        # FFT
-        spectrum = _fft(windowed)
+    def _stream_bands(
+        self,
+        stream: _WindowSource,
+        position_seconds: float,
+        num_bands: int,
+    ) -> list[float]:
+        """Live-FFT auf dem Ring-Puffer (Streaming) bzw. dem mmap (Mapping-Modus)."""
+        sample_idx = int(position_seconds * self._sample_rate)
+        total = stream.total_samples()
+        if sample_idx < 0 or (total is not None and sample_idx >= total):
+            return [0.0] * num_bands
+        layout = self._layout(num_bands, self.fft_size)
+        window = stream.window(max(0, sample_idx - layout.fft_size // 2), layout.fft_size)
+        return self._analyze(window, layout)
 
-        # Magnitude berechnen (nur positive Frequenzen)
-        half = FFT_SIZE // 2
-        magnitudes = [abs(spectrum[k]) / half for k in range(half)]
+    def get_levels(
+        self,
+        position_seconds: float,
+        window_seconds: float = LEVEL_WINDOW_SECONDS,
+    ) -> list[ChannelLevels]:
+        """RMS und Spitze (linear, 0.0–1.0) fuer das Fenster vor der Position.
+
+        Beantwortet aus dem beim Laden gebauten Pegel-Index in O(1);
+        guenstig genug fuer Abfragen mit hoher Bildrate.
+
+        Returns:
+            [links, rechts] (Mono doppelt), oder leere Liste wenn nicht bereit.
+        """
+        levels = self._levels
+        if levels is None:
+            return []
+        end = int(position_seconds * levels.sample_rate)
+        start = end - max(1, int(window_seconds * levels.sample_rate))
+        values = levels.levels(start, end)
+        if len(values) == 1:
+            return values * 2
+        return values
+
+    def _timeline_bands(self, timeline: bytes, position_seconds: float) -> list[float]:
+        """O(1)-Lookup im vorberechneten Spektrogramm."""
+        frame = round(position_seconds * self._sample_rate / self._timeline_hop)
+        if frame < 0 or frame >= self._timeline_frames:
+            return [0.0] * NUM_BANDS
+        offset = frame * NUM_BANDS
+        return [v * _INV_255 for v in timeline[offset:offset + NUM_BANDS]]
+
+    def _analyze(self, window: array.array[int], layout: _BandLayout) -> list[float]:
+        if self._use_numpy:
+            return self._bands_numpy(window, layout)
+        return self._bands_stdlib(window, layout)
+
+    def _bands_stdlib(self, window: array.array[int], layout: _BandLayout) -> list[float]:
+        """Band-Werte per stdlib-FFT (reines Python, vorberechneter FFT-Plan)."""
+        # Hann-Fenster + FFT + Magnituden (nur positive Frequenzen)
+        magnitudes = self._plan_for(layout.fft_size).magnitudes(window, layout.hann_scaled)
 
         # Band-Werte berechnen (Durchschnitt pro Band)
         bands: list[float] = []
-        for lo_bin, hi_bin in self._band_bins:
+        for lo_bin, hi_bin in layout.bins:
             if hi_bin >= lo_bin:
                 count = hi_bin - lo_bin + 1
                 avg = sum(magnitudes[lo_bin : hi_bin + 1]) / count
@@ -310,3 +1263,26 @@ class SpectrumAnalyzer:
             bands.append(normalized)
 
         return bands
+
+    def _bands_numpy(self, window: array.array[int], layout: _BandLayout) -> list[float]:
+        """Band-Werte vektorisiert per NumPy (reelle FFT, Prefix-Summen)."""
+        samples = np.frombuffer(window, dtype=np.int16).astype(np.float64)
+        windowed = samples * layout.hann_np
+
+        # Reelle FFT: liefert nur die positiven Frequenzen
+        half = layout.fft_size // 2
+        magnitudes = np.abs(np.fft.rfft(windowed)[:half]) / half
+        return self._normalize_numpy(magnitudes, layout).tolist()  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _normalize_numpy(magnitudes: np.ndarray, layout: _BandLayout) -> np.ndarray:
+        """Magnituden (letzte Achse = Bins) zu normalisierten Band-Werten."""
+        # Band-Mittelung ueber Prefix-Summen statt Python-Schleife
+        zeros = np.zeros(magnitudes.shape[:-1] + (1,), dtype=np.float64)
+        csum = np.concatenate((zeros, np.cumsum(magnitudes, axis=-1, dtype=np.float64)), axis=-1)
+        avg = (csum[..., layout.hi_np + 1] - csum[..., layout.lo_np]) / layout.count_np
+
+        # In dB umrechnen und normalisieren (DB_FLOOR..0 -> 0.0..1.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            db = np.where(avg > 0, 20.0 * np.log10(avg + 1e-10), DB_FLOOR)
+        return np.clip((db - DB_FLOOR) / (-DB_FLOOR), 0.0, 1.0)
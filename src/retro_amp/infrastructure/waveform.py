@@ -0,0 +1,196 @@
+"""Wellenform-Uebersicht (Min/Max je Spalte) fuer die Fortschrittsleiste.
+
+Die Uebersicht entsteht nebenbei im Analyse-Durchlauf des SpectrumAnalyzer
+(WaveformCollector als dessen MonoSink); nur ohne solchen Durchlauf wird
+die Datei hier selbst gestreamt. Gehalten werden nur Min/Max pro Block,
+nie das komplette PCM. Das Ergebnis ist klein (zwei Bytes pro Spalte) und
+wird wie die Spektrogramme im Disk-Cache abgelegt.
+"""
+from __future__ import annotations
+
+import array
+import logging
+import struct
+from collections.abc import Callable
+from pathlib import Path
+
+from .disk_cache import DiskCache, file_key
+from .spectrum import pcm_stream_source
+
+logger = logging.getLogger(__name__)
+
+# Aufloesung der Uebersicht (wird beim Zeichnen auf die Breite reduziert)
+WAVEFORM_COLUMNS = 512
+
+# Frames pro Min/Max-Block waehrend des Durchlaufs
+_BLOCK = 1024
+
+# Cache-Format: Magic, Version, Spalten; danach Min/Max als int8-Paare
+_CACHE_HEADER = struct.Struct("<4sHH")
+_CACHE_MAGIC = b"RAWF"
+_CACHE_VERSION = 1
+
+# Min/Max je Spalte, normiert auf -1.0..1.0
+Waveform = list[tuple[float, float]]
+
+
+class _WaveformBuilder:
+    """Sammelt Min/Max pro Block aus Mono-Chunks beliebiger Groesse."""
+
+    def __init__(self) -> None:
+        self._pending = array.array("h")
+        self._mins = array.array("h")
+        self._maxs = array.array("h")
+
+    def feed(self, mono: array.array[int]) -> None:
+        self._pending.extend(mono)
+        full = len(self._pending) - len(self._pending) % _BLOCK
+        for start in range(0, full, _BLOCK):
+            block = self._pending[start:start + _BLOCK]
+            self._mins.append(min(block))
+            self._maxs.append(max(block))
+        del self._pending[:full]
+
+    def finish(self, columns: int) -> Waveform:
+        """Fasst die Bloecke zu columns Spalten zusammen."""
+        if self._pending:
+            self._mins.append(min(self._pending))
+            self._maxs.append(max(self._pending))
+            self._pending = array.array("h")
+
+        blocks = len(self._mins)
+        if blocks == 0:
+            return []
+        result: Waveform = []
+        for col in range(columns):
+            lo = col * blocks // columns
+            hi = max(lo + 1, (col + 1) * blocks // columns)
+            result.append((min(self._mins[lo:hi]) / 32768.0, max(self._maxs[lo:hi]) / 32768.0))
+        return result
+
+
+class WaveformCollector:
+    """Baut eine Wellenform aus fremd dekodiertem Mono-PCM (MonoSink).
+
+    Nach finish() steht das Ergebnis in result und liegt im Cache; bleibt
+    finish() aus (Abbruch, kein Durchlauf), ist result None.
+    """
+
+    def __init__(self, columns: int, store: Callable[[Waveform], None] | None = None) -> None:
+        self._builder = _WaveformBuilder()
+        self._columns = columns
+        self._store = store
+        self.result: Waveform | None = None
+
+    def feed(self, mono: array.array[int]) -> None:
+        self._builder.feed(mono)
+
+    def finish(self) -> None:
+        self.result = self._builder.finish(self._columns)
+        if self._store is not None and self.result:
+            self._store(self.result)
+
+
+class WaveformAnalyzer:
+    """Berechnet und cached Wellenform-Uebersichten.
+
+    Args:
+        cache: Optionaler Disk-Cache (ein Eintrag pro Datei).
+        columns: Anzahl Spalten der Uebersicht.
+        content_hash: Cache-Schluessel aus dem Dateiinhalt bilden.
+    """
+
+    def __init__(
+        self,
+        cache: DiskCache | None = None,
+        columns: int = WAVEFORM_COLUMNS,
+        content_hash: bool = False,
+    ) -> None:
+        self._cache = cache
+        self._columns = columns
+        self._content_hash = content_hash
+
+    def _key(self, path: Path) -> str | None:
+        if self._cache is None:
+            return None
+        return file_key(
+            path,
+            extra=f"waveform-v{_CACHE_VERSION}-{self._columns}",
+            content_hash=self._content_hash,
+        )
+
+    def cached(self, path: Path) -> Waveform | None:
+        """Uebersicht aus dem Cache, None wenn (noch) nicht berechnet."""
+        key = self._key(path)
+        return self._load_cached(key) if key is not None else None
+
+    def collector(self, path: Path) -> WaveformCollector:
+        """Sammler fuer einen fremden Dekodier-Durchlauf; legt das Ergebnis im Cache ab."""
+        key = self._key(path)
+        if key is None:
+            return WaveformCollector(self._columns)
+        return WaveformCollector(self._columns, lambda waveform: self._store_cached(key, waveform))
+
+    def compute(
+        self,
+        path: Path,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> Waveform | None:
+        """Liefert die Uebersicht einer Datei mit eigenem Decode (blocking, in Worker).
+
+        Nur noetig, wenn kein Analyse-Durchlauf die Daten liefert (siehe
+        collector()).
+
+        Args:
+            path: Audio-Datei
+            should_stop: Wird pro Chunk abgefragt; True bricht ab (Trackwechsel).
+
+        Returns:
+            Min/Max je Spalte, oder None wenn das Format nicht streambar ist,
+            die Dekodierung fehlschlaegt oder abgebrochen wurde.
+        """
+        cached = self.cached(path)
+        if cached is not None:
+            return cached
+
+        source = pcm_stream_source(path)
+        if source is None:
+            return None
+
+        collector = self.collector(path)
+        chunks = source[0](0)
+        try:
+            for chunk in chunks:
+                if should_stop is not None and should_stop():
+                    return None
+                collector.feed(chunk)
+        except Exception:
+            logger.debug("Wellenform konnte nicht berechnet werden: %s", path, exc_info=True)
+            return None
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+        collector.finish()
+        return collector.result
+
+    def _load_cached(self, key: str) -> Waveform | None:
+        blob = self._cache.get(key) if self._cache is not None else None
+        if blob is None or len(blob) < _CACHE_HEADER.size:
+            return None
+        magic, version, columns = _CACHE_HEADER.unpack_from(blob)
+        data = array.array("b", blob[_CACHE_HEADER.size:])
+        if magic != _CACHE_MAGIC or version != _CACHE_VERSION or len(data) != 2 * columns:
+            return None
+        return [(data[i] / 127.0, data[i + 1] / 127.0) for i in range(0, len(data), 2)]
+
+    def _store_cached(self, key: str, waveform: Waveform) -> None:
+        if self._cache is None:
+            return
+        data = array.array("b")
+        for lo, hi in waveform:
+            data.append(max(-127, min(127, round(lo * 127.0))))
+            data.append(max(-127, min(127, round(hi * 127.0))))
+        header = _CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, len(waveform))
+        self._cache.put(key, header + data.tobytes())
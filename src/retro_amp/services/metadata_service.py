@@ -1,43 +1,127 @@
 """Metadata-Service — Audio-Metadaten lesen und Dateien filtern."""
 from __future__ import annotations
 
+import time
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
-from ..domain.models import AudioFormat, AudioTrack
-from ..domain.protocols import MetadataReader
+from ..domain.models import AudioFormat, AudioTrack, FileEntry
+from ..domain.protocols import DirectoryLister, MetadataReader
 
 
 class MetadataService:
     """Liest Audio-Metadaten und filtert Dateien.
 
     Kennt nur domain/, nie infrastructure/.
-    Bekommt MetadataReader via Protocol-Typ im Konstruktor (DI).
+    Bekommt MetadataReader und DirectoryLister via Protocol-Typ im
+    Konstruktor (DI).
+
+    Args:
+        reader: Metadaten-Reader (muss bei workers > 1 thread-sicher sein).
+        lister: Verzeichnis-Listing fuer den Scan.
+        workers: Parallele Lesevorgaenge beim Verzeichnis-Scan (1 = sequentiell).
     """
 
-    def __init__(self, reader: MetadataReader) -> None:
+    def __init__(self, reader: MetadataReader, lister: DirectoryLister, workers: int = 1) -> None:
         self._reader = reader
+        self._lister = lister
+        self._workers = max(1, workers)
 
     def read_track(self, path: Path) -> AudioTrack:
         """Liest Metadaten eines einzelnen Tracks."""
         return self._reader.read(path)
 
     def scan_directory(self, directory: Path) -> list[AudioTrack]:
-        """Scannt ein Verzeichnis nach Audio-Dateien und liest deren Metadaten."""
-        if not directory.is_dir():
-            return []
+        """Scannt ein Verzeichnis nach Audio-Dateien und liest deren Metadaten.
 
+        Dateien mit mehreren Songs (SID-Subtunes) erscheinen als ein
+        virtueller Track pro Subtune. Tags werden mit bis zu `workers`
+        Threads gelesen (Netzlaufwerke: Latenz ueberlappt), das Ergebnis
+        bleibt nach Dateiname sortiert.
+        """
         tracks: list[AudioTrack] = []
-        supported = AudioFormat.supported_extensions()
+        for batch in self.iter_metadata(self.list_audio_files(directory)):
+            for track in batch:
+                tracks.extend(track.subtunes())
+        return tracks
 
+    def list_audio_files(self, directory: Path) -> list[FileEntry]:
+        """Audio-Dateien eines Verzeichnisses mit Groesse und mtime, sortiert.
+
+        Ein os.scandir-Durchlauf; die stat-Daten reisen im FileEntry bis
+        zum Tag-Reader mit.
+        """
         try:
-            for entry in sorted(directory.iterdir()):
-                if entry.is_file() and entry.suffix.lower() in supported:
-                    track = self._reader.read(entry)
-                    tracks.append(track)
-        except PermissionError:
-            pass
+            entries = self._lister.list_dir(directory, suffixes=AudioFormat.supported_extensions())
+        except OSError:
+            return []
+        entries.sort(key=lambda entry: entry.path)
+        return entries
 
-        return tracks
+    @staticmethod
+    def placeholder(entry: FileEntry) -> AudioTrack:
+        """Track ohne Tags (Name, Format, Groesse, Datum) fuer die sofortige Anzeige."""
+        return AudioTrack(
+            path=entry.path,
+            file_size_bytes=entry.size,
+            modified_date=entry.modified_date,
+        )
+
+    def iter_metadata(
+        self,
+        entries: list[FileEntry],
+        batch_size: int = 64,
+        interval: float = 0.1,
+    ) -> Generator[list[AudioTrack], None, None]:
+        """Liest Tags und liefert sie in Reihenfolge, stueckweise als Batches.
+
+        Ein Batch wird ausgegeben, sobald batch_size Tracks gelesen sind oder
+        interval Sekunden seit dem letzten Batch vergangen sind — mit
+        workers > 1 auch waehrend ein langsamer Lesevorgang noch laeuft
+        (sequentiell erst nach dessen Ende). Subtunes
+        werden nicht expandiert (ein Track pro Datei). Bricht der Aufrufer
+        ab, werden noch nicht begonnene Lesevorgaenge verworfen.
+        """
+        def _read(entry: FileEntry) -> AudioTrack:
+            return self._reader.read(entry.path, entry)
+
+        workers = min(self._workers, len(entries))
+        if workers <= 1:
+            batch: list[AudioTrack] = []
+            last = time.monotonic()
+            for track in map(_read, entries):
+                batch.append(track)
+                now = time.monotonic()
+                if len(batch) >= batch_size or now - last >= interval:
+                    yield batch
+                    batch = []
+                    last = now
+            if batch:
+                yield batch
+            return
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            pending = deque(pool.submit(_read, entry) for entry in entries)
+            batch = []
+            last = time.monotonic()
+            while pending:
+                # Mit gelesenen Tracks im Batch nur bis zum naechsten Flush warten
+                timeout = max(0.0, last + interval - time.monotonic()) if batch else None
+                done, _ = wait((pending[0],), timeout=timeout)
+                while done and pending and pending[0].done() and len(batch) < batch_size:
+                    batch.append(pending.popleft().result())
+                now = time.monotonic()
+                if batch and (len(batch) >= batch_size or now - last >= interval):
+                    yield batch
+                    batch = []
+                    last = now
+            if batch:
+                yield batch
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def is_audio_file(self, path: Path) -> bool:
         """Prueft ob eine Datei ein unterstuetztes Audio-Format ist."""
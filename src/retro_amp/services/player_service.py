@@ -1,10 +1,21 @@
 """Player-Service — Play/Pause/Next/Prev Logik."""
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 from ..domain.models import AudioTrack, PlaybackState, PlayerState
-from ..domain.protocols import AudioPlayer, OnErrorCallback, OnFinishedCallback
+from ..domain.protocols import (
+    AudioPlayer,
+    OnErrorCallback,
+    OnFinishedCallback,
+    OnTrackChangedCallback,
+)
+
+# Abweichung zwischen Uhr und gelesener Position, ab der hart nachgezogen wird
+_CLOCK_SNAP_SECONDS = 0.3
+# Anteil einer kleineren Abweichung, der pro Positions-Tick ausgeglichen wird
+_CLOCK_SLEW = 0.5
 
 
 class PlayerService:
@@ -19,6 +30,16 @@ class PlayerService:
         self._state = PlayerState()
         self._on_finished: OnFinishedCallback | None = None
         self._on_error: OnErrorCallback | None = None
+        self._on_track_changed: OnTrackChangedCallback | None = None
+        # Fuer die Lueckenmessung: letzter Positions-Tick (monotonic, Position)
+        # und geschaetzter Zeitpunkt, an dem der letzte Track verstummt ist
+        self._last_tick: tuple[float, float] | None = None
+        self._ended_at: float | None = None
+        # Interpolierte Uhr: Anker (perf_counter, Position) aus dem letzten
+        # echten Positions-Tick; None = Uhr steht (Pause/Stopp)
+        self._anchor: tuple[float, float] | None = None
+        # Zuletzt gelieferte Uhrzeit, damit die Uhr zwischen Ticks nicht zurueckspringt
+        self._clock_floor = 0.0
 
     @property
     def state(self) -> PlayerState:
@@ -28,10 +49,16 @@ class PlayerService:
         self,
         on_finished: OnFinishedCallback | None = None,
         on_error: OnErrorCallback | None = None,
+        on_track_changed: OnTrackChangedCallback | None = None,
     ) -> None:
-        """Setzt Callbacks fuer Events."""
+        """Setzt Callbacks fuer Events.
+
+        on_track_changed wird gerufen, wenn der Player lueckenlos auf den
+        vorgeladenen Track gewechselt hat (ohne play_track).
+        """
         self._on_finished = on_finished
         self._on_error = on_error
+        self._on_track_changed = on_track_changed
 
     def load_tracks(self, tracks: list[AudioTrack]) -> None:
         """Laedt eine Liste von Tracks in den Player."""
@@ -39,6 +66,34 @@ class PlayerService:
         self._state.current_index = -1
         self._state.current_track = None
 
+    def refresh_tracks(self, tracks: list[AudioTrack]) -> bool:
+        """Uebernimmt eine aktualisierte Fassung der geladenen Tracklist.
+
+        Beim progressiven Scan ersetzen nachgelesene Metadaten die
+        Platzhalter, ohne die Wiedergabe zu unterbrechen. Der aktuelle Track
+        wird per row_key wiedergefunden (aufgeloeste SID-Subtunes verschieben
+        die Zeilen); fehlt er, zeigt der Index auf die erste Zeile der Datei.
+
+        Returns:
+            True wenn der aktuelle Track neue Metadaten bekommen hat.
+        """
+        current = self._state.current_track
+        self._state.track_list = tracks
+        if current is None or self._state.current_index < 0:
+            return False
+        keys = [track.row_key for track in tracks]
+        if current.row_key not in keys:
+            self._state.current_index = next(
+                (i for i, track in enumerate(tracks) if track.path == current.path), -1,
+            )
+            return False
+        index = keys.index(current.row_key)
+        self._state.current_index = index
+        if tracks[index] == current:
+            return False
+        self._state.current_track = tracks[index]
+        return True
+
     def play_track(self, index: int) -> None:
         """Spielt einen bestimmten Track ab."""
         if index < 0 or index >= len(self._state.track_list):
@@ -46,11 +101,13 @@ class PlayerService:
 
         track = self._state.track_list[index]
         try:
-            self._player.play(track.path)
+            self._player.play(track.path, track.subtune)
+            self._started()
             self._state.current_track = track
             self._state.current_index = index
             self._state.state = PlaybackState.PLAYING
             self._state.position_seconds = 0.0
+            self._set_anchor(0.0)
         except Exception as e:
             self._state.state = PlaybackState.STOPPED
             if self._on_error:
@@ -59,10 +116,12 @@ class PlayerService:
     def play_file(self, track: AudioTrack) -> None:
         """Spielt einen einzelnen Track ab (ohne Tracklist-Kontext)."""
         try:
-            self._player.play(track.path)
+            self._player.play(track.path, track.subtune)
+            self._started()
             self._state.current_track = track
             self._state.state = PlaybackState.PLAYING
             self._state.position_seconds = 0.0
+            self._set_anchor(0.0)
         except Exception as e:
             self._state.state = PlaybackState.STOPPED
             if self._on_error:
@@ -72,14 +131,19 @@ class PlayerService:
         """Wechselt zwischen Play und Pause."""
         if self._state.is_playing:
             self._player.pause()
+            self._state.position_seconds = self.clock_position()
+            self._anchor = None
             self._state.state = PlaybackState.PAUSED
         elif self._state.is_paused:
             self._player.unpause()
             self._state.state = PlaybackState.PLAYING
+            self._set_anchor(self._state.position_seconds)
 
     def stop(self) -> None:
         """Stoppt die Wiedergabe."""
         self._player.stop()
+        self._ended_at = None
+        self._anchor = None
         self._state.state = PlaybackState.STOPPED
         self._state.position_seconds = 0.0
 
@@ -106,14 +170,14 @@ class PlayerService:
                 self._state.current_track.duration_seconds,
             )
             self._player.seek(new_pos)
-            self._state.position_seconds = new_pos
+            self._seeked(new_pos)
 
     def seek_backward(self, seconds: float = 5.0) -> None:
         """Springt zurueck."""
         if self._state.current_track and not self._state.is_stopped:
             new_pos = max(self._state.position_seconds - seconds, 0.0)
             self._player.seek(new_pos)
-            self._state.position_seconds = new_pos
+            self._seeked(new_pos)
 
     def volume_up(self, step: float = 0.05) -> None:
         """Erhoet die Lautstaerke."""
@@ -126,18 +190,125 @@ class PlayerService:
     def update_position(self) -> None:
         """Aktualisiert die Position vom Player. Aufgerufen per Timer."""
         if self._state.is_playing:
+            self._check_handover()
             pos = self._player.get_position()
             # Nur aktualisieren wenn valide (>0), sonst alten Wert behalten
             if pos > 0:
                 self._state.position_seconds = pos
+                self._last_tick = (time.monotonic(), pos)
+                self._correct_clock(pos)
 
             # Pruefe ob Track fertig ist:
             # is_busy() == False UND wir haben schon etwas gespielt (> 1s)
             if not self._player.is_busy() and self._state.position_seconds >= 1.0:
+                self._ended_at = self._estimate_end()
+                self._anchor = None
                 self._state.state = PlaybackState.STOPPED
                 if self._on_finished:
                     self._on_finished()
 
+    def preload_next(self) -> AudioTrack | None:
+        """Bereitet den naechsten Track im Player vor (blockierend, im Worker aufrufen).
+
+        Subtunes derselben Datei werden nicht vorgeladen: der Player meldet
+        nur Pfade, ein Wechsel waere nicht vom aktuellen Song zu unterscheiden.
+
+        Returns:
+            Der vorgeladene Track, oder None wenn es keinen naechsten gibt.
+        """
+        track = self._state.upcoming_track
+        current = self._state.current_track
+        if track is None or (current is not None and track.path == current.path):
+            return None
+        self._player.preload(track.path, track.subtune)
+        return track
+
+    def _check_handover(self) -> None:
+        """Erkennt einen lueckenlosen Wechsel des Players auf den naechsten Track."""
+        track = self._state.upcoming_track
+        current = self._state.current_track
+        if track is None or current is None or track.path == current.path:
+            return
+        playing = self._player.playing_path()
+        if playing is None or playing == current.path or playing != track.path:
+            return
+        self._state.current_index += 1
+        self._state.current_track = track
+        self._state.position_seconds = 0.0
+        self._state.last_gap_seconds = 0.0
+        self._last_tick = None
+        self._ended_at = None
+        self._set_anchor(0.0)
+        if self._on_track_changed:
+            self._on_track_changed()
+
+    def clock_position(self) -> float:
+        """Hochaufgeloeste Abspielposition in Sekunden (fuer Visualisierung).
+
+        Zwischen den Positions-Ticks wird ab dem letzten echten Wert per
+        perf_counter weitergezaehlt; bei Pause und Stopp steht die Uhr.
+        Waehrend der Wiedergabe laeuft sie nie rueckwaerts (ausser bei
+        Seek, Trackwechsel oder grober Abweichung vom Player).
+        """
+        anchor = self._anchor
+        if anchor is None or not self._state.is_playing:
+            return self._state.position_seconds
+        anchored_at, pos = anchor
+        pos += time.perf_counter() - anchored_at
+        track = self._state.current_track
+        if track is not None and track.duration_seconds > 0:
+            pos = min(pos, float(track.duration_seconds))
+        pos = max(pos, self._clock_floor)
+        self._clock_floor = pos
+        return pos
+
+    def _set_anchor(self, pos: float) -> None:
+        """Setzt die Uhr hart auf eine Position (Start, Seek, Trackwechsel)."""
+        self._anchor = (time.perf_counter(), pos)
+        self._clock_floor = pos
+
+    def _seeked(self, pos: float) -> None:
+        self._state.position_seconds = pos
+        if self._state.is_playing:
+            self._set_anchor(pos)
+
+    def _correct_clock(self, pos: float) -> None:
+        """Gleicht die Uhr an eine echte Positionsmessung an.
+
+        Kleine Abweichungen (Jitter der Player-Position, Drift zwischen
+        perf_counter und Audio-Takt) werden anteilig ausgeglichen, damit die
+        Anzeige nicht springt; grosse werden sofort uebernommen.
+        """
+        if self._anchor is None:
+            self._set_anchor(pos)
+            return
+        now = time.perf_counter()
+        anchored_at, anchor_pos = self._anchor
+        predicted = anchor_pos + (now - anchored_at)
+        error = pos - predicted
+        if abs(error) > _CLOCK_SNAP_SECONDS:
+            self._set_anchor(pos)
+        else:
+            self._anchor = (now, predicted + error * _CLOCK_SLEW)
+
+    def _estimate_end(self) -> float:
+        """Schaetzt, wann der Track verstummt ist (zwischen zwei Ticks)."""
+        now = time.monotonic()
+        track = self._state.current_track
+        if self._last_tick is None or track is None or track.duration_seconds <= 0:
+            return now
+        tick, pos = self._last_tick
+        return min(now, tick + max(0.0, track.duration_seconds - pos))
+
+    def _started(self) -> None:
+        """Misst die Luecke seit dem Ende des vorherigen Tracks."""
+        if self._ended_at is not None:
+            self._state.last_gap_seconds = max(0.0, time.monotonic() - self._ended_at)
+        else:
+            self._state.last_gap_seconds = None
+        self._ended_at = None
+        self._last_tick = None
+
     def check_auto_next(self) -> None:
         """Prueft ob automatisch zum naechsten Track gewechselt werden soll."""
         if self._state.is_stopped and self._state.has_next:
@@ -9,6 +9,7 @@ from textual import on
 from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import DataTable, Static
+from textual.widgets.data_table import ColumnKey
 
 from ..domain.models import AudioTrack
 from ..i18n import t
@@ -53,8 +54,10 @@ class FileTable(Widget):
         super().__init__(**kwargs)
         self._tracks: list[AudioTrack] = []
         self._filtered_tracks: list[AudioTrack] = []
-        self._playing_path: Path | None = None
+        # Zeilen-Schluessel (AudioTrack.row_key) des spielenden Tracks
+        self._playing_key: str | None = None
         self._name_col_key: object | None = None
+        self._col_keys: tuple[ColumnKey, ...] = ()
         self._current_path: Path | None = None
 
     def compose(self):  # type: ignore[override]
@@ -69,6 +72,7 @@ class FileTable(Widget):
             t("file_table.duration"), t("file_table.date"), t("file_table.size"),
         )
         self._name_col_key = col_keys[0]
+        self._col_keys = tuple(col_keys)
 
     def update_tracks(self, tracks: list[AudioTrack]) -> None:
         """Aktualisiert die Tabelle mit neuen Tracks."""
@@ -76,22 +80,75 @@ class FileTable(Widget):
         self._filtered_tracks = list(tracks)
         self._rebuild_table()
 
+    @property
+    def tracks(self) -> list[AudioTrack]:
+        """Alle Tracks der Tabelle (inkl. nachgereichter Metadaten)."""
+        return self._tracks
+
+    def update_metadata(self, tracks: list[AudioTrack]) -> None:
+        """Ersetzt Platzhalter-Zeilen durch nachgelesene Metadaten.
+
+        Zeilen werden in place aktualisiert; nur wenn eine Datei sich als
+        Multi-Song-SID entpuppt, wird die Tabelle neu aufgebaut (der Cursor
+        bleibt auf der Datei).
+        """
+        fresh = {track.path: track for track in tracks}
+        merged: list[AudioTrack] = []
+        changed: list[AudioTrack] = []
+        rebuild = False
+        for track in self._tracks:
+            update = fresh.pop(track.path, None) if not track.subtune else None
+            if update is None:
+                merged.append(track)
+                continue
+            rows = update.subtunes()
+            rebuild = rebuild or len(rows) != 1
+            changed.extend(rows)
+            merged.extend(rows)
+        if not changed:
+            return
+
+        cursor = self.highlighted_track
+        self._tracks = merged
+        self._filtered_tracks = list(merged)
+        if rebuild:
+            self._rebuild_table()
+            if cursor is not None:
+                self._move_cursor_to_path(cursor.path)
+            return
+
+        table = self.query_one("#file-data", DataTable)
+        for track in changed:
+            try:
+                for col_key, value in zip(self._col_keys, self._row_cells(track)):
+                    table.update_cell(track.row_key, col_key, value)
+            except Exception:
+                pass
+
+    def _move_cursor_to_path(self, path: Path) -> None:
+        table = self.query_one("#file-data", DataTable)
+        for idx, track in enumerate(self._filtered_tracks):
+            if track.path == path:
+                table.move_cursor(row=idx)
+                break
+
+    def _row_cells(self, track: AudioTrack) -> tuple[str | Text, ...]:
+        return (
+            self._format_name(track),
+            track.format_display,
+            track.bitrate_display,
+            track.duration_display,
+            track.date_display,
+            track.size_display,
+        )
+
     def _rebuild_table(self) -> None:
         """Baut die Tabelle mit gefilterten Tracks auf."""
         table = self.query_one("#file-data", DataTable)
         table.clear()
 
         for track in self._filtered_tracks:
-            name_cell = self._format_name(track)
-            table.add_row(
-                name_cell,
-                track.format_display,
-                track.bitrate_display,
-                track.duration_display,
-                track.date_display,
-                track.size_display,
-                key=str(track.path),
-            )
+            table.add_row(*self._row_cells(track), key=track.row_key)
 
         self._update_info_label()
 
@@ -116,32 +173,33 @@ class FileTable(Widget):
         else:
             info.update(count_str)
 
-    def mark_playing(self, path: Path | None) -> None:
-        """Markiert den aktuell spielenden Track visuell."""
+    def mark_playing(self, playing: AudioTrack | None) -> None:
+        """Markiert den aktuell spielenden Track (bzw. Subtune) visuell."""
         table = self.query_one("#file-data", DataTable)
-        old_path = self._playing_path
-        self._playing_path = path
+        old_key = self._playing_key
+        new_key = playing.row_key if playing else None
+        self._playing_key = new_key
 
         # Alten Marker entfernen
-        if old_path and self._name_col_key is not None:
+        if old_key and self._name_col_key is not None:
             for track in self._filtered_tracks:
-                if track.path == old_path:
+                if track.row_key == old_key:
                     try:
                         table.update_cell(
-                            str(old_path), self._name_col_key, track.display_name,
+                            old_key, self._name_col_key, track.display_name,
                         )
                     except Exception:
                         pass
                     break
 
         # Neuen Marker setzen
-        if path and self._name_col_key is not None:
+        if new_key and self._name_col_key is not None:
             for track in self._filtered_tracks:
-                if track.path == path:
+                if track.row_key == new_key:
                     styled = Text(f"\u25b6 {track.display_name}", style="bold green")
                     try:
                         table.update_cell(
-                            str(path), self._name_col_key, styled,
+                            new_key, self._name_col_key, styled,
                         )
                     except Exception:
                         pass
@@ -174,12 +232,12 @@ class FileTable(Widget):
         """Bewegt den Cursor zum angegebenen Track."""
         table = self.query_one("#file-data", DataTable)
         for idx, t in enumerate(self._filtered_tracks):
-            if t.path == track.path:
+            if t.row_key == track.row_key:
                 table.move_cursor(row=idx)
                 break
 
     def _format_name(self, track: AudioTrack) -> str | Text:
         """Formatiert den Namen — mit Pfeil wenn gerade gespielt wird."""
-        if self._playing_path and track.path == self._playing_path:
+        if self._playing_key and track.row_key == self._playing_key:
             return Text(f"\u25b6 {track.display_name}", style="bold green")
         return track.display_name
@@ -1,6 +1,7 @@
 """Folder-Browser Widget — Verzeichnisbaum links."""
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from rich.style import Style
@@ -8,6 +9,9 @@ from rich.text import Text
 from textual.widgets import DirectoryTree
 from textual.widgets._directory_tree import DirEntry
 from textual.widgets._tree import TreeNode
+from textual.worker import Worker
+
+from ..infrastructure.fs_walk import list_dir
 
 
 class FolderBrowser(DirectoryTree):
@@ -27,11 +31,49 @@ class FolderBrowser(DirectoryTree):
 
     ICON_MUSIC = "\u266a "  # ♪
 
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        # Ordner-Flags aus dem scandir-Listing je gelistetem Ordner (spart
+        # stat pro Eintrag). Neu-Listen ersetzt, Zuklappen verwirft sie.
+        self._listings: dict[Path, dict[Path, bool]] = {}
+
+    def _directory_content(self, location: Path, worker: Worker[object]) -> Iterator[Path]:
+        """Listet per os.scandir und merkt sich den Eintragstyp."""
+        try:
+            entries = list_dir(location, stat_files=False)
+        except OSError:
+            self._listings.pop(location, None)
+            return
+        self._listings[location] = {entry.path: entry.is_dir for entry in entries}
+        for entry in entries:
+            if worker.is_cancelled:
+                break
+            yield entry.path
+
+    def _safe_is_dir(self, path: Path) -> bool:  # type: ignore[override]
+        """Ordner-Pruefung aus dem Listing, stat nur fuer unbekannte Pfade."""
+        listing = self._listings.get(path.parent)
+        is_dir = listing.get(path) if listing is not None else None
+        if is_dir is None:
+            return DirectoryTree._safe_is_dir(path)
+        return is_dir
+
+    def forget_listings(self, directory: Path) -> None:
+        """Verwirft die Ordner-Flags eines Ordners und aller Unterordner."""
+        for listed in list(self._listings):
+            if listed == directory or directory in listed.parents:
+                self._listings.pop(listed, None)
+
+    def on_tree_node_collapsed(self, event: DirectoryTree.NodeCollapsed[DirEntry]) -> None:
+        """Zugeklappt: Listing-Daten freigeben (beim Aufklappen wird neu gelistet)."""
+        if event.node.data is not None:
+            self.forget_listings(event.node.data.path.expanduser())
+
     def filter_paths(self, paths: list[Path]) -> list[Path]:  # type: ignore[override]
         """Filtert: nur Ordner und Audio-Dateien anzeigen."""
         result: list[Path] = []
-        for path in sorted(paths, key=lambda p: (not p.is_dir(), p.name.lower())):
-            if path.is_dir():
+        for path in sorted(paths, key=lambda p: (not self._safe_is_dir(p), p.name.lower())):
+            if self._safe_is_dir(path):
                 if not path.name.startswith("."):
                     result.append(path)
             elif path.suffix.lower() in self._AUDIO_EXTENSIONS:
@@ -0,0 +1,164 @@
+"""Stereo-Pegelanzeige (VU + Peak-Hold) neben der Transport-Leiste."""
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from rich.text import Text
+
+from textual.widget import Widget
+
+
+# Achtel-Bloecke fuer horizontale Balken (0=leer, 8=voll)
+_EIGHTHS = [" ", "▏", "▎", "▍", "▌", "▋", "▊", "▉", "█"]
+_PEAK_CHAR = "▕"
+
+# Anzeigebereich in dBFS
+_DB_MIN = -48.0
+
+# Farbzonen (dBFS)
+_YELLOW_DB = -12.0
+_RED_DB = -3.0
+
+# Ballistik: Abfall pro Tick (Anteil der Skala), Peak-Haltezeit in Ticks
+_RELEASE = 0.04
+_PEAK_HOLD_TICKS = 30
+_PEAK_DECAY = 0.02
+
+# (RMS, Spitze) je Kanal, linear 0.0–1.0
+LevelSource = Callable[[], Sequence[tuple[float, float]]]
+
+
+def _to_scale(value: float) -> float:
+    """Linearer Pegel -> 0.0–1.0 auf der dB-Skala."""
+    if value <= 0.0:
+        return 0.0
+    db = 20.0 * math.log10(value)
+    return max(0.0, min(1.0, (db - _DB_MIN) / -_DB_MIN))
+
+
+def _zone_color(fraction: float) -> str:
+    """Farbe fuer eine Position auf der Skala (gruen/gelb/rot)."""
+    db = _DB_MIN + fraction * -_DB_MIN
+    if db >= _RED_DB:
+        return "bold red"
+    if db >= _YELLOW_DB:
+        return "yellow"
+    return "green"
+
+
+class LevelMeter(Widget):
+    """Zweikanalige VU-Anzeige mit Peak-Hold.
+
+    Pollt die Pegel-Quelle mit eigener, hoher Bildrate. Die Quelle liefert
+    pro Kanal (RMS, Spitze); leere Ergebnisse werden als Stille angezeigt.
+    """
+
+    DEFAULT_CSS = """
+    LevelMeter {
+        height: 3;
+        width: 26;
+        padding: 0 1;
+        border-left: solid $accent;
+    }
+    """
+
+    FPS = 30
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._rms = [0.0, 0.0]
+        self._peaks = [0.0, 0.0]
+        self._peak_hold = [0, 0]
+        self._max_db = _DB_MIN
+        self._active = False
+        self._timer_handle: object | None = None
+        self._level_source: LevelSource | None = None
+
+    def set_level_source(self, source: LevelSource | None) -> None:
+        """Setzt die Datenquelle (None = keine Anzeige)."""
+        self._level_source = source
+
+    def start(self) -> None:
+        """Startet das Polling."""
+        self._active = True
+        if self._timer_handle is None:
+            self._timer_handle = self.set_interval(1 / self.FPS, self._tick)
+
+    def stop(self) -> None:
+        """Stoppt das Polling und setzt die Anzeige zurueck."""
+        self._active = False
+        self._rms = [0.0, 0.0]
+        self._peaks = [0.0, 0.0]
+        self._peak_hold = [0, 0]
+        self._max_db = _DB_MIN
+        self.refresh()
+
+    def _read_levels(self) -> Sequence[tuple[float, float]]:
+        if self._level_source is None:
+            return ()
+        try:
+            return self._level_source()
+        except Exception:
+            return ()
+
+    def _tick(self) -> None:
+        """Pegel abfragen, Ballistik anwenden, neu zeichnen."""
+        if not self._active:
+            return
+
+        levels = self._read_levels()
+        for ch in range(2):
+            rms, peak = levels[ch] if ch < len(levels) else (0.0, 0.0)
+
+            # RMS: sofort hoch, gleichmaessig runter
+            target = _to_scale(rms)
+            self._rms[ch] = max(target, self._rms[ch] - _RELEASE)
+
+            # Spitze: halten, dann langsam fallen
+            peak_scaled = _to_scale(peak)
+            if peak_scaled >= self._peaks[ch]:
+                self._peaks[ch] = peak_scaled
+                self._peak_hold[ch] = _PEAK_HOLD_TICKS
+            elif self._peak_hold[ch] > 0:
+                self._peak_hold[ch] -= 1
+            else:
+                self._peaks[ch] = max(self._peaks[ch] - _PEAK_DECAY, 0.0)
+
+            if peak > 0.0:
+                self._max_db = max(self._max_db, 20.0 * math.log10(peak))
+
+        self.refresh()
+
+    def _render_bar(self, label: str, rms: float, peak: float, width: int) -> Text:
+        """Eine Kanalzeile: Label, Balken (Achtel-Aufloesung), Peak-Marker."""
+        line = Text()
+        line.append(f"{label} ", style="bold")
+        steps = int(rms * width * 8)
+        peak_col = min(width - 1, int(peak * width)) if peak > 0.0 else -1
+        for col in range(width):
+            fill = max(0, min(8, steps - col * 8))
+            color = _zone_color(col / max(width - 1, 1))
+            if fill:
+                line.append(_EIGHTHS[fill], style=color)
+            elif col == peak_col:
+                line.append(_PEAK_CHAR, style=f"bold {color}")
+            else:
+                line.append("·", style="dim")
+        return line
+
+    def render(self) -> Text:
+        """Rendert L/R-Balken und die Spitzenanzeige in dBFS."""
+        width = max(4, self.content_size.width - 2)
+        result = Text()
+        result.append_text(self._render_bar("L", self._rms[0], self._peaks[0], width))
+        result.append("\n")
+        result.append_text(self._render_bar("R", self._rms[1], self._peaks[1], width))
+        result.append("\n")
+        if self._active and self._max_db > _DB_MIN:
+            color = _zone_color(_to_scale(10 ** (self._max_db / 20.0)))
+            result.append(f"  max {self._max_db:5.1f} dB", style=color)
+        else:
+            result.append("  max  --.- dB", style="dim")
+        return result
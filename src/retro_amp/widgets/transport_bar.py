@@ -1,9 +1,12 @@
 """Transport-Leiste Widget — Play/Pause, Fortschritt, Lautstaerke."""
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from rich.text import Text
 
 from textual.events import Click
+from textual.geometry import Region
 from textual.message import Message
 from textual.widget import Widget
 
@@ -14,6 +17,13 @@ from ..i18n import t
 _VOL_BAR_WIDTH = 10
 _PADDING_LEFT = 2
 
+# Fortschrittsleiste: Mindestbreite, Rest der Zeile wird aufgefuellt
+_MIN_BAR_WIDTH = 30
+_VOL_PREFIX = "    Vol: "
+
+# Wellenform: Blockzeichen nach Amplitude (0=leer, 8=voll)
+_WAVE_BLOCKS = " ▁▂▃▄▅▆▇█"
+
 
 class TransportBar(Widget):
     """Zeigt den aktuellen Player-Status mit Fortschrittsbalken."""
@@ -38,10 +48,82 @@ class TransportBar(Widget):
         self._vol_line: int = -1
         self._vol_col: int = -1
 
+        # Wellenform (Min/Max je Spalte) und daraus berechnete Zeichen
+        self._waveform: Sequence[tuple[float, float]] | None = None
+        self._glyphs = ""
+
+        # Zuletzt gezeichneter Stand (fuer Teil-Refreshs beim Abspielen)
+        self._drawn_key: tuple[object, ...] | None = None
+        self._drawn_col = 0
+        self._drawn_time = ""
+        self._bar_width = 0
+
+    def set_waveform(self, waveform: Sequence[tuple[float, float]] | None) -> None:
+        """Setzt die Wellenform-Uebersicht (None = einfacher Balken)."""
+        self._waveform = waveform
+        self._glyphs = ""
+        self.refresh()
+
     def update_state(self, state: PlayerState) -> None:
-        """Aktualisiert den angezeigten Status."""
+        """Aktualisiert den angezeigten Status.
+
+        Aendert sich nur die Position, werden lediglich die Spalten der
+        Fortschrittsleiste zwischen alter und neuer Position sowie die
+        Zeitanzeige neu gezeichnet.
+        """
         self._state = state
-        self.refresh()
+        if self._drawn_key is None or self._layout_key(state) != self._drawn_key:
+            self.refresh()
+            return
+
+        regions: list[Region] = []
+        col = int(state.progress * self._bar_width)
+        if col != self._drawn_col:
+            lo, hi = sorted((col, self._drawn_col))
+            regions.append(Region(lo, 1, hi - lo, 1))
+        time_str = self._time_str(state)
+        if time_str != self._drawn_time:
+            regions.append(Region(self._bar_width, 1, len(time_str), 1))
+        if regions:
+            self._drawn_col = col
+            self._drawn_time = time_str
+            self.refresh(*regions)
+
+    def _layout_key(self, state: PlayerState) -> tuple[object, ...]:
+        """Alles ausser der Position, was die Darstellung bestimmt."""
+        return (
+            state.current_track,
+            state.state,
+            state.volume,
+            len(self._time_str(state)),
+            id(self._waveform),
+            self.content_size.width,
+        )
+
+    @staticmethod
+    def _time_str(state: PlayerState) -> str:
+        if state.current_track is None:
+            return ""
+        return f"  {state.position_display} / {state.current_track.duration_display}"
+
+    def _wave_glyphs(self, width: int) -> str:
+        """Wellenform auf width Spalten reduziert, als Blockzeichen (gecacht)."""
+        waveform = self._waveform
+        if not waveform:
+            return ""
+        if len(self._glyphs) == width:
+            return self._glyphs
+        count = len(waveform)
+        chars: list[str] = []
+        for col in range(width):
+            lo = col * count // width
+            hi = max(lo + 1, (col + 1) * count // width)
+            low = min(v[0] for v in waveform[lo:hi])
+            high = max(v[1] for v in waveform[lo:hi])
+            level = round((high - low) / 2.0 * 8)
+            chars.append(_WAVE_BLOCKS[max(1, min(8, level))])
+        self._glyphs = "".join(chars)
+        return self._glyphs
 
     def render(self) -> Text:
         """Rendert die Transport-Leiste."""
@@ -82,27 +164,38 @@ class TransportBar(Widget):
 
             text.append("\n")
 
-            # Zeile 2: Fortschrittsbalken + Zeit + Lautstaerke
-            bar_width = 30
+            # Zeile 2: Fortschrittsbalken (oder Wellenform) + Zeit + Lautstaerke
+            vol_pct = int(state.volume * 100)
+            time_str = self._time_str(state)
+            reserved = len(time_str) + len(_VOL_PREFIX) + _VOL_BAR_WIDTH + len(f" {vol_pct}%")
+            bar_width = max(_MIN_BAR_WIDTH, self.content_size.width - reserved)
             filled = int(state.progress * bar_width)
-            text.append("\u2588" * filled, style="green")
-            text.append("\u2591" * (bar_width - filled), style="dim")
+            glyphs = self._wave_glyphs(bar_width)
+            if glyphs:
+                text.append(glyphs[:filled], style="green")
+                text.append(glyphs[filled:], style="dim")
+            else:
+                text.append("\u2588" * filled, style="green")
+                text.append("\u2591" * (bar_width - filled), style="dim")
 
-            time_str = f"  {state.position_display} / {track.duration_display}"
             text.append(time_str, style="dim")
 
             # Lautstaerke
-            vol_prefix = "    Vol: "
-            text.append(vol_prefix)
+            text.append(_VOL_PREFIX)
             self._vol_line = 1
-            self._vol_col = bar_width + len(time_str) + len(vol_prefix)
+            self._vol_col = bar_width + len(time_str) + len(_VOL_PREFIX)
 
-            vol_pct = int(state.volume * 100)
             vol_bars = int(state.volume * _VOL_BAR_WIDTH)
             text.append("\u2588" * vol_bars, style="green")
             text.append("\u2591" * (_VOL_BAR_WIDTH - vol_bars), style="dim")
             text.append(f" {vol_pct}%", style="dim")
+
+            self._bar_width = bar_width
+            self._drawn_col = filled
+            self._drawn_time = time_str
+            self._drawn_key = self._layout_key(state)
         else:
+            self._drawn_key = None
             text.append(t("transport.no_track"), style="dim")
             text.append("\n")
 
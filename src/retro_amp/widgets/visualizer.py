@@ -6,6 +6,7 @@ from collections.abc import Callable
 
 from rich.text import Text
 
+from textual import events
 from textual.widget import Widget
 
 
@@ -19,6 +20,10 @@ _PEAK_CHAR = "▔"
 _PEAK_HOLD_FRAMES = 3
 _PEAK_DECAY = 2  # Stufen pro Tick beim Fallen
 
+# Grenzen fuer die breitenabhaengige Balkenanzahl
+_MIN_BARS = 8
+_MAX_BARS = 128
+
 # Render-Zeilen
 _NUM_ROWS = 3
 _STEPS_PER_ROW = len(_BLOCKS) - 1  # 8
@@ -52,41 +57,66 @@ class Visualizer(Widget):
     """Equalizer-Visualizer mit Spektralfarben und Peak-Hold-Effekt.
 
     Nutzt entweder echte FFT-Daten (via spectrum_source Callback)
-    oder simulierte Zufallswerte als Fallback.
+    oder simulierte Zufallswerte als Fallback. Die Anzahl der Balken
+    richtet sich nach der verfuegbaren Breite (eine Spalte pro Balken).
     """
 
     DEFAULT_CSS = """
     Visualizer {
         height: 3;
-        width: 38;
+        width: 35%;
+        min-width: 37;
+        max-width: 133;
         padding: 0 2;
         border-right: solid $accent;
     }
     """
 
-    NUM_BARS = 32
+    NUM_BARS = 32  # Startwert bis zum ersten Resize
 
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)
-        self._bars: list[int] = [0] * self.NUM_BARS
-        self._peaks: list[int] = [0] * self.NUM_BARS
-        self._peak_hold: list[int] = [0] * self.NUM_BARS
+        self._num_bars = 0
+        self._bars: list[int] = []
+        self._peaks: list[int] = []
+        self._peak_hold: list[int] = []
+        self._colors: list[str] = []
         self._active = False
         self._timer_handle: object | None = None
-        self._spectrum_source: Callable[[], list[float]] | None = None
+        self._spectrum_source: Callable[[int], list[float]] | None = None
+        self._set_num_bars(self.NUM_BARS)
+
+    @property
+    def num_bars(self) -> int:
+        """Aktuelle Anzahl der Balken."""
+        return self._num_bars
+
+    def _set_num_bars(self, count: int) -> None:
+        """Passt Balken-, Peak- und Farblisten an eine neue Balkenanzahl an."""
+        count = max(_MIN_BARS, min(_MAX_BARS, count))
+        if count == self._num_bars:
+            return
+        self._num_bars = count
+        self._bars = [0] * count
+        self._peaks = [0] * count
+        self._peak_hold = [0] * count
 
         # Farben vorberechnen
-        self._colors = [
-            _spectral_color(i, self.NUM_BARS) for i in range(self.NUM_BARS)
-        ]
+        self._colors = [_spectral_color(i, count) for i in range(count)]
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Balkenanzahl an die Breite anpassen."""
+        self._set_num_bars(self.content_size.width)
+        self.refresh()
 
     def set_spectrum_source(
-        self, source: Callable[[], list[float]] | None
+        self, source: Callable[[int], list[float]] | None
     ) -> None:
         """Setzt die Datenquelle fuer echte Spektraldaten.
 
-        Die Callback-Funktion gibt eine Liste mit NUM_BARS float-Werten
-        (0.0–1.0) zurueck. Wenn None, werden Zufallswerte verwendet.
+        Die Callback-Funktion bekommt die gewuenschte Bandzahl (= Balken)
+        und gibt eine Liste mit so vielen float-Werten (0.0–1.0) zurueck.
+        Wenn None, werden Zufallswerte verwendet.
         """
         self._spectrum_source = source
 
@@ -99,9 +129,9 @@ class Visualizer(Widget):
     def stop(self) -> None:
         """Stoppt die Animation und setzt Balken zurueck."""
         self._active = False
-        self._bars = [0] * self.NUM_BARS
-        self._peaks = [0] * self.NUM_BARS
-        self._peak_hold = [0] * self.NUM_BARS
+        self._bars = [0] * self._num_bars
+        self._peaks = [0] * self._num_bars
+        self._peak_hold = [0] * self._num_bars
         self.refresh()
 
     def _tick(self) -> None:
@@ -113,7 +143,7 @@ class Visualizer(Widget):
         band_values = self._get_band_values()
 
         # Balken und Peaks aktualisieren
-        for i in range(self.NUM_BARS):
+        for i in range(self._num_bars):
             target = int(band_values[i] * _MAX_LEVEL)
 
             # Balken: schnell hoch, mittel runter
@@ -137,9 +167,9 @@ class Visualizer(Widget):
         """Holt Band-Werte aus der Datenquelle oder generiert Fake-Werte."""
         if self._spectrum_source:
             try:
-                bands = self._spectrum_source()
-                if bands and len(bands) >= self.NUM_BARS:
-                    return bands[:self.NUM_BARS]
+                bands = self._spectrum_source(self._num_bars)
+                if bands and len(bands) >= self._num_bars:
+                    return bands[:self._num_bars]
             except Exception:
                 pass
 
@@ -149,10 +179,10 @@ class Visualizer(Widget):
     def _fake_bands(self) -> list[float]:
         """Generiert simulierte Zufalls-Band-Werte."""
         values: list[float] = []
-        for i in range(self.NUM_BARS):
+        for i in range(self._num_bars):
             if random.random() > 0.5:
                 # Niedrige Frequenzen staerker
-                weight = 1.0 - (i / self.NUM_BARS) * 0.4
+                weight = 1.0 - (i / self._num_bars) * 0.4
                 values.append(random.random() * weight)
             else:
                 values.append(0.0)
@@ -161,20 +191,18 @@ class Visualizer(Widget):
     def render(self) -> Text:
         """Rendert die Multi-Row Equalizer-Balken mit Spektralfarben."""
         if not self._active:
-            bar_str = "▁" * self.NUM_BARS
             text = Text()
-            text.append("  " + bar_str + "  ", style="dim")
+            text.append("▁" * self._num_bars, style="dim")
             return text
 
         lines: list[Text] = []
 
         for row in range(_NUM_ROWS):
             line = Text()
-            line.append("  ")
             # row 0 = oben (Stufen 17–24), row 2 = unten (Stufen 1–8)
             row_base = (_NUM_ROWS - 1 - row) * _STEPS_PER_ROW
 
-            for i in range(self.NUM_BARS):
+            for i in range(self._num_bars):
                 bar_val = self._bars[i]
                 peak_val = self._peaks[i]
                 color = self._colors[i]
@@ -194,7 +222,6 @@ class Visualizer(Widget):
                 else:
                     line.append(" ")
 
-            line.append("  ")
             lines.append(line)
 
         # Zeilen zusammenfuegen
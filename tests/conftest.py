@@ -5,7 +5,8 @@ from pathlib import Path
 
 import pytest
 
-from retro_amp.domain.models import AudioTrack, Playlist, PlaylistEntry
+from retro_amp.domain.models import AudioTrack, FileEntry, Playlist, PlaylistEntry
+from retro_amp.infrastructure.fs_walk import ScandirLister
 
 
 class MockAudioPlayer:
@@ -13,13 +14,16 @@ class MockAudioPlayer:
 
     def __init__(self) -> None:
         self.current_path: Path | None = None
+        self.current_subtune = 0
         self.playing = False
         self.paused = False
         self.volume = 1.0
         self.position = 0.0
+        self.preloaded: Path | None = None
 
-    def play(self, path: Path) -> None:
+    def play(self, path: Path, subtune: int = 0) -> None:
         self.current_path = path
+        self.current_subtune = subtune
         self.playing = True
         self.paused = False
         self.position = 0.0
@@ -49,6 +53,19 @@ class MockAudioPlayer:
     def is_busy(self) -> bool:
         return self.playing
 
+    def preload(self, path: Path, subtune: int = 0) -> None:
+        self.preloaded = path
+
+    def playing_path(self) -> Path | None:
+        return self.current_path
+
+    def finish_gapless(self) -> None:
+        """Simuliert den lueckenlosen Wechsel auf den vorgeladenen Track."""
+        if self.preloaded is not None:
+            self.current_path = self.preloaded
+            self.preloaded = None
+            self.position = 0.0
+
 
 class MockMetadataReader:
     """In-Memory MetadataReader fuer Tests. Implementiert MetadataReader Protocol."""
@@ -56,7 +73,7 @@ class MockMetadataReader:
     def __init__(self) -> None:
         self.tracks: dict[Path, AudioTrack] = {}
 
-    def read(self, path: Path) -> AudioTrack:
+    def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
         if path in self.tracks:
             return self.tracks[path]
         return AudioTrack(path=path)
@@ -93,6 +110,11 @@ def mock_metadata_reader() -> MockMetadataReader:
     return MockMetadataReader()
 
 
+@pytest.fixture
+def directory_lister() -> ScandirLister:
+    return ScandirLister()
+
+
 @pytest.fixture
 def mock_playlist_repo() -> MockPlaylistRepository:
     return MockPlaylistRepository()
@@ -0,0 +1,300 @@
+"""Tests fuer lazy dekodierende WAV-Streams (Opus) und progressives Rendern (SID)."""
+from __future__ import annotations
+
+import array
+import io
+import sys
+import textwrap
+import time
+import wave
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from retro_amp.infrastructure.audio_player import (  # noqa: E402
+    LazyWavStream,
+    PipeRender,
+    frame_aligned,
+)
+
+# Schreibt wie sidplayfp --wav=- einen Header mit unbekannter Laenge und
+# danach Mono-PCM in Bloecken (Wert = Blocknummer), mit Pause pro Block
+_RENDERER = textwrap.dedent("""
+    import array, struct, sys, time
+    blocks, delay = int(sys.argv[1]), float(sys.argv[2])
+    out = sys.stdout.buffer
+    out.write(b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE")
+    out.write(b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, 8000, 16000, 2, 16))
+    out.write(b"data" + struct.pack("<I", 0xFFFFFFFF))
+    for i in range(blocks):
+        out.write(array.array("h", [i] * 1000).tobytes())
+        out.flush()
+        time.sleep(delay)
+""")
+
+
+def _render(blocks: int, delay: float) -> PipeRender:
+    return PipeRender([sys.executable, "-c", _RENDERER, str(blocks), str(delay)])
+
+
+def _opener(pcm: array.array[int], channels: int, chunk_frames: int = 100):
+    """Opener ueber In-Memory-PCM; protokolliert die Start-Frames."""
+    starts: list[int] = []
+
+    def _open(start_frame: int) -> Iterator[bytes]:
+        starts.append(start_frame)
+        step = chunk_frames * channels
+        for pos in range(start_frame * channels, len(pcm), step):
+            yield pcm[pos:pos + step].tobytes()
+
+    return _open, starts
+
+
+class TestLazyWavStream:
+    def test_readable_by_wave_module(self) -> None:
+        pcm = array.array("h", range(-500, 500))
+        opener, _ = _opener(pcm, channels=2)
+        stream = LazyWavStream(2, 48000, len(pcm) // 2, opener)
+        with wave.open(io.BufferedReader(stream), "rb") as wf:
+            assert wf.getnchannels() == 2
+            assert wf.getframerate() == 48000
+            assert wf.getnframes() == 500
+            data = wf.readframes(1000)
+        assert data == pcm.tobytes()
+
+    def test_nothing_decoded_before_read(self) -> None:
+        pcm = array.array("h", [1] * 1000)
+        opener, starts = _opener(pcm, channels=1)
+        stream = LazyWavStream(1, 48000, 1000, opener)
+        assert len(stream.read(44)) == 44
+        assert starts == []
+
+    def test_seek_restarts_decoder_at_frame(self) -> None:
+        pcm = array.array("h", range(1000))
+        opener, starts = _opener(pcm, channels=1)
+        stream = LazyWavStream(1, 48000, 1000, opener)
+        stream.seek(44 + 2 * 700)
+        chunk = array.array("h")
+        chunk.frombytes(stream.read(6))
+        assert list(chunk) == [700, 701, 702]
+        assert starts == [700]
+
+    def test_sequential_reads_keep_decoder(self) -> None:
+        pcm = array.array("h", range(1000))
+        opener, starts = _opener(pcm, channels=1, chunk_frames=7)
+        stream = LazyWavStream(1, 48000, 1000, opener)
+        stream.seek(44)
+        data = b"".join(iter(lambda: stream.read(33), b""))
+        assert data == pcm.tobytes()
+        assert starts == [0]
+
+    def test_seek_inside_frame(self) -> None:
+        pcm = array.array("h", range(100))
+        opener, _ = _opener(pcm, channels=2, chunk_frames=3)
+        stream = LazyWavStream(2, 48000, 50, opener)
+        stream.seek(44 + 4 * 10 + 2)
+        chunk = array.array("h")
+        chunk.frombytes(stream.read(4))
+        assert list(chunk) == [21, 22]
+
+    def test_unknown_length(self) -> None:
+        opener, _ = _opener(array.array("h", [5] * 10), channels=1)
+        stream = LazyWavStream(1, 48000, None, opener)
+        header = stream.read(44)
+        assert header[40:44] == b"\xdb\xff\xff\xff"
+        assert stream.read(100) == array.array("h", [5] * 10).tobytes()
+        assert stream.read(100) == b""
+
+    def test_seek_within_chunk_keeps_decoder(self) -> None:
+        pcm = array.array("h", range(1000))
+        opener, starts = _opener(pcm, channels=1, chunk_frames=500)
+        stream = LazyWavStream(1, 48000, 1000, opener)
+        stream.seek(44 + 2 * 300)
+        assert array.array("h", stream.read(4)).tolist() == [300, 301]
+        stream.seek(44 + 2 * 310)
+        assert array.array("h", stream.read(4)).tolist() == [310, 311]
+        stream.seek(44 + 2 * 305)
+        assert array.array("h", stream.read(4)).tolist() == [305, 306]
+        stream.seek(44 + 2 * 10)
+        assert array.array("h", stream.read(4)).tolist() == [10, 11]
+        assert starts == [300, 10]
+
+    def test_read_at_end_does_not_decode(self) -> None:
+        opener, starts = _opener(array.array("h", [5] * 10), channels=1)
+        stream = LazyWavStream(1, 48000, 10, opener)
+        stream.seek(0, io.SEEK_END)
+        assert stream.read(10) == b""
+        assert starts == []
+
+
+class TestFrameAligned:
+    def test_carries_partial_frames(self) -> None:
+        data = bytes(range(24))
+        chunks = [data[0:5], data[5:6], data[6:17], data[17:24]]
+        out = [bytes(c) for c in frame_aligned(iter(chunks), 4)]
+        assert all(len(c) % 4 == 0 for c in out)
+        assert b"".join(out) == data
+
+    def test_drops_trailing_partial_frame(self) -> None:
+        out = [bytes(c) for c in frame_aligned(iter([b"abcdef"]), 4)]
+        assert out == [b"abcd"]
+
+
+class TestPipeRender:
+    def test_first_buffer_before_render_finishes(self) -> None:
+        start = time.monotonic()
+        render = _render(blocks=50, delay=0.1)
+        try:
+            assert render.wait_ready(timeout=10)
+            assert time.monotonic() - start < 4.0
+            assert (render.channels, render.sample_rate) == (1, 8000)
+            first = next(render.chunks(0))
+            assert array.array("h", first[:2])[0] == 0
+            assert render._proc.poll() is None
+        finally:
+            render.close()
+
+    def test_chunks_wait_for_complete_render(self) -> None:
+        render = _render(blocks=5, delay=0.01)
+        try:
+            assert render.wait_ready(timeout=10)
+            data = b"".join(render.chunks(2000 * 2))
+            assert array.array("h", data).tolist() == [2] * 1000 + [3] * 1000 + [4] * 1000
+        finally:
+            render.close()
+
+    def test_chunks_are_views_from_offset(self) -> None:
+        render = _render(blocks=3, delay=0.01)
+        try:
+            assert render.wait_ready(timeout=10)
+            chunks = list(render.chunks(1500 * 2))
+            assert all(isinstance(c, memoryview) for c in chunks)
+            data = array.array("h", b"".join(chunks)).tolist()
+            assert data == [1] * 500 + [2] * 1000
+        finally:
+            render.close()
+
+    def test_close_kills_process(self) -> None:
+        render = _render(blocks=1000, delay=0.1)
+        assert render.wait_ready(timeout=10)
+        render.close()
+        assert render._proc.poll() is not None
+        assert list(render.chunks(0)) == []
+
+    def test_failed_start(self) -> None:
+        render = PipeRender([sys.executable, "-c", "pass"])
+        assert not render.wait_ready(timeout=10)
+        render.close()
+
+    def test_lazy_wav_closes_render(self) -> None:
+        render = _render(blocks=1000, delay=0.1)
+        assert render.wait_ready(timeout=10)
+        stream = LazyWavStream(1, 8000, None, lambda f: render.chunks(f * 2), on_close=render.close)
+        stream.seek(44)
+        assert array.array("h", stream.read(4)).tolist() == [0, 0]
+        stream.close()
+        assert render._proc.poll() is not None
+
+    def test_on_complete_receives_full_pcm(self) -> None:
+        done: list[tuple[bytes, int, int]] = []
+        render = PipeRender(
+            [sys.executable, "-c", _RENDERER, "3", "0.01"],
+            on_complete=lambda pcm, ch, sr: done.append((bytes(pcm), ch, sr)),
+        )
+        render._thread.join(timeout=10)
+        render.close()
+        assert len(done) == 1
+        pcm, channels, sample_rate = done[0]
+        assert (channels, sample_rate) == (1, 8000)
+        assert array.array("h", pcm).tolist() == [0] * 1000 + [1] * 1000 + [2] * 1000
+
+    def test_on_complete_skipped_after_close(self) -> None:
+        done: list[int] = []
+        render = PipeRender(
+            [sys.executable, "-c", _RENDERER, "1000", "0.1"],
+            on_complete=lambda pcm, ch, sr: done.append(len(pcm)),
+        )
+        assert render.wait_ready(timeout=10)
+        render.close()
+        render._thread.join(timeout=10)
+        assert done == []
+
+
+class TestPygameSeek:
+    def test_position_follows_seek(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import pygame
+
+        from retro_amp.infrastructure.audio_player import PygameAudioPlayer
+
+        monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        wav = tmp_path / "silence.wav"
+        with wave.open(str(wav), "wb") as wf:
+            wf.setnchannels(2)
+            wf.setsampwidth(2)
+            wf.setframerate(44100)
+            wf.writeframes(bytes(44100 * 4 * 20))
+
+        player = PygameAudioPlayer(buffer_size=1024)
+        try:
+            player.play(wav)
+            time.sleep(0.3)
+            player.seek(10.0)
+            assert player.get_position() == pytest.approx(10.0, abs=0.1)
+            time.sleep(0.2)
+            assert player.get_position() == pytest.approx(10.2, abs=0.15)
+        finally:
+            player.cleanup()
+
+
+class _TrackedStream(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__(b"RIFF")
+        self.close_calls = 0
+
+    def close(self) -> None:
+        self.close_calls += 1
+        super().close()
+
+
+class TestPygamePreload:
+    def _player(self, monkeypatch: pytest.MonkeyPatch, stream: _TrackedStream):
+        from retro_amp.infrastructure.audio_player import PygameAudioPlayer
+
+        monkeypatch.setattr(PygameAudioPlayer, "_init_mixer", lambda self: None)
+        player = PygameAudioPlayer()
+        player._initialized = True
+        player._current_path = Path("/music/current.sid")
+        monkeypatch.setattr(player, "_load_source", lambda path, subtune=0: stream)
+        return player
+
+    def test_stale_preload_closes_source(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        stream = _TrackedStream()
+        player = self._player(monkeypatch, stream)
+
+        def _load_while_switching(path: Path, subtune: int = 0) -> _TrackedStream:
+            player._current_path = Path("/music/other.sid")
+            return stream
+
+        monkeypatch.setattr(player, "_load_source", _load_while_switching)
+        player.preload(Path("/music/next.sid"))
+        assert stream.close_calls == 1
+        assert player._queued_source is None
+
+    def test_failed_queue_closes_source(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import pygame
+
+        stream = _TrackedStream()
+        player = self._player(monkeypatch, stream)
+
+        def _refuse(source: object) -> None:
+            raise pygame.error("queue kaputt")
+
+        monkeypatch.setattr(pygame.mixer.music, "queue", _refuse)
+        player.preload(Path("/music/next.sid"))
+        assert stream.close_calls == 1
+        assert player._queued_source is None
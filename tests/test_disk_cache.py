@@ -0,0 +1,70 @@
+"""Tests fuer DiskCache (LRU, Groessenlimit) und file_key."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from retro_amp.infrastructure.disk_cache import DiskCache, file_key
+
+
+class TestFileKey:
+    def test_stable_for_unchanged_file(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.mp3"
+        f.write_bytes(b"abc")
+        assert file_key(f) == file_key(f)
+
+    def test_changes_with_mtime(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.mp3"
+        f.write_bytes(b"abc")
+        before = file_key(f)
+        os.utime(f, ns=(1_000_000_000, 1_000_000_000))
+        assert file_key(f) != before
+
+    def test_extra_params_change_key(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.mp3"
+        f.write_bytes(b"abc")
+        assert file_key(f, extra="v1") != file_key(f, extra="v2")
+
+    def test_content_hash_survives_rename(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.mp3"
+        a.write_bytes(b"same content")
+        key = file_key(a, content_hash=True)
+        b = tmp_path / "b.mp3"
+        a.rename(b)
+        assert file_key(b, content_hash=True) == key
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert file_key(tmp_path / "nope.mp3") is None
+
+
+class TestDiskCache:
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        cache = DiskCache("test", cache_dir=tmp_path)
+        assert cache.get("k") is None
+        cache.put("k", b"data")
+        assert cache.get("k") == b"data"
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = DiskCache("test", max_bytes=250, cache_dir=tmp_path)
+        cache.put("old", b"x" * 100)
+        cache.put("used", b"y" * 100)
+        # "old" aelter machen, "used" per Treffer auffrischen
+        os.utime(cache.directory / "old.bin", (1, 1))
+        os.utime(cache.directory / "used.bin", (2, 2))
+        assert cache.get("used") is not None
+
+        cache.put("new", b"z" * 100)
+        assert cache.get("old") is None
+        assert cache.get("used") == b"y" * 100
+        assert cache.get("new") == b"z" * 100
+
+    def test_oversized_entry_not_stored(self, tmp_path: Path) -> None:
+        cache = DiskCache("test", max_bytes=10, cache_dir=tmp_path)
+        cache.put("big", b"x" * 100)
+        assert cache.get("big") is None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        cache = DiskCache("test", cache_dir=tmp_path)
+        cache.put("k", b"data")
+        cache.clear()
+        assert cache.get("k") is None
@@ -0,0 +1,109 @@
+"""Tests fuer das scandir-basierte Auflisten (fs_walk) und stat-freie Reader."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from retro_amp.domain.models import FileEntry
+from retro_amp.infrastructure.fs_walk import ScandirLister, list_dir, walk
+from retro_amp.infrastructure.library_index import CachingMetadataReader
+from retro_amp.infrastructure.metadata_reader import MutagenMetadataReader
+from retro_amp.services.metadata_service import MetadataService
+
+
+def _tree(root: Path) -> None:
+    (root / "a.mp3").write_bytes(b"x" * 3)
+    (root / "B.SID").write_bytes(b"x" * 5)
+    (root / "notes.txt").write_bytes(b"")
+    (root / "sub").mkdir()
+    (root / "sub" / "deep.mod").write_bytes(b"")
+    (root / "sub" / "inner").mkdir()
+
+
+class TestListDir:
+    def test_entries_carry_type_and_stat(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        entries = {e.path.name: e for e in list_dir(tmp_path)}
+        assert set(entries) == {"a.mp3", "B.SID", "notes.txt", "sub"}
+        assert entries["sub"].is_dir
+        assert not entries["a.mp3"].is_dir
+        assert entries["B.SID"].size == 5
+        assert entries["a.mp3"].mtime_ns == (tmp_path / "a.mp3").stat().st_mtime_ns
+
+    def test_suffix_filter_skips_dirs(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        (tmp_path / "folder.mp3").mkdir()
+        names = sorted(e.path.name for e in list_dir(tmp_path, suffixes={".mp3", ".sid"}))
+        assert names == ["B.SID", "a.mp3"]
+
+    def test_without_stat(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        entry = next(e for e in list_dir(tmp_path, stat_files=False) if e.path.name == "a.mp3")
+        assert not entry.has_stat
+        assert entry.modified_date == ""
+
+    def test_missing_directory_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            list_dir(tmp_path / "missing")
+
+
+class TestWalk:
+    def test_recurses(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        found = {e.path.relative_to(tmp_path).as_posix(): e.is_dir for e in walk(tmp_path)}
+        assert found == {
+            "a.mp3": False, "B.SID": False, "notes.txt": False,
+            "sub": True, "sub/deep.mod": False, "sub/inner": True,
+        }
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="keine Symlinks")
+    def test_does_not_follow_dir_symlinks(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        try:
+            (tmp_path / "sub" / "loop").symlink_to(tmp_path, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlinks nicht erlaubt")
+        names = [e.path.name for e in walk(tmp_path)]
+        assert names.count("a.mp3") == 1
+        assert "loop" in names
+
+    def test_should_stop(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        assert list(walk(tmp_path, should_stop=lambda: True)) == []
+
+
+class TestNoExtraStat:
+    def test_scan_uses_listing_stat_only(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        music = tmp_path / "music"
+        music.mkdir()
+        for i in range(5):
+            (music / f"{i}.mod").write_bytes(b"x" * 1100)
+        reader = CachingMetadataReader(MutagenMetadataReader(), database=tmp_path / "lib.db")
+        service = MetadataService(reader, ScandirLister())
+        expected = service.scan_directory(music)
+
+        calls: list[object] = []
+        real_stat = os.stat
+
+        def _counting_stat(*args: object, **kwargs: object) -> os.stat_result:
+            calls.append(args[0])
+            return real_stat(*args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(os, "stat", _counting_stat)
+        for _ in range(2):
+            tracks = service.scan_directory(music)
+        monkeypatch.undo()
+
+        assert calls == []
+        assert tracks == expected
+        assert tracks[0].file_size_bytes == 1100
+
+    def test_reader_takes_size_and_date_from_entry(self, tmp_path: Path) -> None:
+        song = tmp_path / "song.mod"
+        song.write_bytes(b"x" * 1100)
+        entry = FileEntry(song, size=4242, mtime_ns=1_700_000_000_000_000_000)
+        track = MutagenMetadataReader().read(song, entry)
+        assert track.file_size_bytes == 4242
+        assert track.modified_date.startswith("2023-11-14")
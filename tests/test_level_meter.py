@@ -0,0 +1,99 @@
+"""Tests fuer den Pegel-Index (Prefix-Summen + Sparse-Table)."""
+from __future__ import annotations
+
+import array
+import math
+import random
+
+import pytest
+
+from retro_amp.infrastructure import level_meter
+from retro_amp.infrastructure.level_meter import (
+    LEVEL_BLOCK,
+    ChannelLevels,
+    LevelIndex,
+    LevelIndexBuilder,
+)
+
+
+def _noise(frames: int, channels: int, seed: int = 1) -> array.array[int]:
+    rng = random.Random(seed)
+    return array.array("h", (rng.randint(-30000, 30000) for _ in range(frames * channels)))
+
+
+def _brute_force(pcm: array.array[int], channels: int, first: int, last: int) -> list[ChannelLevels]:
+    """Referenz: direkte Berechnung ueber ganze Bloecke [first, last)."""
+    result = []
+    for ch in range(min(channels, 2)):
+        seg = pcm[first * LEVEL_BLOCK * channels + ch:last * LEVEL_BLOCK * channels:channels]
+        count = (last - first) * LEVEL_BLOCK
+        rms = math.sqrt(sum(s * s for s in seg) / count) / 32768.0
+        peak = max(abs(s) for s in seg) / 32768.0
+        result.append(ChannelLevels(rms, peak))
+    return result
+
+
+def _build(pcm: array.array[int], channels: int, chunk: int | None = None) -> LevelIndex:
+    builder = LevelIndexBuilder(44100, channels)
+    if chunk is None:
+        builder.feed(memoryview(pcm))
+    else:
+        for offset in range(0, len(pcm), chunk):
+            builder.feed(pcm[offset:offset + chunk])
+    return builder.finish()
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(level_meter, "_HAS_NUMPY", request.param)
+
+
+class TestLevelIndex:
+    @pytest.mark.usefixtures("backend")
+    def test_matches_brute_force(self) -> None:
+        """RMS und Spitze fuer beliebige Fenster wie direkt berechnet."""
+        blocks = 300
+        pcm = _noise(blocks * LEVEL_BLOCK, 2)
+        index = _build(pcm, 2)
+        rng = random.Random(7)
+        for _ in range(40):
+            first = rng.randrange(blocks)
+            last = rng.randrange(first + 1, blocks + 1)
+            actual = index.levels(first * LEVEL_BLOCK, last * LEVEL_BLOCK)
+            for got, want in zip(actual, _brute_force(pcm, 2, first, last)):
+                assert got.rms == pytest.approx(want.rms, rel=1e-9)
+                assert got.peak == want.peak
+
+    @pytest.mark.usefixtures("backend")
+    def test_chunked_feed_equals_single_feed(self) -> None:
+        pcm = _noise(50 * LEVEL_BLOCK + 123, 2)
+        whole = _build(pcm, 2)
+        chunked = _build(pcm, 2, chunk=3001)
+        assert whole.total_frames == chunked.total_frames == 50 * LEVEL_BLOCK + 123
+        for start in range(0, 51 * LEVEL_BLOCK, 4000):
+            assert whole.levels(start, start + 5000) == chunked.levels(start, start + 5000)
+
+    def test_long_window_beyond_sparse_levels(self) -> None:
+        """Fenster laenger als die groesste Sparse-Table-Stufe bleiben exakt."""
+        blocks = 700
+        pcm = array.array("h", [0] * blocks * LEVEL_BLOCK)
+        pcm[500 * LEVEL_BLOCK + 17] = -32768
+        index = _build(pcm, 1)
+        assert index.levels(0, blocks * LEVEL_BLOCK)[0].peak == 1.0
+        assert index.levels(0, 500 * LEVEL_BLOCK)[0].peak == 0.0
+
+    def test_outside_track_is_silent(self) -> None:
+        index = _build(_noise(10 * LEVEL_BLOCK, 2), 2)
+        assert index.levels(-5000, 0) == [ChannelLevels(0.0, 0.0)] * 2
+        assert index.levels(20 * LEVEL_BLOCK, 21 * LEVEL_BLOCK) == [ChannelLevels(0.0, 0.0)] * 2
+
+    def test_serialization_roundtrip(self) -> None:
+        index = _build(_noise(40 * LEVEL_BLOCK, 2), 2)
+        restored = LevelIndex.from_bytes(index.to_bytes())
+        assert restored is not None
+        assert restored.total_frames == index.total_frames
+        assert restored.levels(1000, 30000) == index.levels(1000, 30000)
+        assert LevelIndex.from_bytes(index.to_bytes()[:-1]) is None
+        assert LevelIndex.from_bytes(b"") is None
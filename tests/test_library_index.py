@@ -0,0 +1,93 @@
+"""Tests fuer den persistenten Track-Index (CachingMetadataReader)."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from retro_amp.domain.models import AudioFormat, AudioTrack, FileEntry
+from retro_amp.infrastructure.library_index import CachingMetadataReader
+
+
+class _CountingReader:
+    def __init__(self) -> None:
+        self.reads: list[Path] = []
+
+    def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+        self.reads.append(path)
+        return AudioTrack(
+            path=path,
+            title=f"Titel {len(self.reads)}",
+            artist="Artist",
+            duration_seconds=123.5,
+            bitrate_kbps=256,
+            file_size_bytes=path.stat().st_size,
+            subtune_count=3,
+            subtune_durations=(10.0, 20.5, 30.0),
+        )
+
+
+def _song(tmp_path: Path, name: str = "song.sid") -> Path:
+    path = tmp_path / name
+    path.write_bytes(b"x" * 100)
+    return path
+
+
+class TestCachingMetadataReader:
+    def test_hit_returns_all_fields_without_reading(self, tmp_path: Path) -> None:
+        song = _song(tmp_path)
+        inner = _CountingReader()
+        reader = CachingMetadataReader(inner, database=tmp_path / "library.db")
+        first = reader.read(song)
+        second = reader.read(song)
+        assert inner.reads == [song]
+        assert second == first
+        assert second.format == AudioFormat.SID
+        assert second.subtune_durations == (10.0, 20.5, 30.0)
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        song = _song(tmp_path)
+        db = tmp_path / "library.db"
+        first = CachingMetadataReader(_CountingReader(), database=db)
+        expected = first.read(song)
+        first.close()
+
+        inner = _CountingReader()
+        second = CachingMetadataReader(inner, database=db)
+        assert second.read(song) == expected
+        assert inner.reads == []
+
+    def test_changed_file_is_read_again(self, tmp_path: Path) -> None:
+        song = _song(tmp_path)
+        inner = _CountingReader()
+        reader = CachingMetadataReader(inner, database=tmp_path / "library.db")
+        reader.read(song)
+        song.write_bytes(b"y" * 200)
+        stat = song.stat()
+        os.utime(song, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert reader.read(song).title == "Titel 2"
+        assert len(inner.reads) == 2
+
+    def test_other_variant_misses(self, tmp_path: Path) -> None:
+        song = _song(tmp_path)
+        db = tmp_path / "library.db"
+        CachingMetadataReader(_CountingReader(), database=db).read(song)
+        inner = _CountingReader()
+        CachingMetadataReader(inner, database=db, variant="songlengths=/x").read(song)
+        assert inner.reads == [song]
+
+    def test_unusable_database_falls_back(self, tmp_path: Path) -> None:
+        song = _song(tmp_path)
+        blocker = tmp_path / "blocker"
+        blocker.write_text("keine Datenbank")
+        inner = _CountingReader()
+        reader = CachingMetadataReader(inner, database=blocker / "library.db")
+        reader.read(song)
+        reader.read(song)
+        assert len(inner.reads) == 2
+
+    def test_missing_file_goes_to_reader(self, tmp_path: Path) -> None:
+        inner = _CountingReader()
+        reader = CachingMetadataReader(inner, database=tmp_path / "library.db")
+        missing = tmp_path / "missing.mp3"
+        inner.read = lambda path, entry=None: AudioTrack(path=path)  # type: ignore[method-assign]
+        assert reader.read(missing).path == missing
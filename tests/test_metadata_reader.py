@@ -98,3 +98,50 @@ class TestMutagenReaderTrackerFormats:
         track = reader.read(sid_file)
         assert track.title == "Commando"
         assert track.artist == "Rob Hubbard"
+
+
+def _sid_header(songs: int, start_song: int, name: bytes = b"", author: bytes = b"") -> bytes:
+    header = bytearray(0x7C)
+    header[0:4] = b"RSID"
+    header[0x04:0x06] = (2).to_bytes(2, "big")
+    header[0x0E:0x10] = songs.to_bytes(2, "big")
+    header[0x10:0x12] = start_song.to_bytes(2, "big")
+    header[0x16:0x16 + len(name)] = name
+    header[0x36:0x36 + len(author)] = author
+    header[0x56:0x5A] = b"1987"
+    return bytes(header)
+
+
+class TestSidHeader:
+    """Tests fuer den vollstaendigen PSID/RSID-Header."""
+
+    def test_all_fields(self) -> None:
+        from retro_amp.infrastructure.sid_header import parse_sid_header
+
+        header = parse_sid_header(_sid_header(12, 3, b"Delta", b"Rob Hubbard"))
+        assert header is not None
+        assert (header.magic, header.version) == ("RSID", 2)
+        assert (header.songs, header.start_song) == (12, 3)
+        assert (header.name, header.author, header.released) == ("Delta", "Rob Hubbard", "1987")
+        assert header.is_multi_tune
+
+    def test_invalid_start_song_falls_back(self) -> None:
+        from retro_amp.infrastructure.sid_header import parse_sid_header
+
+        header = parse_sid_header(_sid_header(2, 9))
+        assert header is not None
+        assert header.start_song == 1
+
+    def test_foreign_data(self) -> None:
+        from retro_amp.infrastructure.sid_header import parse_sid_header
+
+        assert parse_sid_header(b"MThd" + bytes(200)) is None
+        assert parse_sid_header(b"PSID") is None
+
+    def test_reader_sets_subtune_count(self, tmp_path: Path) -> None:
+        sid_file = tmp_path / "multi.sid"
+        sid_file.write_bytes(_sid_header(5, 2, b"Delta", b"Rob Hubbard"))
+        track = MutagenMetadataReader().read(sid_file)
+        assert track.subtune_count == 5
+        assert track.title == "Delta"
+        assert track.artist == "Rob Hubbard"
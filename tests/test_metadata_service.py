@@ -1,42 +1,138 @@
 """Tests fuer MetadataService."""
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
-from retro_amp.domain.models import AudioFormat, AudioTrack
+from retro_amp.domain.models import AudioTrack, FileEntry
 from retro_amp.services.metadata_service import MetadataService
 
 
 class TestMetadataService:
-    def test_read_track(self, mock_metadata_reader) -> None:
+    def test_read_track(self, directory_lister, mock_metadata_reader) -> None:
         path = Path("/music/song.mp3")
         expected = AudioTrack(path=path, title="Testsong", bitrate_kbps=320)
         mock_metadata_reader.tracks[path] = expected
 
-        service = MetadataService(mock_metadata_reader)
+        service = MetadataService(mock_metadata_reader, directory_lister)
         result = service.read_track(path)
 
         assert result.title == "Testsong"
         assert result.bitrate_kbps == 320
 
-    def test_read_unknown_track_returns_default(self, mock_metadata_reader) -> None:
-        service = MetadataService(mock_metadata_reader)
+    def test_read_unknown_track_returns_default(self, directory_lister, mock_metadata_reader) -> None:
+        service = MetadataService(mock_metadata_reader, directory_lister)
         result = service.read_track(Path("/music/unknown.mp3"))
 
         assert result.title == ""
         assert result.bitrate_kbps == 0
 
-    def test_is_audio_file(self, mock_metadata_reader) -> None:
-        service = MetadataService(mock_metadata_reader)
+    def test_is_audio_file(self, directory_lister, mock_metadata_reader) -> None:
+        service = MetadataService(mock_metadata_reader, directory_lister)
         assert service.is_audio_file(Path("/music/song.mp3"))
         assert service.is_audio_file(Path("/music/song.flac"))
         assert service.is_audio_file(Path("/music/song.mod"))
         assert not service.is_audio_file(Path("/music/readme.txt"))
         assert not service.is_audio_file(Path("/music/image.png"))
 
-    def test_scan_nonexistent_directory(self, mock_metadata_reader) -> None:
-        service = MetadataService(mock_metadata_reader)
+    def test_scan_nonexistent_directory(self, directory_lister, mock_metadata_reader) -> None:
+        service = MetadataService(mock_metadata_reader, directory_lister)
         result = service.scan_directory(Path("/nonexistent"))
         assert result == []
+
+    def test_scan_expands_sid_subtunes(self, directory_lister, mock_metadata_reader, tmp_path: Path) -> None:
+        multi = tmp_path / "multi.sid"
+        single = tmp_path / "single.sid"
+        multi.write_bytes(b"PSID")
+        single.write_bytes(b"PSID")
+        mock_metadata_reader.tracks[multi] = AudioTrack(path=multi, subtune_count=3)
+        mock_metadata_reader.tracks[single] = AudioTrack(path=single)
+
+        service = MetadataService(mock_metadata_reader, directory_lister)
+        result = service.scan_directory(tmp_path)
+
+        assert [(t.path.name, t.subtune) for t in result] == [
+            ("multi.sid", 1), ("multi.sid", 2), ("multi.sid", 3), ("single.sid", 0),
+        ]
+
+    def test_parallel_scan_keeps_sorted_order(self, directory_lister, tmp_path: Path) -> None:
+        names = [f"{i:03d}.mp3" for i in range(40)]
+        for name in names:
+            (tmp_path / name).write_bytes(b"")
+        active: list[int] = [0]
+        peak: list[int] = [0]
+        lock = threading.Lock()
+
+        class _SlowReader:
+            def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                # Spaete Dateien zuerst fertig, damit die Reihenfolge zaehlt
+                time.sleep(0.002 * (40 - int(path.stem)) / 40)
+                time.sleep(0.005)
+                with lock:
+                    active[0] -= 1
+                return AudioTrack(path=path, title=path.stem)
+
+        service = MetadataService(_SlowReader(), directory_lister, workers=8)
+        result = service.scan_directory(tmp_path)
+
+        assert [t.path.name for t in result] == names
+        assert peak[0] > 1
+
+    def test_single_worker_reads_sequentially(self, directory_lister, mock_metadata_reader, tmp_path: Path) -> None:
+        for name in ("b.mp3", "a.mp3"):
+            (tmp_path / name).write_bytes(b"")
+        service = MetadataService(mock_metadata_reader, directory_lister, workers=0)
+        assert [t.path.name for t in service.scan_directory(tmp_path)] == ["a.mp3", "b.mp3"]
+
+    def test_iter_metadata_flushes_during_slow_read(self, directory_lister) -> None:
+        release = threading.Event()
+
+        class _OneSlowReader:
+            def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+                if path.name == "02.mp3":
+                    release.wait(5.0)
+                return AudioTrack(path=path)
+
+        entries = [FileEntry(Path(f"/music/{i:02d}.mp3")) for i in range(5)]
+        batches = MetadataService(_OneSlowReader(), directory_lister, workers=4).iter_metadata(
+            entries, batch_size=64, interval=0.05,
+        )
+        try:
+            first = next(batches)
+            assert not release.is_set()
+            assert [t.path.name for t in first] == ["00.mp3", "01.mp3"]
+        finally:
+            release.set()
+        assert [t.path.name for b in batches for t in b] == ["02.mp3", "03.mp3", "04.mp3"]
+
+    def test_iter_metadata_batches_in_order(self, directory_lister, mock_metadata_reader) -> None:
+        paths = [Path(f"/music/{i:02d}.mp3") for i in range(10)]
+        service = MetadataService(mock_metadata_reader, directory_lister, workers=4)
+
+        entries = [FileEntry(path) for path in paths]
+        batches = list(service.iter_metadata(entries, batch_size=4, interval=60.0))
+
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert [t.path for b in batches for t in b] == paths
+
+    def test_iter_metadata_stops_early(self, directory_lister, tmp_path: Path) -> None:
+        reads: list[Path] = []
+
+        class _SlowReader:
+            def read(self, path: Path, entry: FileEntry | None = None) -> AudioTrack:
+                reads.append(path)
+                time.sleep(0.01)
+                return AudioTrack(path=path)
+
+        entries = [FileEntry(Path(f"/music/{i:03d}.mp3")) for i in range(200)]
+        batches = MetadataService(_SlowReader(), directory_lister, workers=2).iter_metadata(entries, batch_size=2)
+        next(batches)
+        batches.close()
+        time.sleep(0.05)
+        assert len(reads) < len(entries)
@@ -0,0 +1,223 @@
+"""Tests fuer den miniaudio-Streaming-Player (Null-Backend, keine Soundkarte noetig)."""
+from __future__ import annotations
+
+import array
+import math
+import time
+import wave
+from pathlib import Path
+
+import pytest
+
+miniaudio = pytest.importorskip("miniaudio")
+
+from retro_amp.infrastructure.miniaudio_player import (  # noqa: E402
+    MiniaudioAudioPlayer,
+    _pcm_source,
+    _Preloaded,
+    _scale,
+    _to_stereo,
+)
+
+
+def _memory_source(samples: array.array[int], sample_rate: int, channels: int = 2):
+    """Quelle ueber In-Memory-PCM (Opener liefert Bytes ab einem Frame)."""
+
+    def _open(start_frame: int):
+        yield samples[start_frame * channels:].tobytes()
+
+    return _pcm_source(channels, sample_rate, _open)
+
+
+def _write_wav(path: Path, seconds: float, sample_rate: int = 44100) -> None:
+    n = int(seconds * sample_rate)
+    pcm = array.array("h", (int(8000 * math.sin(2 * math.pi * 440 * i / sample_rate)) for i in range(n)))
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def player():
+    p = MiniaudioAudioPlayer(buffer_msec=50, backends=[miniaudio.Backend.NULL])
+    yield p
+    p.cleanup()
+
+
+class TestHelpers:
+    def test_mono_to_stereo(self) -> None:
+        assert list(_to_stereo(array.array("h", [1, 2, 3]), 1)) == [1, 1, 2, 2, 3, 3]
+
+    def test_multichannel_keeps_first_two(self) -> None:
+        chunk = array.array("h", [1, 2, 3, 4, 5, 6])
+        assert list(_to_stereo(chunk, 3)) == [1, 2, 4, 5]
+
+    def test_scale(self) -> None:
+        chunk = array.array("h", [1000, -1000])
+        assert _scale(chunk, 1.0) is chunk
+        scaled = array.array("h")
+        scaled.frombytes(bytes(_scale(chunk, 0.5)))
+        assert list(scaled) == [500, -500]
+
+    def test_pcm_source_seek(self) -> None:
+        samples = array.array("h", range(20))
+        source = _memory_source(samples, 8000)
+        stream = source.open(3)
+        assert list(stream.send(2)) == [6, 7, 8, 9]
+        assert list(stream.send(100)) == list(range(10, 20))
+        with pytest.raises(StopIteration):
+            stream.send(1)
+
+    def test_pcm_source_mono_upmix(self) -> None:
+        source = _memory_source(array.array("h", [1, 2, 3]), 8000, channels=1)
+        assert list(source.open(1).send(10)) == [2, 2, 3, 3]
+
+
+class TestMiniaudioAudioPlayer:
+    def test_plays_to_end(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        wav = tmp_path / "short.wav"
+        _write_wav(wav, 0.3)
+        player.play(wav)
+        assert player.is_busy()
+        assert _wait_until(lambda: not player.is_busy())
+        assert player.get_position() == pytest.approx(0.3, abs=0.01)
+
+    def test_position_advances(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav, 5.0)
+        player.play(wav)
+        assert _wait_until(lambda: player.get_position() >= 0.2)
+        assert player.get_position() < 5.0
+
+    def test_seek_is_frame_exact(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav, 5.0)
+        player.play(wav)
+        player.pause()
+        player.seek(3.5)
+        assert player.get_position() == pytest.approx(3.5, abs=1e-4)
+        player.unpause()
+        assert _wait_until(lambda: player.get_position() > 3.6)
+
+    def test_pause_freezes_position(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav, 5.0)
+        player.play(wav)
+        assert _wait_until(lambda: player.get_position() > 0.1)
+        player.pause()
+        time.sleep(0.1)
+        frozen = player.get_position()
+        time.sleep(0.2)
+        assert player.get_position() == frozen
+        assert not player.is_busy()
+
+    def test_stop(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav, 5.0)
+        player.play(wav)
+        player.stop()
+        assert not player.is_busy()
+        assert player.get_position() == 0.0
+
+    def test_sample_rate_follows_source(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav, 2.0, sample_rate=22050)
+        player.play(wav)
+        player.pause()
+        player.seek(1.0)
+        assert player.get_position() == pytest.approx(1.0, abs=1e-4)
+
+    def test_unsupported_format(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        other = tmp_path / "notes.txt"
+        other.write_text("kein Audio")
+        player.play(other)
+        assert not player.is_busy()
+
+
+class TestGapless:
+    def test_handover_without_silence(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        _write_wav(first, 0.3)
+        _write_wav(second, 2.0)
+        player.play(first)
+        player.preload(second)
+
+        assert _wait_until(lambda: player.playing_path() == second)
+        assert player.is_busy()
+        assert _wait_until(lambda: player.get_position() > 0.1)
+        assert player.get_position() < 2.0
+
+    def test_preload_ignored_for_other_sample_rate(
+        self, player: MiniaudioAudioPlayer, tmp_path: Path,
+    ) -> None:
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        _write_wav(first, 0.3)
+        _write_wav(second, 0.3, sample_rate=22050)
+        player.play(first)
+        player.preload(second)
+
+        assert _wait_until(lambda: not player.is_busy())
+        assert player.playing_path() == first
+
+    def test_play_uses_preloaded_stream(self, player: MiniaudioAudioPlayer, tmp_path: Path) -> None:
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        _write_wav(first, 5.0)
+        _write_wav(second, 5.0)
+        player.play(first)
+        player.preload(second)
+        player.play(second)
+
+        assert player.playing_path() == second
+        assert player.is_busy()
+
+    def test_boundary_is_sample_continuous(self) -> None:
+        """Ende und Anfang landen im selben Callback-Puffer, ohne Stille dazwischen."""
+        player = MiniaudioAudioPlayer()
+        first = _memory_source(array.array("h", [1] * 6), 8000)
+        second = _memory_source(array.array("h", [2] * 20), 8000)
+        player._source = first
+        player._stream = first.open(0)
+        player._ended = False
+        player._next = _Preloaded(Path("b.wav"), second, second.open(0))
+
+        out = array.array("h")
+        out.frombytes(bytes(player._read(5)))
+        assert list(out) == [1] * 6 + [2] * 4
+        assert player.playing_path() == Path("b.wav")
+        assert player._frames == 2
+        assert player._delivered == 2
+
+    def test_handover_closes_old_source_outside_callback(self) -> None:
+        """Der abgeloeste Track wird erst im Steuer-Thread geschlossen."""
+        closed: list[str] = []
+        player = MiniaudioAudioPlayer()
+        samples = array.array("h", [1] * 6)
+        first = _pcm_source(
+            2, 8000, lambda frame: iter([samples[frame * 2:].tobytes()]),
+            close=lambda: closed.append("a"),
+        )
+        second = _memory_source(array.array("h", [2] * 20), 8000)
+        player._source = first
+        player._stream = first.open(0)
+        player._ended = False
+        player._next = _Preloaded(Path("b.wav"), second, second.open(0))
+
+        player._read(5)
+        assert closed == []
+        assert player.playing_path() == Path("b.wav")
+        assert closed == ["a"]
+        assert player._retired == []
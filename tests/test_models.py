@@ -74,6 +74,21 @@ class TestAudioTrack:
         track = AudioTrack(path=Path("/x.mp3"))
         assert track.format_display == "MP3"
 
+    def test_subtunes_expanded(self) -> None:
+        track = AudioTrack(
+            path=Path("/x.sid"), title="Tune", subtune_count=3, subtune_durations=(10.0, 20.0),
+        )
+        subtunes = track.subtunes()
+        assert [s.subtune for s in subtunes] == [1, 2, 3]
+        assert [s.duration_seconds for s in subtunes] == [10.0, 20.0, 0.0]
+        assert subtunes[1].display_name == "Tune (2/3)"
+        assert len({s.row_key for s in subtunes}) == 3
+
+    def test_single_tune_not_expanded(self) -> None:
+        track = AudioTrack(path=Path("/x.sid"))
+        assert track.subtunes() == [track]
+        assert track.row_key == "/x.sid"
+
 
 class TestPlayerState:
     def test_default_state_is_stopped(self) -> None:
@@ -111,6 +126,15 @@ class TestPlayerState:
         state = PlayerState(track_list=tracks, current_index=0)
         assert not state.has_previous
 
+    def test_upcoming_track(self) -> None:
+        tracks = [
+            AudioTrack(path=Path("/a.mp3")),
+            AudioTrack(path=Path("/b.mp3")),
+        ]
+        assert PlayerState(track_list=tracks, current_index=0).upcoming_track == tracks[1]
+        assert PlayerState(track_list=tracks, current_index=1).upcoming_track is None
+        assert PlayerState(track_list=tracks).upcoming_track is None
+
     def test_progress_calculation(self) -> None:
         track = AudioTrack(path=Path("/x.mp3"), duration_seconds=100.0)
         state = PlayerState(
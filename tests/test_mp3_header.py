@@ -0,0 +1,157 @@
+"""Tests fuer den schnellen MP3-Header-Parser (Abgleich mit mutagen)."""
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import mutagen
+import pytest
+
+from retro_amp.infrastructure.metadata_reader import MutagenMetadataReader
+from retro_amp.infrastructure.mp3_header import read_mp3_info
+
+# MPEG1 Layer III, 128 kbit/s, 44.1 kHz, Joint Stereo -> 417 Bytes pro Frame
+_HEADER_128 = b"\xff\xfb\x90\x40"
+_FRAME_128 = 417
+# MPEG1 Layer III, 64 kbit/s, 44.1 kHz, Mono -> 208 Bytes
+_HEADER_64_MONO = b"\xff\xfb\x50\xc0"
+_FRAME_64 = 208
+
+
+def _frame(header: bytes = _HEADER_128, length: int = _FRAME_128) -> bytes:
+    return header + bytes(length - 4)
+
+
+def _text_frame(frame_id: bytes, text: str, major: int = 3, encoding: int = 1) -> bytes:
+    codec = {0: "latin-1", 1: "utf-16", 3: "utf-8"}[encoding]
+    body = bytes([encoding]) + text.encode(codec)
+    if major == 2:
+        return frame_id + len(body).to_bytes(3, "big") + body
+    if major == 4:
+        size = bytes((len(body) >> s) & 0x7F for s in (21, 14, 7, 0))
+    else:
+        size = len(body).to_bytes(4, "big")
+    return frame_id + size + b"\x00\x00" + body
+
+
+def _id3(frames: bytes, major: int = 3, flags: int = 0, padding: int = 64) -> bytes:
+    size = len(frames) + padding
+    syncsafe = bytes((size >> s) & 0x7F for s in (21, 14, 7, 0))
+    return b"ID3" + bytes([major, 0, flags]) + syncsafe + frames + bytes(padding)
+
+
+def _tags_v23() -> bytes:
+    apic = b"\x00image/jpeg\x00\x03\x00" + bytes(20000)
+    return _id3(
+        _text_frame(b"TIT2", "Straße")
+        + _text_frame(b"TPE1", "Kraftwerk")
+        + b"APIC" + len(apic).to_bytes(4, "big") + b"\x00\x00" + apic
+        + _text_frame(b"TALB", "Autobahn")
+    )
+
+
+def _xing_frame(frames: int, total_bytes: int, delay: int = 576, padding: int = 1200) -> bytes:
+    xing = b"Xing" + struct.pack(">III", 0x3, frames, total_bytes)
+    lame = bytearray(36)
+    lame[:9] = b"LAME3.100"
+    lame[21] = delay >> 4
+    lame[22] = ((delay & 0x0F) << 4) | (padding >> 8)
+    lame[23] = padding & 0xFF
+    body = bytearray(_frame())
+    body[36:36 + len(xing)] = xing
+    body[36 + len(xing):36 + len(xing) + 36] = lame
+    return bytes(body)
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.write_bytes(data)
+    return path
+
+
+def _assert_matches_mutagen(path: Path) -> None:
+    info = read_mp3_info(path)
+    reference = mutagen.File(str(path))
+    assert info is not None
+    assert info.duration_seconds == pytest.approx(reference.info.length, abs=1e-6)
+    assert info.bitrate == reference.info.bitrate
+    assert info.sample_rate == reference.info.sample_rate
+    tags = reference.tags
+    for field, frame_id in (("title", "TIT2"), ("artist", "TPE1"), ("album", "TALB")):
+        expected = str(tags[frame_id].text[0]) if tags and frame_id in tags else ""
+        assert getattr(info, field) == expected
+
+
+class TestReadMp3Info:
+    def test_vbr_with_xing_and_lame(self, tmp_path: Path) -> None:
+        audio = _frame() * 40
+        path = _write(tmp_path / "vbr.mp3", _tags_v23() + _xing_frame(40, len(audio) + _FRAME_128) + audio)
+        info = read_mp3_info(path)
+        assert info is not None
+        assert (info.title, info.artist, info.album) == ("Straße", "Kraftwerk", "Autobahn")
+        assert info.duration_seconds == pytest.approx((40 * 1152 - 576 - 1200) / 44100)
+        _assert_matches_mutagen(path)
+
+    def test_cbr_without_vbr_header(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "cbr.mp3", _tags_v23() + _frame() * 30)
+        info = read_mp3_info(path)
+        assert info is not None
+        assert info.bitrate == 128000
+        _assert_matches_mutagen(path)
+
+    def test_mono_xing_offset(self, tmp_path: Path) -> None:
+        first = bytearray(_frame(_HEADER_64_MONO, _FRAME_64))
+        first[21:33] = b"Info" + struct.pack(">II", 0x1, 25)
+        path = _write(tmp_path / "mono.mp3", bytes(first) + _frame(_HEADER_64_MONO, _FRAME_64) * 25)
+        _assert_matches_mutagen(path)
+
+    def test_vbri(self, tmp_path: Path) -> None:
+        first = bytearray(_frame())
+        vbri = struct.pack(">4sHHHIIHHHH", b"VBRI", 1, 0, 50, 20 * _FRAME_128, 20, 2, 1, 2, 10)
+        first[36:36 + len(vbri) + 4] = vbri + b"\x00\x10\x00\x10"
+        path = _write(tmp_path / "vbri.mp3", bytes(first) + _frame() * 20)
+        info = read_mp3_info(path)
+        assert info is not None
+        assert info.duration_seconds == pytest.approx(20 * 1152 / 44100)
+        _assert_matches_mutagen(path)
+
+    def test_id3v24_and_v22(self, tmp_path: Path) -> None:
+        v24 = _id3(_text_frame(b"TIT2", "Café", major=4, encoding=3), major=4)
+        path = _write(tmp_path / "v24.mp3", v24 + _frame() * 10)
+        _assert_matches_mutagen(path)
+        v22 = _id3(_text_frame(b"TT2", "Alt", major=2, encoding=0) + _text_frame(b"TP1", "Band", major=2), major=2)
+        path = _write(tmp_path / "v22.mp3", v22 + _frame() * 10)
+        info = read_mp3_info(path)
+        assert info is not None
+        assert (info.title, info.artist) == ("Alt", "Band")
+
+    def test_id3v1_fills_missing_fields(self, tmp_path: Path) -> None:
+        v1 = b"TAG" + b"Titel".ljust(30, b"\x00") + b"Artist".ljust(30, b"\x00") + bytes(65)
+        path = _write(tmp_path / "v1.mp3", _frame() * 10 + v1)
+        info = read_mp3_info(path)
+        assert info is not None
+        assert (info.title, info.artist, info.album) == ("Titel", "Artist", "")
+
+    def test_unsupported_input_returns_none(self, tmp_path: Path) -> None:
+        unsync = _id3(_text_frame(b"TIT2", "x"), flags=0x80)
+        assert read_mp3_info(_write(tmp_path / "unsync.mp3", unsync + _frame() * 5)) is None
+        assert read_mp3_info(_write(tmp_path / "noise.mp3", b"\xff\x00" * 5000)) is None
+        assert read_mp3_info(tmp_path / "missing.mp3") is None
+
+
+class TestReaderFastPath:
+    def test_reader_uses_header_values(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        audio = _frame() * 40
+        path = _write(tmp_path / "vbr.mp3", _tags_v23() + _xing_frame(40, len(audio) + _FRAME_128) + audio)
+        monkeypatch.setattr(mutagen, "File", lambda *_: pytest.fail("mutagen aufgerufen"))
+        track = MutagenMetadataReader().read(path)
+        assert (track.title, track.artist, track.album) == ("Straße", "Kraftwerk", "Autobahn")
+        assert track.bitrate_kbps == 127  # aus Xing-Bytes/-Frames, wie mutagen
+        assert track.sample_rate == 44100
+
+    def test_falls_back_to_mutagen(self, tmp_path: Path) -> None:
+        unsync = _id3(_text_frame(b"TIT2", "Fallback"), flags=0x80)
+        path = _write(tmp_path / "Band - Song.mp3", unsync + _frame() * 5)
+        track = MutagenMetadataReader().read(path)
+        assert track.title == "Fallback"
+        assert track.artist == "Band"
+        assert track.bitrate_kbps == 128
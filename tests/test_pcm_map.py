@@ -0,0 +1,173 @@
+"""Tests fuer das Memory-Mapping von WAV/RF64/AIFF-Dateien."""
+from __future__ import annotations
+
+import array
+import struct
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+from retro_amp.infrastructure.pcm_map import MappedPcm, _parse_extended
+from retro_amp.infrastructure.spectrum import SpectrumAnalyzer
+
+
+def _pcm(frames: int, channels: int) -> array.array[int]:
+    return array.array("h", ((i * 7919) % 65536 - 32768 for i in range(frames * channels)))
+
+
+def _le_bytes(pcm: array.array[int]) -> bytes:
+    data = array.array("h", pcm)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _be_bytes(pcm: array.array[int]) -> bytes:
+    data = array.array("h", pcm)
+    if sys.byteorder == "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _write_wav(path: Path, pcm: array.array[int], channels: int, rate: int = 44100) -> None:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(_le_bytes(pcm))
+
+
+def _extended(value: float) -> bytes:
+    """float -> 80-bit IEEE Extended (nur positive Ganzzahlen)."""
+    mantissa = int(value)
+    exponent = 16383 + 63
+    while not mantissa & (1 << 63):
+        mantissa <<= 1
+        exponent -= 1
+    return struct.pack(">HQ", exponent, mantissa)
+
+
+def _write_aiff(path: Path, pcm: array.array[int], channels: int, compression: bytes | None = None) -> None:
+    frames = len(pcm) // channels
+    comm = struct.pack(">hIh", channels, frames, 16) + _extended(44100)
+    form = b"AIFF"
+    data = _be_bytes(pcm)
+    if compression is not None:
+        form = b"AIFC"
+        comm += compression + b"\x00\x00"
+        if compression == b"sowt":
+            data = _le_bytes(pcm)
+    ssnd = struct.pack(">II", 0, 0) + data
+    body = form
+    body += b"COMM" + struct.pack(">I", len(comm)) + comm
+    body += b"SSND" + struct.pack(">I", len(ssnd)) + ssnd
+    path.write_bytes(b"FORM" + struct.pack(">I", len(body)) + body)
+
+
+def _write_rf64(path: Path, pcm: array.array[int], channels: int) -> None:
+    data = _le_bytes(pcm)
+    fmt = struct.pack("<HHIIHH", 1, channels, 44100, 44100 * 2 * channels, 2 * channels, 16)
+    ds64 = struct.pack("<QQQI", 0, len(data), len(pcm) // channels, 0)
+    body = b"WAVE"
+    body += b"ds64" + struct.pack("<I", len(ds64)) + ds64
+    body += b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", 0xFFFFFFFF) + data
+    path.write_bytes(b"RF64" + struct.pack("<I", 0xFFFFFFFF) + body)
+
+
+class TestMappedPcm:
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_wav_reads_match_samples(self, tmp_path: Path, channels: int) -> None:
+        pcm = _pcm(5000, channels)
+        path = tmp_path / "a.wav"
+        _write_wav(path, pcm, channels)
+        mapped = MappedPcm.open(path)
+        assert mapped is not None
+        assert (mapped.sample_rate, mapped.channels, mapped.frames) == (44100, channels, 5000)
+        assert isinstance(mapped.read(0, 10), memoryview)  # Zero-Copy
+        assert list(mapped.read(1000, 300)) == list(pcm[1000 * channels:1300 * channels])
+        assert len(mapped.read(4900, 500)) == 100 * channels
+        mapped.close()
+
+    @pytest.mark.parametrize("compression", [None, b"NONE", b"sowt"])
+    def test_aiff_variants(self, tmp_path: Path, compression: bytes | None) -> None:
+        pcm = _pcm(3000, 2)
+        path = tmp_path / "a.aiff"
+        _write_aiff(path, pcm, 2, compression)
+        mapped = MappedPcm.open(path)
+        assert mapped is not None
+        assert (mapped.sample_rate, mapped.channels, mapped.frames) == (44100, 2, 3000)
+        assert list(mapped.read(10, 2000)) == list(pcm[20:4020])
+        assert [list(c) for c in mapped.chunks(1000)] == [list(pcm[i:i + 2000]) for i in range(0, 6000, 2000)]
+
+    def test_rf64(self, tmp_path: Path) -> None:
+        pcm = _pcm(2000, 2)
+        path = tmp_path / "long.wav"
+        _write_rf64(path, pcm, 2)
+        mapped = MappedPcm.open(path)
+        assert mapped is not None
+        assert mapped.frames == 2000
+        assert list(mapped.read(0, 2000)) == list(pcm)
+
+    def test_unfinalized_data_chunk(self, tmp_path: Path) -> None:
+        """data-Groesse 0 (Aufnahme abgebrochen): Daten bis Dateiende."""
+        pcm = _pcm(1000, 1)
+        path = tmp_path / "rec.wav"
+        _write_wav(path, pcm, 1)
+        raw = bytearray(path.read_bytes())
+        pos = raw.index(b"data")
+        raw[pos + 4:pos + 8] = b"\x00\x00\x00\x00"
+        path.write_bytes(bytes(raw))
+        mapped = MappedPcm.open(path)
+        assert mapped is not None
+        assert mapped.frames == 1000
+
+    def test_unsupported(self, tmp_path: Path) -> None:
+        path = tmp_path / "a24.wav"
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(3)
+            wf.setframerate(44100)
+            wf.writeframes(b"\x00" * 300)
+        assert MappedPcm.open(path) is None
+        assert MappedPcm.open(tmp_path / "missing.wav") is None
+        mp3 = tmp_path / "a.mp3"
+        mp3.write_bytes(b"ID3")
+        assert MappedPcm.open(mp3) is None
+
+    def test_parse_extended(self) -> None:
+        assert _parse_extended(_extended(44100)) == 44100.0
+        assert _parse_extended(_extended(48000)) == 48000.0
+
+
+class TestMappedSpectrum:
+    def test_matches_in_memory_analysis(self, tmp_path: Path) -> None:
+        """Mapping-Pfad liefert die gleichen Baender und Pegel wie load_pcm."""
+        pcm = _pcm(44100, 2)
+        path = tmp_path / "a.wav"
+        _write_wav(path, pcm, 2)
+
+        mapped = SpectrumAnalyzer(use_numpy=False)
+        mapped.load(path, precompute=False)
+        assert mapped.is_ready
+        assert mapped._pcm is None
+
+        reference = SpectrumAnalyzer(use_numpy=False)
+        reference.load_pcm(pcm, 44100, 2, precompute=False)
+        for pos in (0.1, 0.5, 0.9):
+            assert mapped.get_bands(pos) == reference.get_bands(pos)
+            assert mapped.get_levels(pos) == reference.get_levels(pos)
+        mapped.unload()
+
+    def test_timeline_from_mapping(self, tmp_path: Path) -> None:
+        pcm = _pcm(22050, 1)
+        path = tmp_path / "a.aiff"
+        _write_aiff(path, pcm, 1)
+        mapped = SpectrumAnalyzer(use_numpy=False)
+        mapped.load(path, precompute=True)
+        reference = SpectrumAnalyzer(use_numpy=False)
+        reference.load_pcm(pcm, 44100, 1, precompute=True)
+        assert mapped.has_timeline
+        assert mapped._timeline == reference._timeline
@@ -156,3 +156,191 @@ class TestPlayerService:
         service.update_position()
 
         assert finished_called
+
+    def test_refresh_tracks_updates_current_track(self, mock_player, sample_tracks) -> None:
+        service = PlayerService(mock_player)
+        placeholders = [AudioTrack(path=t.path) for t in sample_tracks]
+        service.load_tracks(placeholders)
+        service.play_track(1)
+        assert service.refresh_tracks(sample_tracks)
+        assert service.state.track_list is sample_tracks
+        assert service.state.current_track == sample_tracks[1]
+        assert service.state.current_index == 1
+        assert mock_player.current_path == sample_tracks[1].path
+        assert not service.refresh_tracks(list(sample_tracks))
+
+    def test_refresh_tracks_remaps_index_after_subtunes(self, mock_player) -> None:
+        sid = Path("/music/tune.sid")
+        placeholders = [AudioTrack(path=sid), AudioTrack(path=Path("/music/zz.mp3"))]
+        service = PlayerService(mock_player)
+        service.load_tracks(placeholders)
+        service.play_track(1)
+        expanded = AudioTrack(path=sid, subtune_count=3).subtunes()
+        assert service.refresh_tracks([*expanded, AudioTrack(path=Path("/music/zz.mp3"), title="ZZ")])
+        assert service.state.current_index == 3
+        assert service.state.current_track is not None
+        assert service.state.current_track.title == "ZZ"
+        # Laufender SID-Platzhalter: Index zeigt auf den ersten Subtune der Datei
+        service.load_tracks(placeholders)
+        service.play_track(0)
+        assert not service.refresh_tracks([*expanded])
+        assert service.state.current_index == 0
+
+
+class TestGapless:
+    def test_preload_next(self, mock_player, sample_tracks) -> None:
+        service = PlayerService(mock_player)
+        service.load_tracks(sample_tracks)
+        service.play_track(0)
+
+        assert service.preload_next() == sample_tracks[1]
+        assert mock_player.preloaded == sample_tracks[1].path
+
+    def test_preload_at_end_of_list(self, mock_player, sample_tracks) -> None:
+        service = PlayerService(mock_player)
+        service.load_tracks(sample_tracks)
+        service.play_track(2)
+
+        assert service.preload_next() is None
+        assert mock_player.preloaded is None
+
+    def test_handover_advances_without_play(self, mock_player, sample_tracks) -> None:
+        changed = []
+        finished = []
+        service = PlayerService(mock_player)
+        service.set_callbacks(
+            on_finished=lambda: finished.append(True),
+            on_track_changed=lambda: changed.append(service.state.current_track),
+        )
+        service.load_tracks(sample_tracks)
+        service.play_track(0)
+        service.preload_next()
+
+        mock_player.finish_gapless()
+        mock_player.position = 0.2
+        service.update_position()
+
+        assert changed == [sample_tracks[1]]
+        assert not finished
+        assert service.state.current_index == 1
+        assert service.state.is_playing
+        assert service.state.position_seconds == 0.2
+        assert service.state.last_gap_seconds == 0.0
+
+    def test_gap_measured_on_regular_transition(self, mock_player, sample_tracks) -> None:
+        service = PlayerService(mock_player)
+        service.load_tracks(sample_tracks)
+        service.play_track(0)
+        mock_player.position = 120.0
+        service.update_position()
+
+        mock_player.playing = False
+        service.update_position()
+        service.check_auto_next()
+
+        assert service.state.current_index == 1
+        assert service.state.last_gap_seconds is not None
+        assert 0.0 <= service.state.last_gap_seconds < 1.0
+
+    def test_subtune_passed_to_player(self, mock_player) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(AudioTrack(path=Path("/music/tune.sid"), subtune=2, subtune_count=3))
+        assert mock_player.current_subtune == 2
+
+    def test_same_file_subtunes_not_preloaded(self, mock_player) -> None:
+        tracks = AudioTrack(path=Path("/music/tune.sid"), subtune_count=2).subtunes()
+        service = PlayerService(mock_player)
+        service.load_tracks(tracks)
+        service.play_track(0)
+
+        assert service.preload_next() is None
+        mock_player.position = 0.5
+        service.update_position()
+        assert service.state.current_index == 0
+
+    def test_no_gap_for_manual_start(self, mock_player, sample_tracks) -> None:
+        service = PlayerService(mock_player)
+        service.load_tracks(sample_tracks)
+        service.play_track(0)
+        assert service.state.last_gap_seconds is None
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPlaybackClock:
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+        from retro_amp.services import player_service
+
+        fake = _FakeClock()
+        monkeypatch.setattr(player_service.time, "perf_counter", fake)
+        return fake
+
+    def test_interpolates_between_ticks(self, mock_player, sample_track, clock) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(sample_track)
+        clock.now += 0.25
+        assert service.clock_position() == pytest.approx(0.25)
+        assert service.state.position_seconds == 0.0
+
+    def test_stands_still_while_paused(self, mock_player, sample_track, clock) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(sample_track)
+        clock.now += 2.0
+        service.toggle_pause()
+        clock.now += 5.0
+        assert service.clock_position() == pytest.approx(2.0)
+        service.toggle_pause()
+        clock.now += 1.0
+        assert service.clock_position() == pytest.approx(3.0)
+
+    def test_seek_moves_clock(self, mock_player, sample_track, clock) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(sample_track)
+        mock_player.position = 10.0
+        service.update_position()
+        service.seek_backward(5.0)
+        assert service.clock_position() == pytest.approx(5.0)
+        clock.now += 0.5
+        assert service.clock_position() == pytest.approx(5.5)
+
+    def test_small_drift_is_slewed_without_going_backwards(
+        self, mock_player, sample_track, clock,
+    ) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(sample_track)
+        clock.now += 1.0
+        assert service.clock_position() == pytest.approx(1.0)
+        # Player hinkt 0.2 s hinterher: Uhr bleibt stehen statt zurueckzuspringen
+        mock_player.position = 0.8
+        service.update_position()
+        assert service.clock_position() == pytest.approx(1.0)
+        clock.now += 1.0
+        assert service.clock_position() == pytest.approx(1.9)
+
+    def test_large_drift_snaps(self, mock_player, sample_track, clock) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(sample_track)
+        clock.now += 1.0
+        mock_player.position = 3.0
+        service.update_position()
+        assert service.clock_position() == pytest.approx(3.0)
+
+    def test_clamped_to_track_duration(self, mock_player, sample_track, clock) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(sample_track)
+        clock.now += sample_track.duration_seconds + 10
+        assert service.clock_position() == pytest.approx(sample_track.duration_seconds)
+
+    def test_stop_resets_clock(self, mock_player, sample_track, clock) -> None:
+        service = PlayerService(mock_player)
+        service.play_file(sample_track)
+        clock.now += 3.0
+        service.stop()
+        assert service.clock_position() == 0.0
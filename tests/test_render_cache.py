@@ -0,0 +1,130 @@
+"""Tests fuer den Render-Cache (blockweise, optional komprimiert)."""
+from __future__ import annotations
+
+import array
+from pathlib import Path
+
+import pytest
+
+from retro_amp.infrastructure import render_cache
+from retro_amp.infrastructure.disk_cache import DiskCache
+from retro_amp.infrastructure.render_cache import RenderCache, RenderedPcm
+
+
+def _pcm(frames: int, channels: int = 2) -> array.array[int]:
+    return array.array("h", (i % 30000 for i in range(frames * channels)))
+
+
+class TestRenderedPcm:
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_roundtrip(self, compress: bool) -> None:
+        pcm = _pcm(1000)
+        blob = RenderedPcm.to_bytes(pcm, 2, 44100, compress=compress, block_frames=64)
+        rendered = RenderedPcm.from_bytes(blob)
+        assert rendered is not None
+        assert (rendered.channels, rendered.sample_rate, rendered.frames) == (2, 44100, 1000)
+        assert b"".join(rendered.chunks(0)) == pcm.tobytes()
+
+    def test_compression_shrinks_silence(self) -> None:
+        silence = array.array("h", [0] * 20000)
+        packed = RenderedPcm.to_bytes(silence, 1, 8000, compress=True)
+        assert len(packed) < len(silence.tobytes()) // 10
+
+    def test_chunks_from_offset_inside_block(self) -> None:
+        pcm = _pcm(1000, channels=1)
+        rendered = RenderedPcm.from_bytes(
+            RenderedPcm.to_bytes(pcm, 1, 8000, block_frames=100),
+        )
+        assert rendered is not None
+        data = array.array("h")
+        data.frombytes(b"".join(rendered.chunks(2 * 250)))
+        assert list(data) == list(pcm[250:])
+
+    def test_seek_decompresses_only_target_block(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pcm = _pcm(1000, channels=1)
+        rendered = RenderedPcm.from_bytes(RenderedPcm.to_bytes(pcm, 1, 8000, block_frames=100))
+        assert rendered is not None
+        calls: list[int] = []
+        real = render_cache.zlib.decompress
+
+        def _counting(data: bytes) -> bytes:
+            calls.append(len(data))
+            return real(data)
+
+        monkeypatch.setattr(render_cache.zlib, "decompress", _counting)
+        assert bytes(next(rendered.chunks(2 * 950))) == pcm[950:].tobytes()
+        assert len(calls) == 1
+
+    def test_interleaved_readers_get_their_own_blocks(self) -> None:
+        pcm = _pcm(1000, channels=1)
+        rendered = RenderedPcm.from_bytes(RenderedPcm.to_bytes(pcm, 1, 8000, block_frames=100))
+        assert rendered is not None
+        player, spectrum = rendered.chunks(0), rendered.chunks(2 * 500)
+        first = next(player)
+        other = next(spectrum)
+        assert bytes(first) == pcm[:100].tobytes()
+        assert bytes(other) == pcm[500:600].tobytes()
+
+    def test_rejects_foreign_data(self) -> None:
+        assert RenderedPcm.from_bytes(b"") is None
+        assert RenderedPcm.from_bytes(b"x" * 100) is None
+
+    def test_rejects_truncated_data(self) -> None:
+        blob = RenderedPcm.to_bytes(_pcm(500), 2, 44100, block_frames=64)
+        assert RenderedPcm.from_bytes(blob[:-10]) is None
+
+    def test_close_releases_data(self) -> None:
+        rendered = RenderedPcm.from_bytes(RenderedPcm.to_bytes(_pcm(100), 2, 44100))
+        assert rendered is not None
+        rendered.close()
+        assert list(rendered.chunks(0)) == []
+
+
+class TestRenderCache:
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        source = tmp_path / "tune.mod"
+        source.write_bytes(b"M.K." * 100)
+        cache = RenderCache(DiskCache("render", max_bytes=1024 * 1024, cache_dir=tmp_path / "c"))
+        key = RenderCache.key(source, renderer="pygame", sample_rate=44100)
+        assert cache.get(key) is None
+
+        pcm = _pcm(2000)
+        cache.put(key, pcm, 2, 44100)
+        rendered = cache.get(key)
+        assert rendered is not None
+        assert b"".join(rendered.chunks(0)) == pcm.tobytes()
+
+    def test_key_depends_on_params(self, tmp_path: Path) -> None:
+        source = tmp_path / "tune.sid"
+        source.write_bytes(b"PSID")
+        assert RenderCache.key(source, duration=180) != RenderCache.key(source, duration=120)
+        assert RenderCache.key(source, a=1, b=2) == RenderCache.key(source, b=2, a=1)
+
+    def test_key_survives_rename(self, tmp_path: Path) -> None:
+        source = tmp_path / "tune.sid"
+        source.write_bytes(b"PSID data")
+        key = RenderCache.key(source, duration=180)
+        moved = source.rename(tmp_path / "other.sid")
+        assert RenderCache.key(moved, duration=180) == key
+
+    def test_missing_key_is_ignored(self, tmp_path: Path) -> None:
+        cache = RenderCache(DiskCache("render", max_bytes=1024, cache_dir=tmp_path))
+        cache.put(None, _pcm(10), 2, 44100)
+        assert cache.get(None) is None
+
+
+class TestSpectrumFromCache:
+    def test_sid_spectrum_streams_cached_render(self, tmp_path: Path) -> None:
+        pytest.importorskip("pygame")
+        from retro_amp.infrastructure.audio_player import sid_render_key
+        from retro_amp.infrastructure.spectrum import SpectrumAnalyzer
+
+        source = tmp_path / "tune.sid"
+        source.write_bytes(b"PSID" + bytes(200))
+        cache = RenderCache(DiskCache("render", max_bytes=4 * 1024 * 1024, cache_dir=tmp_path / "c"))
+        cache.put(sid_render_key(source), _pcm(44100), 2, 44100)
+
+        analyzer = SpectrumAnalyzer(render_cache=cache)
+        analyzer.load(source, precompute=False)
+        assert analyzer.is_ready
+        assert len(analyzer.get_bands(0.5)) > 0
@@ -0,0 +1,145 @@
+"""Tests fuer den HVSC-Songlengths-Index."""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from retro_amp.infrastructure.disk_cache import DiskCache
+from retro_amp.infrastructure.metadata_reader import MutagenMetadataReader
+from retro_amp.infrastructure.songlengths import (
+    SonglengthsIndex,
+    build_index,
+    find_songlengths,
+    parse_time,
+)
+
+
+def _sid(path: Path, songs: int = 1, start_song: int = 1, body: bytes = b"") -> Path:
+    header = bytearray(0x7C)
+    header[0:4] = b"PSID"
+    header[0x0E:0x10] = songs.to_bytes(2, "big")
+    header[0x10:0x12] = start_song.to_bytes(2, "big")
+    path.write_bytes(bytes(header) + body)
+    return path
+
+
+def _database(path: Path, entries: dict[Path, str]) -> Path:
+    lines = ["; Songlengths", "[Database]"]
+    for sid, lengths in entries.items():
+        lines.append(f"; /{sid.name}")
+        lines.append(f"{hashlib.md5(sid.read_bytes()).hexdigest()}={lengths}")
+    path.write_text("\n".join(lines) + "\n", encoding="latin-1")
+    return path
+
+
+class TestParseTime:
+    def test_minutes_seconds(self) -> None:
+        assert parse_time("3:05") == 185_000
+
+    def test_milliseconds(self) -> None:
+        assert parse_time("0:07.5") == 7_500
+        assert parse_time("1:02.345") == 62_345
+
+    def test_attribute_suffix(self) -> None:
+        assert parse_time("0:42(G)") == 42_000
+
+    def test_invalid(self) -> None:
+        assert parse_time("abc") is None
+
+
+class TestSonglengthsIndex:
+    def test_lookup_by_md5(self) -> None:
+        md5 = "0123456789abcdef0123456789abcdef"
+        blob = build_index(["[Database]", f"{md5}=1:00 0:30.250 2:00(M)"])
+        index = SonglengthsIndex(Path("unused"))
+        assert index._parse(blob)
+        index._loaded = True
+        assert index.lengths(md5) == (60.0, 30.25, 120.0)
+        assert index.lengths("f" * 32) == ()
+        assert index.lengths("kein-hash") == ()
+
+    def test_many_entries_binary_search(self) -> None:
+        lines = [f"{i:032x}={i % 60}:{i % 60:02d}" for i in range(500)]
+        index = SonglengthsIndex(Path("unused"))
+        assert index._parse(build_index(reversed(lines)))
+        index._loaded = True
+        assert index.lengths(f"{123:032x}") == (3 * 60.0 + 3,)
+        assert index.lengths(f"{499:032x}") == (19 * 60.0 + 19,)
+
+    def test_length_for_uses_start_song(self, tmp_path: Path) -> None:
+        sid = _sid(tmp_path / "multi.sid", songs=3, start_song=2)
+        index = SonglengthsIndex(_database(tmp_path / "Songlengths.md5", {sid: "0:10 0:20 0:30"}))
+        assert index.length_for(sid) == 20.0
+        assert index.length_for(sid, subtune=3) == 30.0
+        assert index.length_for(sid, subtune=4) is None
+
+    def test_unknown_file(self, tmp_path: Path) -> None:
+        known = _sid(tmp_path / "a.sid")
+        other = _sid(tmp_path / "b.sid", body=b"anders")
+        index = SonglengthsIndex(_database(tmp_path / "Songlengths.md5", {known: "1:00"}))
+        assert index.length_for(other) is None
+
+    def test_index_and_hashes_cached(self, tmp_path: Path) -> None:
+        sid = _sid(tmp_path / "tune.sid")
+        database = _database(tmp_path / "Songlengths.md5", {sid: "1:30"})
+        cache = DiskCache("songlengths", cache_dir=tmp_path / "cache")
+        index = SonglengthsIndex(database, cache=cache)
+        assert index.length_for(sid) == 90.0
+        index.save()
+        assert len(list(cache.directory.glob("*.bin"))) == 2
+
+        fresh = SonglengthsIndex(database, cache=cache)
+        fresh._load()
+        assert fresh._count == 1
+        assert fresh._load_hashes()
+
+    def test_find_songlengths(self, tmp_path: Path) -> None:
+        assert find_songlengths(tmp_path) is None
+        target = tmp_path / "C64Music" / "DOCUMENTS" / "Songlengths.md5"
+        target.parent.mkdir(parents=True)
+        target.write_text("[Database]\n")
+        assert find_songlengths(tmp_path) == target
+
+
+class TestSidDuration:
+    def test_metadata_reader_duration(self, tmp_path: Path) -> None:
+        sid = _sid(tmp_path / "tune.sid")
+        index = SonglengthsIndex(_database(tmp_path / "Songlengths.md5", {sid: "2:03.5"}))
+        track = MutagenMetadataReader(songlengths=index).read(sid)
+        assert track.duration_seconds == pytest.approx(123.5)
+
+    def test_render_duration_rounds_up(self, tmp_path: Path) -> None:
+        pytest.importorskip("pygame")
+        from retro_amp.infrastructure.audio_player import SID_DURATION, sid_duration
+
+        sid = _sid(tmp_path / "tune.sid")
+        index = SonglengthsIndex(_database(tmp_path / "Songlengths.md5", {sid: "0:41.2"}))
+        assert sid_duration(sid, index) == 42
+        assert sid_duration(sid) == SID_DURATION
+
+    def test_subtune_render(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("pygame")
+        from retro_amp.infrastructure import audio_player
+
+        commands: list[list[str]] = []
+
+        class _FakeRender:
+            channels, sample_rate = 2, 44100
+
+            def __init__(self, cmd: list[str], on_complete=None) -> None:
+                commands.append(cmd)
+
+            def wait_ready(self, timeout: float) -> bool:
+                return True
+
+        monkeypatch.setattr(audio_player, "_find_sidplayfp", lambda: "sidplayfp")
+        monkeypatch.setattr(audio_player, "PipeRender", _FakeRender)
+        sid = _sid(tmp_path / "multi.sid", songs=3)
+        index = SonglengthsIndex(_database(tmp_path / "Songlengths.md5", {sid: "0:10 0:20 0:30"}))
+
+        duration = audio_player.sid_duration(sid, index, subtune=3)
+        audio_player._start_sid_render(sid, duration, subtune=3)
+        assert commands[0][1:] == ["--wav=-", "-t30", "-f44100", "-o3", str(sid)]
+        assert audio_player.sid_render_key(sid, 30, 3) != audio_player.sid_render_key(sid, 30, 2)
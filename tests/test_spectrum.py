@@ -1,13 +1,27 @@
 """Tests fuer Spectrum-Analyzer (FFT und Band-Berechnung)."""
 from __future__ import annotations
 
+import array
 import math
+import wave
+from pathlib import Path
 
+import pytest
+
+from retro_amp.infrastructure import spectrum
+from retro_amp.infrastructure.audio_player import DecodedAudio
+from retro_amp.infrastructure.disk_cache import DiskCache
+from retro_amp.infrastructure.render_cache import RenderedPcm
 from retro_amp.infrastructure.spectrum import (
     FFT_SIZE,
+    FFT_SIZES,
     NUM_BANDS,
     SpectrumAnalyzer,
+    _FFTPlan,
+    _StreamingPcm,
     _fft,
+    _mix_to_mono,
+    _resample_bands,
 )
 
 
@@ -48,6 +62,32 @@ class TestFFT:
                 assert abs(abs(val) - 1.0) < 1e-6
 
 
+class TestFFTPlan:
+    @pytest.mark.parametrize("n", [4, 8, 64, 2048])
+    def test_matches_reference_fft(self, n: int) -> None:
+        """Plan (halbe komplexe FFT) liefert die gleichen Magnituden wie _fft."""
+        samples = array.array("h", ((i * 7919) % 20001 - 10000 for i in range(n)))
+        window = [0.5 + 0.5 * math.sin(i) for i in range(n)]
+        spectrum = _fft([complex(samples[i] * window[i], 0.0) for i in range(n)])
+        expected = [abs(spectrum[k]) / (n // 2) for k in range(n // 2)]
+
+        actual = _FFTPlan(n).magnitudes(samples, window)
+        assert len(actual) == n // 2
+        for a, e in zip(actual, expected):
+            assert abs(a - e) < 1e-6
+
+    def test_reuses_output_buffer(self) -> None:
+        plan = _FFTPlan(16)
+        window = [1.0] * 16
+        first = plan.magnitudes(array.array("h", [1] * 16), window)
+        second = plan.magnitudes(array.array("h", [0] * 16), window)
+        assert first is second
+
+    def test_rejects_non_power_of_two(self) -> None:
+        with pytest.raises(ValueError):
+            _FFTPlan(100)
+
+
 class TestSpectrumAnalyzer:
     def test_initial_state(self) -> None:
         analyzer = SpectrumAnalyzer()
@@ -61,10 +101,10 @@ class TestSpectrumAnalyzer:
 
     def test_band_bins_computed(self) -> None:
         """Band-Grenzen muessen berechnet sein (32 Baender)."""
-        analyzer = SpectrumAnalyzer()
-        assert len(analyzer._band_bins) == NUM_BANDS
+        bins = SpectrumAnalyzer._compute_band_bins(44100)
+        assert len(bins) == NUM_BANDS
         # Alle Grenzen muessen aufsteigend sein
-        for lo, hi in analyzer._band_bins:
+        for lo, hi in bins:
             assert lo >= 1
             assert hi >= lo
             assert hi < FFT_SIZE // 2
@@ -73,3 +113,432 @@ class TestSpectrumAnalyzer:
         """Ohne geladene Daten gibt get_bands leere Liste zurueck."""
         analyzer = SpectrumAnalyzer()
         assert analyzer.get_bands(5.0) == []
+
+
+def _sine_pcm(freq: float, seconds: float = 1.0, sample_rate: int = 44100) -> array.array[int]:
+    """Mono-PCM (int16) mit einem Sinus bei freq Hz."""
+    n = int(seconds * sample_rate)
+    return array.array(
+        "h",
+        (int(12000 * math.sin(2 * math.pi * freq * i / sample_rate)) for i in range(n)),
+    )
+
+
+class TestNumpyBackend:
+    def test_matches_stdlib_bands(self) -> None:
+        """NumPy-Backend liefert die gleichen Band-Werte wie der stdlib-Pfad."""
+        pytest.importorskip("numpy")
+        pcm = _sine_pcm(440.0)
+        pcm = array.array("h", (s // 2 + (i * 7919) % 3001 - 1500 for i, s in enumerate(pcm)))
+
+        fast = SpectrumAnalyzer(use_numpy=True)
+        slow = SpectrumAnalyzer(use_numpy=False)
+        assert fast.uses_numpy
+        assert not slow.uses_numpy
+        for analyzer in (fast, slow):
+            analyzer._pcm = pcm
+            analyzer._ready = True
+
+        for pos in (0.0, 0.25, 0.5, 0.99):
+            expected = slow.get_bands(pos)
+            actual = fast.get_bands(pos)
+            assert len(actual) == NUM_BANDS
+            for a, e in zip(actual, expected):
+                assert abs(a - e) < 1e-9
+
+    def test_silence_is_zero(self) -> None:
+        """Stille ergibt in beiden Backends nur Nullen."""
+        pytest.importorskip("numpy")
+        for use_numpy in (True, False):
+            analyzer = SpectrumAnalyzer(use_numpy=use_numpy)
+            analyzer._pcm = array.array("h", [0] * FFT_SIZE * 4)
+            analyzer._ready = True
+            assert analyzer.get_bands(0.05) == [0.0] * NUM_BANDS
+
+
+class TestTimeline:
+    def _analyzer(self, use_numpy: bool) -> SpectrumAnalyzer:
+        analyzer = SpectrumAnalyzer(use_numpy=use_numpy)
+        analyzer._pcm = _sine_pcm(1000.0, seconds=0.5)
+        analyzer._ready = True
+        return analyzer
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_timeline_matches_live_fft(self, use_numpy: bool) -> None:
+        """Timeline-Lookup entspricht der Live-FFT (bis auf uint8-Quantisierung)."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        analyzer = self._analyzer(use_numpy)
+        live = [analyzer.get_bands(pos) for pos in (0.1, 0.2, 0.3)]
+
+        analyzer._build_timeline(analyzer._generation)
+        assert analyzer.has_timeline
+        for pos, expected in zip((0.1, 0.2, 0.3), live):
+            actual = analyzer.get_bands(pos)
+            assert len(actual) == NUM_BANDS
+            for a, e in zip(actual, expected):
+                assert abs(a - e) <= 1.0 / 255.0 + 1e-9
+
+    def test_timeline_out_of_range(self) -> None:
+        analyzer = self._analyzer(False)
+        analyzer._build_timeline(analyzer._generation)
+        assert analyzer.get_bands(10.0) == [0.0] * NUM_BANDS
+
+    def test_timeline_discarded_on_new_generation(self) -> None:
+        """Eine veraltete Berechnung darf die Timeline nicht setzen."""
+        analyzer = self._analyzer(False)
+        analyzer._build_timeline(analyzer._generation - 1)
+        assert not analyzer.has_timeline
+
+    def test_unload_clears_timeline(self) -> None:
+        analyzer = self._analyzer(False)
+        analyzer._build_timeline(analyzer._generation)
+        analyzer.unload()
+        assert not analyzer.has_timeline
+        assert analyzer.get_bands(0.1) == []
+
+
+class TestTimelineCache:
+    def _write_wav(self, path: Path) -> None:
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(44100)
+            wf.writeframes(_sine_pcm(440.0, seconds=0.3).tobytes())
+
+    def test_cache_hit_skips_decode(self, tmp_path: Path) -> None:
+        """Zweites Laden kommt aus dem Cache, ohne die Datei zu dekodieren."""
+        wav = tmp_path / "tone.wav"
+        self._write_wav(wav)
+        cache = DiskCache("spectrum", cache_dir=tmp_path / "cache")
+
+        first = SpectrumAnalyzer(cache=cache)
+        first.load(wav, precompute=True)
+        assert first.has_timeline
+        expected = first.get_bands(0.15)
+
+        second = SpectrumAnalyzer(cache=cache)
+
+        def _no_decode(path: Path) -> tuple[bytes | None, int, int]:
+            raise AssertionError("Cache-Treffer darf nicht dekodieren")
+
+        second._decode_to_pcm = _no_decode  # type: ignore[method-assign]
+        second.load(wav)
+        assert second.is_ready
+        assert second.has_timeline
+        assert second.get_bands(0.15) == expected
+        assert second.get_levels(0.15) == first.get_levels(0.15)
+
+
+    def test_sid_subtunes_get_own_timelines(self, tmp_path: Path) -> None:
+        """Subtunes derselben SID-Datei teilen sich keinen Cache-Eintrag."""
+        sid = tmp_path / "tune.sid"
+        sid.write_bytes(b"PSID")
+        cache = DiskCache("spectrum", cache_dir=tmp_path / "cache")
+        tones = {1: _sine_pcm(220.0, seconds=0.3), 2: _sine_pcm(5000.0, seconds=0.3)}
+
+        expected: dict[int, list[float]] = {}
+        for subtune, pcm in tones.items():
+            rendered = RenderedPcm.from_bytes(RenderedPcm.to_bytes(pcm, 1, 44100))
+            assert rendered is not None
+            analyzer = SpectrumAnalyzer(cache=cache)
+            analyzer.load(
+                sid, precompute=True, subtune=subtune,
+                shared=DecodedAudio(sid, subtune, 1, 44100, rendered.chunks, complete=True),
+            )
+            assert analyzer.has_timeline
+            expected[subtune] = analyzer.get_bands(0.15)
+
+        analyzer = SpectrumAnalyzer(cache=cache)
+        assert analyzer._cache_key(sid, 1) != analyzer._cache_key(sid, 2)
+        assert expected[1] != expected[2]
+
+        def _no_decode(path: Path) -> tuple[bytes | None, int, int]:
+            raise AssertionError("Cache-Treffer darf nicht dekodieren")
+
+        analyzer._decode_to_pcm = _no_decode  # type: ignore[method-assign]
+        for subtune in tones:
+            analyzer.load(sid, subtune=subtune)
+            assert analyzer.has_timeline
+            assert analyzer.get_bands(0.15) == expected[subtune]
+
+
+class TestPygameDecode:
+    def test_decode_via_pygame_returns_pcm(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tracker-/Vorbis-Fallback liefert echtes PCM vom (Dummy-)Mixer."""
+        import time
+
+        import pygame
+
+        monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        wav = tmp_path / "tone.wav"
+        TestTimelineCache()._write_wav(wav)
+
+        pygame.mixer.init(frequency=44100, size=-16, channels=2)
+        try:
+            raw, sample_rate, channels = SpectrumAnalyzer(use_numpy=False)._decode_via_pygame(wav)
+        finally:
+            pygame.mixer.quit()
+        assert raw is not None
+        assert (sample_rate, channels) == (44100, 2)
+        assert len(memoryview(raw).cast("B")) >= int(0.3 * 44100) * 4
+        assert any(memoryview(raw).cast("B"))
+
+
+def _chunked_opener(pcm: array.array[int], chunk: int = 1000):
+    """Fake-Stream: liefert pcm ab einem Frame-Index in festen Chunks."""
+    opened: list[int] = []
+
+    def _open(start_frame: int):
+        opened.append(start_frame)
+        for offset in range(start_frame, len(pcm), chunk):
+            yield pcm[offset:offset + chunk]
+
+    return _open, opened
+
+
+class TestStreamingPcm:
+    def test_window_matches_direct_slice(self) -> None:
+        pcm = array.array("h", (i % 3000 for i in range(44100 * 3)))
+        opener, _ = _chunked_opener(pcm)
+        ring = _StreamingPcm(opener, 44100)
+        for start in (0, 5000, 30000, 100000):
+            assert ring.window(start) == pcm[start:start + FFT_SIZE]
+
+    def test_ring_stays_bounded(self) -> None:
+        """Beim Durchspielen waechst der Puffer nicht mit der Track-Laenge."""
+        pcm = array.array("h", [1]) * (44100 * 20)
+        opener, opened = _chunked_opener(pcm)
+        ring = _StreamingPcm(opener, 44100)
+        for pos in range(0, len(pcm) - FFT_SIZE, 44100 // 12):
+            ring.window(pos)
+            assert ring.buffered_samples <= 44100 * 5
+        assert opened == [0]
+
+    def test_seek_backwards_resyncs(self) -> None:
+        pcm = array.array("h", (i % 3000 for i in range(44100 * 10)))
+        opener, opened = _chunked_opener(pcm)
+        ring = _StreamingPcm(opener, 44100)
+        ring.window(44100 * 8)
+        assert ring.window(1000) == pcm[1000:1000 + FFT_SIZE]
+        assert len(opened) == 2
+
+    def test_end_of_stream_pads_with_zeros(self) -> None:
+        pcm = array.array("h", [7]) * 3000
+        opener, _ = _chunked_opener(pcm)
+        ring = _StreamingPcm(opener, 44100)
+        window = ring.window(2000)
+        assert len(window) == FFT_SIZE
+        assert window[999] == 7 and window[1000] == 0
+        assert ring.total_samples() == 3000
+
+
+class TestStreamingTimeline:
+    def test_chunked_feed_matches_single_pass(self) -> None:
+        """Inkrementelle Berechnung liefert die gleiche Timeline wie in einem Stueck."""
+        pcm = _sine_pcm(2000.0, seconds=0.4)
+        analyzer = SpectrumAnalyzer(use_numpy=False)
+        analyzer._pcm = pcm
+        analyzer._ready = True
+        analyzer._build_timeline(analyzer._generation)
+        expected = analyzer._timeline
+
+        analyzer._reset()
+        opener, _ = _chunked_opener(pcm, chunk=777)
+        analyzer._load_streaming(opener, 44100, analyzer._generation, True, None)
+        assert analyzer._timeline == expected
+        assert analyzer.get_bands(0.2) == [v / 255.0 for v in expected[10 * NUM_BANDS:11 * NUM_BANDS]]
+
+    def test_streaming_live_bands_without_timeline(self) -> None:
+        pcm = _sine_pcm(440.0, seconds=1.0)
+        reference = SpectrumAnalyzer(use_numpy=False)
+        reference._pcm = pcm
+        reference._ready = True
+
+        analyzer = SpectrumAnalyzer(use_numpy=False)
+        opener, _ = _chunked_opener(pcm)
+        analyzer._load_streaming(opener, 44100, analyzer._generation, False, None)
+        assert analyzer.is_ready
+        assert not analyzer.has_timeline
+        assert analyzer.get_bands(0.5) == reference.get_bands(0.5)
+
+    def test_shared_decoded_audio_skips_decode(self, tmp_path: Path) -> None:
+        """Laufender Player-Render wird mitgelesen statt neu dekodiert."""
+        sid = tmp_path / "tune.sid"
+        sid.write_bytes(b"PSID")
+        pcm = _sine_pcm(440.0, seconds=0.4)
+        stereo = array.array("h", (s for v in pcm for s in (v, v))).tobytes()
+
+        def _chunks(start: int):
+            # Ungerade Chunk-Groessen wie aus der Render-Pipe
+            for pos in range(start, len(stereo), 1001):
+                yield memoryview(stereo)[pos:pos + 1001]
+
+        analyzer = SpectrumAnalyzer(use_numpy=False)
+
+        def _no_decode(path: Path) -> tuple[bytes | None, int, int]:
+            raise AssertionError("Geteiltes PCM darf nicht neu dekodieren")
+
+        analyzer._decode_to_pcm = _no_decode  # type: ignore[method-assign]
+        analyzer.load(
+            sid, precompute=False, shared=DecodedAudio(sid, 0, 2, 44100, _chunks),
+        )
+        reference = SpectrumAnalyzer(use_numpy=False)
+        reference._pcm = pcm
+        reference._ready = True
+        assert analyzer.is_ready
+        assert analyzer.get_bands(0.2) == reference.get_bands(0.2)
+
+    def test_shared_cached_render_is_not_loaded_again(self, tmp_path: Path) -> None:
+        """Render des Players aus dem Render-Cache wird mitgelesen, nicht neu geladen."""
+        sid = tmp_path / "tune.sid"
+        sid.write_bytes(b"PSID")
+        pcm = _sine_pcm(440.0, seconds=0.4)
+        rendered = RenderedPcm.from_bytes(RenderedPcm.to_bytes(pcm, 1, 44100, block_frames=4096))
+        assert rendered is not None
+
+        class _NoLoads:
+            def get(self, key: str | None) -> RenderedPcm | None:
+                raise AssertionError("Render darf nicht erneut geladen werden")
+
+        analyzer = SpectrumAnalyzer(use_numpy=False, render_cache=_NoLoads())  # type: ignore[arg-type]
+        shared = DecodedAudio(sid, 0, 1, 44100, rendered.chunks, complete=True)
+        analyzer.load(sid, precompute=False, shared=shared)
+        reference = SpectrumAnalyzer(use_numpy=False)
+        reference._pcm = pcm
+        reference._ready = True
+        assert analyzer.is_ready
+        assert analyzer.get_bands(0.2) == reference.get_bands(0.2)
+
+    def test_shared_audio_of_other_track_is_ignored(self, tmp_path: Path) -> None:
+        sid = tmp_path / "tune.sid"
+        sid.write_bytes(b"PSID")
+        decoded: list[Path] = []
+
+        def _decode(path: Path) -> tuple[bytes | None, int, int]:
+            decoded.append(path)
+            return None, 0, 0
+
+        analyzer = SpectrumAnalyzer(use_numpy=False)
+        analyzer._decode_to_pcm = _decode  # type: ignore[method-assign]
+        analyzer.load(sid, subtune=2, shared=DecodedAudio(sid, 1, 2, 44100, lambda start: iter(())))
+        assert decoded == [sid]
+
+
+class TestMixdown:
+    def _reference(self, pcm: array.array[int]) -> array.array[int]:
+        return array.array("h", ((pcm[j] + pcm[j + 1]) // 2 for j in range(0, len(pcm) - 1, 2)))
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_matches_per_sample_loop(self, monkeypatch: pytest.MonkeyPatch, use_numpy: bool) -> None:
+        """Vektorisierte Mischung ist bit-identisch zu (l + r) // 2."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        monkeypatch.setattr(spectrum, "_HAS_NUMPY", use_numpy)
+        pcm = array.array("h", ((i * 7919) % 65536 - 32768 for i in range(10001)))
+        assert _mix_to_mono(pcm.tobytes(), 2) == self._reference(pcm)
+        assert _mix_to_mono(memoryview(pcm), 2) == self._reference(pcm)
+
+    def test_mono_passthrough(self) -> None:
+        pcm = array.array("h", [1, -2, 3])
+        assert _mix_to_mono(pcm, 1) is pcm
+        assert _mix_to_mono(pcm.tobytes(), 1) == pcm
+
+    def test_load_pcm_from_buffer(self) -> None:
+        """load_pcm nimmt beliebige Puffer (hier memoryview) ohne Decoder an."""
+        stereo = array.array("h")
+        for sample in _sine_pcm(440.0, seconds=0.2):
+            stereo.extend((sample, sample))
+        analyzer = SpectrumAnalyzer(use_numpy=False)
+        analyzer.load_pcm(memoryview(stereo), 44100, 2, precompute=False)
+        assert analyzer.is_ready
+        assert len(analyzer._pcm or []) == len(stereo) // 2
+        assert len(analyzer.get_bands(0.1)) == NUM_BANDS
+
+    def test_load_pcm_builds_stereo_levels(self) -> None:
+        """Pegel werden vor der Mono-Mischung pro Kanal erfasst."""
+        stereo = array.array("h")
+        for sample in _sine_pcm(440.0, seconds=0.5):
+            stereo.extend((sample, 0))
+        analyzer = SpectrumAnalyzer(use_numpy=False)
+        analyzer.load_pcm(stereo, 44100, 2, precompute=False)
+        left, right = analyzer.get_levels(0.25)
+        amplitude = 12000 / 32768
+        assert left.rms == pytest.approx(amplitude / math.sqrt(2), rel=0.01)
+        assert left.peak == pytest.approx(amplitude, rel=0.01)
+        assert right == (0.0, 0.0)
+
+
+class TestResolution:
+    def _analyzer(self, **kwargs: object) -> SpectrumAnalyzer:
+        analyzer = SpectrumAnalyzer(use_numpy=False, **kwargs)  # type: ignore[arg-type]
+        analyzer._pcm = _sine_pcm(1000.0, seconds=0.5)
+        analyzer._ready = True
+        return analyzer
+
+    @pytest.mark.parametrize("bands,fft_size", [(8, 512), (64, 1024), (128, 2048)])
+    def test_band_bins_per_layout(self, bands: int, fft_size: int) -> None:
+        bins = SpectrumAnalyzer._compute_band_bins(48000, bands, fft_size)
+        assert len(bins) == bands
+        assert all(1 <= lo <= hi < fft_size // 2 for lo, hi in bins)
+        assert [lo for lo, _ in bins] == sorted(lo for lo, _ in bins)
+
+    def test_layouts_are_cached(self) -> None:
+        analyzer = self._analyzer()
+        assert analyzer._layout(64, 1024) is analyzer._layout(64, 1024)
+        assert analyzer._layout(64, 1024) is not analyzer._layout(64, 2048)
+
+    @pytest.mark.parametrize("bands", [8, 64, 128])
+    def test_live_bands_match_requested_count(self, bands: int) -> None:
+        """Live-FFT liefert genau die angefragte Bandzahl, Peak beim Sinus."""
+        analyzer = self._analyzer()
+        values = analyzer.get_bands(0.25, bands)
+        assert len(values) == bands
+        assert max(values) > 0.2
+
+    def test_timeline_is_resampled(self) -> None:
+        analyzer = self._analyzer()
+        analyzer._build_timeline(analyzer._generation)
+        assert analyzer.has_timeline
+        assert analyzer.get_bands(0.2, NUM_BANDS) == analyzer.get_bands(0.2)
+        assert len(analyzer.get_bands(0.2, 100)) == 100
+
+    def test_more_bands_than_timeline_use_live_fft(self) -> None:
+        """Ueber NUM_BANDS hinaus echte Aufloesung statt interpolierter Timeline."""
+        analyzer = self._analyzer()
+        live = analyzer.get_bands(0.25, 128)
+        analyzer._build_timeline(analyzer._generation)
+        assert analyzer.has_timeline
+        assert analyzer.get_bands(0.25, 128) == live
+        # Ohne PCM (Timeline aus dem Cache) bleibt nur die Interpolation
+        analyzer._pcm = None
+        assert analyzer.get_bands(0.25, 128) == _resample_bands(analyzer.get_bands(0.25), 128)
+
+    def test_fixed_fft_size_without_budget(self) -> None:
+        assert SpectrumAnalyzer().fft_size == FFT_SIZE
+
+    def test_budget_picks_fft_size(self) -> None:
+        """Grosszuegiges Budget -> groesste FFT, kein Budget -> kleinste."""
+        assert self._analyzer(latency_budget_ms=1000.0).fft_size == FFT_SIZES[-1]
+        small = self._analyzer(latency_budget_ms=0.0)
+        assert small.fft_size == FFT_SIZES[0]
+        assert len(small.get_bands(0.25, 48)) == 48
+
+
+class TestResampleBands:
+    def test_identity(self) -> None:
+        values = [0.1, 0.5, 0.9]
+        assert _resample_bands(values, 3) == values
+
+    def test_linear_interpolation(self) -> None:
+        assert _resample_bands([0.0, 1.0], 5) == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    def test_downsample_keeps_endpoints(self) -> None:
+        values = [i / 31 for i in range(32)]
+        resampled = _resample_bands(values, 8)
+        assert len(resampled) == 8
+        assert resampled[0] == 0.0
+        assert resampled[-1] == pytest.approx(1.0)
@@ -0,0 +1,124 @@
+"""Tests fuer die Wellenform-Uebersicht (Streaming-Min/Max + Cache)."""
+from __future__ import annotations
+
+import array
+import math
+import wave
+from pathlib import Path
+
+import pytest
+
+from retro_amp.infrastructure import waveform as waveform_module
+from retro_amp.infrastructure.disk_cache import DiskCache
+from retro_amp.infrastructure.spectrum import SpectrumAnalyzer
+from retro_amp.infrastructure.waveform import WaveformAnalyzer, _WaveformBuilder
+
+
+def _write_wav(path: Path, seconds: float = 1.0) -> None:
+    """Mono-WAV: erste Haelfte leise, zweite Haelfte laut."""
+    n = int(seconds * 44100)
+    pcm = array.array(
+        "h",
+        (
+            int((2000 if i < n // 2 else 24000) * math.sin(2 * math.pi * 220 * i / 44100))
+            for i in range(n)
+        ),
+    )
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(44100)
+        wf.writeframes(pcm.tobytes())
+
+
+class TestWaveformBuilder:
+    def test_min_max_per_column(self) -> None:
+        builder = _WaveformBuilder()
+        pcm = array.array("h", [0] * 4096)
+        pcm[100] = -16384
+        pcm[3000] = 16384
+        for offset in range(0, len(pcm), 777):
+            builder.feed(pcm[offset:offset + 777])
+        columns = builder.finish(4)
+        assert columns[0] == (-0.5, 0.0)
+        assert columns[1] == (0.0, 0.0)
+        assert columns[2] == (0.0, 0.5)
+        assert len(columns) == 4
+
+    def test_more_columns_than_blocks(self) -> None:
+        builder = _WaveformBuilder()
+        builder.feed(array.array("h", [8192] * 100))
+        assert builder.finish(8) == [(0.25, 0.25)] * 8
+
+    def test_empty(self) -> None:
+        assert _WaveformBuilder().finish(16) == []
+
+
+class TestWaveformAnalyzer:
+    def test_compute_from_wav(self, tmp_path: Path) -> None:
+        pytest.importorskip("miniaudio")
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav)
+        columns = WaveformAnalyzer(columns=64).compute(wav)
+        assert columns is not None
+        assert len(columns) == 64
+        quiet = max(hi for _, hi in columns[:30])
+        loud = min(hi for _, hi in columns[34:-1])
+        assert quiet < 0.1 < 0.6 < loud
+
+    def test_cache_hit_skips_decode(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("miniaudio")
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav)
+        cache = DiskCache("waveform", cache_dir=tmp_path / "cache")
+        first = WaveformAnalyzer(cache=cache, columns=32).compute(wav)
+        assert first is not None
+
+        def _no_decode(path: Path) -> None:
+            raise AssertionError("Cache-Treffer darf nicht dekodieren")
+
+        monkeypatch.setattr(waveform_module, "pcm_stream_source", _no_decode)
+        second = WaveformAnalyzer(cache=cache, columns=32).compute(wav)
+        assert second is not None
+        for (lo1, hi1), (lo2, hi2) in zip(first, second):
+            assert lo2 == pytest.approx(lo1, abs=1 / 127)
+            assert hi2 == pytest.approx(hi1, abs=1 / 127)
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        sid = tmp_path / "tune.sid"
+        sid.write_bytes(b"PSID")
+        assert WaveformAnalyzer().compute(sid) is None
+
+    def test_should_stop_aborts(self, tmp_path: Path) -> None:
+        pytest.importorskip("miniaudio")
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav)
+        assert WaveformAnalyzer().compute(wav, should_stop=lambda: True) is None
+
+
+class TestSpectrumSink:
+    def test_collector_fed_by_analysis_pass(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("miniaudio")
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav)
+        expected = WaveformAnalyzer(columns=64).compute(wav)
+        cache = DiskCache("waveform", cache_dir=tmp_path / "cache")
+        waveforms = WaveformAnalyzer(cache=cache, columns=64)
+        collector = waveforms.collector(wav)
+
+        def _no_decode(path: Path) -> None:
+            raise AssertionError("Wellenform darf nicht separat dekodieren")
+
+        monkeypatch.setattr(waveform_module, "pcm_stream_source", _no_decode)
+        SpectrumAnalyzer(use_numpy=False).load(wav, precompute=False, sink=collector)
+        assert collector.result == expected
+        assert waveforms.cached(wav) is not None
+
+    def test_timeline_cache_hit_leaves_collector_empty(self, tmp_path: Path) -> None:
+        wav = tmp_path / "tone.wav"
+        _write_wav(wav)
+        cache = DiskCache("spectrum", cache_dir=tmp_path / "spectrum")
+        SpectrumAnalyzer(use_numpy=False, cache=cache).load(wav, precompute=True)
+        collector = WaveformAnalyzer(columns=64).collector(wav)
+        SpectrumAnalyzer(use_numpy=False, cache=cache).load(wav, precompute=True, sink=collector)
+        assert collector.result is None